@@ -12,6 +12,8 @@ from typing import Any, Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from geoalchemy2 import Geometry
+from sqlalchemy.dialects import postgresql
 
 revision: str = "002"
 down_revision: Union[str, None] = "001"
@@ -28,6 +30,9 @@ _SEED_FILES = [
 
 _SEED_USER_EMAILS = ("admin@example.com",)
 
+# Rows per multi-row object INSERT (asyncpg allows at most 32767 bind parameters per statement)
+_OBJECT_INSERT_CHUNK = 1000
+
 meta = sa.MetaData()
 
 user_table = sa.Table(
@@ -66,6 +71,44 @@ function_type_table = sa.Table(
     sa.Column("updated_by", sa.Integer, nullable=True),
 )
 
+object_table = sa.Table(
+    "object",
+    meta,
+    sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+    sa.Column("object_type_id", sa.Integer, nullable=False),
+    sa.Column("function_type_id", sa.Integer, nullable=True),
+    sa.Column(
+        "geometry",
+        Geometry(geometry_type="GEOMETRY", srid=4326, spatial_index=False),
+        nullable=False,
+    ),
+    sa.Column("object_id", sa.String(64), nullable=True),
+    sa.Column("parcel_id", sa.String(64), nullable=True),
+    sa.Column("name", sa.String(512), nullable=True),
+    sa.Column("administrative_region", sa.String(256), nullable=True),
+    sa.Column("district", sa.String(256), nullable=True),
+    sa.Column("mahalla", sa.String(256), nullable=True),
+    sa.Column("address_full", sa.Text, nullable=True),
+    sa.Column("capacity_people_max", sa.Integer, nullable=True),
+    sa.Column("student_capacity", sa.Integer, nullable=True),
+    sa.Column("bed_count", sa.Integer, nullable=True),
+    sa.Column("unit_count", sa.Integer, nullable=True),
+    sa.Column("distance_public_transport_m", sa.Integer, nullable=True),
+    sa.Column("distance_primary_road_m", sa.Integer, nullable=True),
+    sa.Column("parking_spaces_total", sa.Integer, nullable=True),
+    sa.Column("protected_zone", sa.Boolean, nullable=True),
+    sa.Column("heritage_zone", sa.Boolean, nullable=True),
+    sa.Column("flood_zone", sa.Boolean, nullable=True),
+    sa.Column("environmental_risk_score", sa.Float, nullable=True),
+    sa.Column("power_connected", sa.Boolean, nullable=True),
+    sa.Column("available_power_capacity_kw", sa.Integer, nullable=True),
+    sa.Column("water_connected", sa.Boolean, nullable=True),
+    sa.Column("sewer_connected", sa.Boolean, nullable=True),
+    sa.Column("data_source_reference", sa.Text, nullable=True),
+    sa.Column("created_by", sa.Integer, nullable=True),
+    sa.Column("updated_by", sa.Integer, nullable=True),
+)
+
 
 def _load_seed_data() -> dict[str, Any] | None:
     if not _SEED_DATA_DIR.is_dir():
@@ -109,64 +152,59 @@ def ensure_user(
     return row
 
 
-def seed_object_types_from_data(
-    conn: sa.Connection, data: dict[str, Any], created_by: int | None
+def _seed_codes(
+    conn: sa.Connection,
+    table: sa.Table,
+    rows: Sequence[dict[str, Any]],
+    created_by: int | None,
 ) -> dict[str, int]:
-    rows = data.get("object_types") or []
-    code_to_id: dict[str, int] = {}
+    """Insert all (code, name) rows in one statement; return code -> id for new and existing codes."""
+    values: dict[str, dict[str, Any]] = {}
     for item in rows:
         code = (item.get("code") or "").strip()
-        name = item.get("name")
-        if not code:
-            continue
-        existing = conn.execute(
-            sa.select(object_type_table.c.id).where(object_type_table.c.code == code)
-        ).first()
-        if existing is not None:
-            code_to_id[code] = existing[0]
-            continue
-        conn.execute(
-            object_type_table.insert().values(
-                code=code, name=name, created_by=created_by, updated_by=created_by
+        if code and code not in values:
+            values[code] = {
+                "code": code,
+                "name": item.get("name"),
+                "created_by": created_by,
+                "updated_by": created_by,
+            }
+    if not values:
+        return {}
+    code_to_id: dict[str, int] = {
+        code: id_
+        for id_, code in conn.execute(
+            postgresql.insert(table)
+            .values(list(values.values()))
+            .on_conflict_do_nothing(index_elements=["code"])
+            .returning(table.c.id, table.c.code)
+        )
+    }
+    existing = [code for code in values if code not in code_to_id]
+    if existing:
+        code_to_id.update(
+            (code, id_)
+            for id_, code in conn.execute(
+                sa.select(table.c.id, table.c.code).where(table.c.code.in_(existing))
             )
         )
-        r = conn.execute(
-            sa.select(object_type_table.c.id).where(object_type_table.c.code == code)
-        ).scalar_one()
-        code_to_id[code] = r
     return code_to_id
 
 
+def seed_object_types_from_data(
+    conn: sa.Connection, data: dict[str, Any], created_by: int | None
+) -> dict[str, int]:
+    return _seed_codes(
+        conn, object_type_table, data.get("object_types") or [], created_by
+    )
+
+
 def seed_function_types_from_data(
     conn: sa.Connection, data: dict[str, Any], created_by: int | None
 ) -> dict[str, int]:
-    rows = data.get("function_types") or []
-    code_to_id: dict[str, int] = {}
-    for item in rows:
-        code = (item.get("code") or "").strip()
-        name = item.get("name")
-        if not code:
-            continue
-        existing = conn.execute(
-            sa.select(function_type_table.c.id).where(
-                function_type_table.c.code == code
-            )
-        ).first()
-        if existing is not None:
-            code_to_id[code] = existing[0]
-            continue
-        conn.execute(
-            function_type_table.insert().values(
-                code=code, name=name, created_by=created_by, updated_by=created_by
-            )
-        )
-        r = conn.execute(
-            sa.select(function_type_table.c.id).where(
-                function_type_table.c.code == code
-            )
-        ).scalar_one()
-        code_to_id[code] = r
-    return code_to_id
+    return _seed_codes(
+        conn, function_type_table, data.get("function_types") or [], created_by
+    )
 
 
 def _nullable_int(val: Any) -> int | None:
@@ -205,6 +243,61 @@ def _nullable_bool(val: Any) -> bool | None:
     return None
 
 
+def _object_row(
+    obj: dict[str, Any],
+    type_ids: dict[str, int],
+    function_type_ids: dict[str, int],
+    created_by: int | None,
+) -> dict[str, Any] | None:
+    code = obj.get("object_type_code") or "other"
+    otid = type_ids.get(code) or type_ids.get("other")
+    if not otid:
+        return None
+    ft_code = (obj.get("function_type_code") or "").strip() or None
+    ftid = function_type_ids.get(ft_code) if ft_code else None
+    geom = obj.get("geometry")
+    if not geom or geom.get("type") != "Point":
+        return None
+    return {
+        "object_type_id": otid,
+        "function_type_id": ftid,
+        "geometry": sa.func.ST_GeomFromGeoJSON(json.dumps(geom)),
+        "object_id": (obj.get("object_id") or "").strip() or None,
+        "parcel_id": (obj.get("parcel_id") or "").strip() or None,
+        "name": (obj.get("name") or "").strip() or "Object",
+        "administrative_region": (obj.get("administrative_region") or "").strip()
+        or None,
+        "district": (obj.get("district") or "").strip() or None,
+        "mahalla": (obj.get("mahalla") or "").strip() or None,
+        "address_full": (obj.get("address_full") or "").strip() or None,
+        "capacity_people_max": _nullable_int(obj.get("capacity_people_max")),
+        "student_capacity": _nullable_int(obj.get("student_capacity")),
+        "bed_count": _nullable_int(obj.get("bed_count")),
+        "unit_count": _nullable_int(obj.get("unit_count")),
+        "distance_public_transport_m": _nullable_int(
+            obj.get("distance_public_transport_m")
+        ),
+        "distance_primary_road_m": _nullable_int(obj.get("distance_primary_road_m")),
+        "parking_spaces_total": _nullable_int(obj.get("parking_spaces_total")),
+        "protected_zone": _nullable_bool(obj.get("protected_zone")),
+        "heritage_zone": _nullable_bool(obj.get("heritage_zone")),
+        "flood_zone": _nullable_bool(obj.get("flood_zone")),
+        "environmental_risk_score": _nullable_float(
+            obj.get("environmental_risk_score")
+        ),
+        "power_connected": _nullable_bool(obj.get("power_connected")),
+        "available_power_capacity_kw": _nullable_int(
+            obj.get("available_power_capacity_kw")
+        ),
+        "water_connected": _nullable_bool(obj.get("water_connected")),
+        "sewer_connected": _nullable_bool(obj.get("sewer_connected")),
+        "data_source_reference": (obj.get("data_source_reference") or "").strip()
+        or None,
+        "created_by": created_by,
+        "updated_by": created_by,
+    }
+
+
 def seed_objects_from_data(
     conn: sa.Connection,
     data: dict[str, Any],
@@ -212,112 +305,45 @@ def seed_objects_from_data(
     function_type_ids: dict[str, int],
     created_by: int | None,
 ) -> None:
+    """Multi-row INSERTs of _OBJECT_INSERT_CHUNK rows; the GIST index is built once afterwards."""
     (cnt,) = conn.execute(sa.text('SELECT COUNT(*) FROM "object"')).fetchone()
     if cnt > 0:
         return
-    objects_data = data.get("object_geometries") or []
-    for obj in objects_data:
-        code = obj.get("object_type_code") or "other"
-        otid = type_ids.get(code) or type_ids.get("other")
-        if not otid:
-            continue
-        ft_code = (obj.get("function_type_code") or "").strip() or None
-        ftid = function_type_ids.get(ft_code) if ft_code else None
-        geom = obj.get("geometry")
-        if not geom or geom.get("type") != "Point":
-            continue
-        name = (obj.get("name") or "").strip() or "Object"
+    rows = [
+        row
+        for obj in data.get("object_geometries") or []
+        if (row := _object_row(obj, type_ids, function_type_ids, created_by))
+        is not None
+    ]
+    if not rows:
+        return
+    conn.execute(sa.text("DROP INDEX IF EXISTS ix_object_geometry"))
+    for start in range(0, len(rows), _OBJECT_INSERT_CHUNK):
         conn.execute(
-            sa.text(
-                """
-                INSERT INTO "object" (
-                    object_type_id, function_type_id, geometry,
-                    object_id, parcel_id, name, administrative_region, district, mahalla,
-                    address_full, capacity_people_max, student_capacity, bed_count, unit_count,
-                    distance_public_transport_m, distance_primary_road_m, parking_spaces_total,
-                    protected_zone, heritage_zone, flood_zone, environmental_risk_score,
-                    power_connected, available_power_capacity_kw, water_connected, sewer_connected,
-                    data_source_reference,
-                    created_by, updated_by
-                )
-                VALUES (
-                    :otid, :ftid, ST_GeomFromGeoJSON(:geom),
-                    :object_id, :parcel_id, :name, :administrative_region, :district, :mahalla,
-                    :address_full, :capacity_people_max, :student_capacity, :bed_count, :unit_count,
-                    :distance_public_transport_m, :distance_primary_road_m, :parking_spaces_total,
-                    :protected_zone, :heritage_zone, :flood_zone, :environmental_risk_score,
-                    :power_connected, :available_power_capacity_kw, :water_connected, :sewer_connected,
-                    :data_source_reference,
-                    :created_by, :updated_by
-                )
-                """
-            ),
-            {
-                "otid": otid,
-                "ftid": ftid,
-                "geom": json.dumps(geom),
-                "object_id": (obj.get("object_id") or "").strip() or None,
-                "parcel_id": (obj.get("parcel_id") or "").strip() or None,
-                "name": name,
-                "administrative_region": (
-                    obj.get("administrative_region") or ""
-                ).strip()
-                or None,
-                "district": (obj.get("district") or "").strip() or None,
-                "mahalla": (obj.get("mahalla") or "").strip() or None,
-                "address_full": (obj.get("address_full") or "").strip() or None,
-                "capacity_people_max": _nullable_int(obj.get("capacity_people_max")),
-                "student_capacity": _nullable_int(obj.get("student_capacity")),
-                "bed_count": _nullable_int(obj.get("bed_count")),
-                "unit_count": _nullable_int(obj.get("unit_count")),
-                "distance_public_transport_m": _nullable_int(
-                    obj.get("distance_public_transport_m")
-                ),
-                "distance_primary_road_m": _nullable_int(
-                    obj.get("distance_primary_road_m")
-                ),
-                "parking_spaces_total": _nullable_int(obj.get("parking_spaces_total")),
-                "protected_zone": _nullable_bool(obj.get("protected_zone")),
-                "heritage_zone": _nullable_bool(obj.get("heritage_zone")),
-                "flood_zone": _nullable_bool(obj.get("flood_zone")),
-                "environmental_risk_score": _nullable_float(
-                    obj.get("environmental_risk_score")
-                ),
-                "power_connected": _nullable_bool(obj.get("power_connected")),
-                "available_power_capacity_kw": _nullable_int(
-                    obj.get("available_power_capacity_kw")
-                ),
-                "water_connected": _nullable_bool(obj.get("water_connected")),
-                "sewer_connected": _nullable_bool(obj.get("sewer_connected")),
-                "data_source_reference": (
-                    obj.get("data_source_reference") or ""
-                ).strip()
-                or None,
-                "created_by": created_by,
-                "updated_by": created_by,
-            },
+            object_table.insert().values(rows[start : start + _OBJECT_INSERT_CHUNK])
         )
+    conn.execute(
+        sa.text("CREATE INDEX ix_object_geometry ON object USING GIST (geometry)")
+    )
+    conn.execute(sa.text('ANALYZE "object"'))
 
 
 def unseed_objects_by_names(conn: sa.Connection, names: Sequence[str]) -> None:
-    for name in names:
-        conn.execute(
-            sa.text('DELETE FROM "object" WHERE name = :name'),
-            {"name": name},
-        )
+    if names:
+        conn.execute(sa.delete(object_table).where(object_table.c.name.in_(names)))
 
 
 def unseed_function_types_by_codes(conn: sa.Connection, codes: Sequence[str]) -> None:
-    for code in codes:
+    if codes:
         conn.execute(
-            sa.delete(function_type_table).where(function_type_table.c.code == code)
+            sa.delete(function_type_table).where(function_type_table.c.code.in_(codes))
         )
 
 
 def unseed_object_types_by_codes(conn: sa.Connection, codes: Sequence[str]) -> None:
-    for code in codes:
+    if codes:
         conn.execute(
-            sa.delete(object_type_table).where(object_type_table.c.code == code)
+            sa.delete(object_type_table).where(object_type_table.c.code.in_(codes))
         )
 
 
@@ -0,0 +1,26 @@
+"""Add (updated_at, id) index on object for keyset pagination.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-03-01
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_object_updated_at_id", "object", ["updated_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_object_updated_at_id", table_name="object")
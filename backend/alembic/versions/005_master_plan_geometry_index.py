@@ -0,0 +1,26 @@
+"""Add GIST index on master_plan.geometry (vector tiles, spatial lookups).
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-03-01
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_master_plan_geometry ON master_plan USING GIST (geometry)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_master_plan_geometry")
@@ -0,0 +1,52 @@
+"""Add master_plan_object membership table and backfill it from ST_Within.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-03-05
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "master_plan_object",
+        sa.Column("master_plan_id", sa.Integer(), nullable=False),
+        sa.Column("object_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["master_plan_id"], ["master_plan.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["object_id"], ["object.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("master_plan_id", "object_id"),
+    )
+    op.create_index(
+        op.f("ix_master_plan_object_object_id"),
+        "master_plan_object",
+        ["object_id"],
+        unique=False,
+    )
+    op.execute(
+        """
+        INSERT INTO master_plan_object (master_plan_id, object_id)
+        SELECT mp.id, o.id
+        FROM master_plan mp
+        JOIN "object" o ON ST_Within(o.geometry, mp.geometry)
+        WHERE mp.geometry IS NOT NULL AND o.geometry IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_master_plan_object_object_id"), table_name="master_plan_object"
+    )
+    op.drop_table("master_plan_object")
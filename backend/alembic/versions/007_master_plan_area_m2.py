@@ -0,0 +1,29 @@
+"""Store master_plan.area_m2 (geodesic area) instead of computing ST_Area on every read.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-03-05
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("master_plan", sa.Column("area_m2", sa.Float(), nullable=True))
+    op.execute(
+        "UPDATE master_plan SET area_m2 = ST_Area(geometry::geography) "
+        "WHERE geometry IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("master_plan", "area_m2")
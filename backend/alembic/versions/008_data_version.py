@@ -0,0 +1,39 @@
+"""Per-table data versions for ETag / Last-Modified on list endpoints.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-03-06
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "data_version",
+        sa.Column("table_name", sa.String(64), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.execute(
+        "INSERT INTO data_version (table_name) "
+        "VALUES ('object'), ('object_type'), ('function_type'), ('master_plan')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("data_version")
@@ -0,0 +1,50 @@
+"""Add ai_report_cache: development reports keyed by a hash of plan, objects, prompt and model.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-03-07
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_report_cache",
+        sa.Column("cache_key", sa.String(64), primary_key=True),
+        sa.Column("master_plan_id", sa.Integer(), nullable=False),
+        sa.Column("model", sa.String(256), nullable=False),
+        sa.Column("report", JSONB, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(
+            ["master_plan_id"], ["master_plan.id"], ondelete="CASCADE"
+        ),
+    )
+    op.create_index(
+        op.f("ix_ai_report_cache_master_plan_id"),
+        "ai_report_cache",
+        ["master_plan_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_ai_report_cache_master_plan_id"), table_name="ai_report_cache"
+    )
+    op.drop_table("ai_report_cache")
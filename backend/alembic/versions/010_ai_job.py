@@ -0,0 +1,56 @@
+"""Add ai_job queue table for background report generation.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-03-08
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_job",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("kind", sa.String(32), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("progress", sa.String(32), nullable=False),
+        sa.Column("master_plan_id", sa.Integer(), nullable=False),
+        sa.Column("params", JSONB, nullable=False),
+        sa.Column("result", JSONB, nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["master_plan_id"], ["master_plan.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["created_by"], ["user.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_ai_job_status"), "ai_job", ["status"], unique=False)
+    op.create_index(
+        op.f("ix_ai_job_master_plan_id"), "ai_job", ["master_plan_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_ai_job_master_plan_id"), table_name="ai_job")
+    op.drop_index(op.f("ix_ai_job_status"), table_name="ai_job")
+    op.drop_table("ai_job")
@@ -0,0 +1,50 @@
+"""Keep one ai_report_cache row per plan and assumptions.
+
+Existing rows are dropped (it is a cache; keys now also cover the report engine version).
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-03-09
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM ai_report_cache")
+    op.add_column(
+        "ai_report_cache",
+        sa.Column("assumptions_key", sa.String(64), nullable=False),
+    )
+    op.drop_index(
+        op.f("ix_ai_report_cache_master_plan_id"), table_name="ai_report_cache"
+    )
+    op.create_unique_constraint(
+        "uq_ai_report_cache_master_plan_id_assumptions_key",
+        "ai_report_cache",
+        ["master_plan_id", "assumptions_key"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_ai_report_cache_master_plan_id_assumptions_key",
+        "ai_report_cache",
+        type_="unique",
+    )
+    op.create_index(
+        op.f("ix_ai_report_cache_master_plan_id"),
+        "ai_report_cache",
+        ["master_plan_id"],
+        unique=False,
+    )
+    op.drop_column("ai_report_cache", "assumptions_key")
@@ -2,36 +2,147 @@
 
 from app.constants.messages import (
     ERROR_MESSAGE_AI_CHAT_NOT_CONFIGURED,
+    ERROR_MESSAGE_AI_CHAT_STREAM_FAILED,
+    ERROR_MESSAGE_AI_JOB_FAILED,
+    ERROR_MESSAGE_AI_JOB_NOT_FOUND,
+    ERROR_MESSAGE_AI_JOB_TIMEOUT,
     ERROR_MESSAGE_AI_NOT_CONFIGURED,
+    ERROR_MESSAGE_BATCH_DUPLICATE_ID,
+    ERROR_MESSAGE_BBOX_FORMAT,
+    ERROR_MESSAGE_BBOX_RANGE,
     ERROR_MESSAGE_EMAIL_ALREADY_REGISTERED,
     ERROR_MESSAGE_FILE_NOT_FOUND,
     ERROR_MESSAGE_GEOMETRY_COORDS_LNG_LAT,
     ERROR_MESSAGE_GEOMETRY_COORDS_NUMBERS,
     ERROR_MESSAGE_GEOMETRY_TYPE_POINT,
+    ERROR_MESSAGE_IMPORT_DUPLICATE_OBJECT_ID,
+    ERROR_MESSAGE_IMPORT_FORMAT,
+    ERROR_MESSAGE_IMPORT_GEOJSON,
+    ERROR_MESSAGE_IMPORT_UNREADABLE,
+    ERROR_MESSAGE_IMPORT_VALUE,
     ERROR_MESSAGE_INCORRECT_EMAIL_OR_PASSWORD,
+    ERROR_MESSAGE_INVALID_CURSOR,
     ERROR_MESSAGE_MASTER_PLAN_NOT_FOUND,
     ERROR_MESSAGE_NO_RESPONSE_FROM_MODEL,
     ERROR_MESSAGE_NOT_AUTHENTICATED,
     ERROR_MESSAGE_OBJECT_NOT_FOUND,
     ERROR_MESSAGE_PROJECT_NOT_FOUND,
+    ERROR_MESSAGE_TILE_OUT_OF_RANGE,
+    ERROR_MESSAGE_UNKNOWN_FIELDS,
 )
 
 # Max objects to include in AI context to avoid token overflow
 MAX_OBJECTS_IN_AI_CONTEXT = 500
 
+# Upper bound for ?limit= on paginated object lists
+MAX_OBJECT_PAGE_SIZE = 5000
+
+# Max operations in one POST /object/batch request
+MAX_OBJECT_BATCH_SIZE = 1000
+
+# Idle AI job workers re-check the ai_job table this often (jobs are also signalled in process)
+AI_JOB_POLL_SECONDS = 5
+
+# Development report: candidate sites sent to the model per service type that needs projects
+REPORT_CANDIDATES_PER_SERVICE = 10
+# Part of the report cache key: bump whenever report_needs_service / report_candidate_service
+# logic changes, so reports computed by the old rules are regenerated
+REPORT_ENGINE_VERSION = 1
+# Hard cap per service type (3 sites per needed project, e.g. a large green gap, stops here)
+REPORT_CANDIDATES_MAX_PER_SERVICE = 30
+
+# Rows per COPY batch sent to the staging table by POST /object/import
+IMPORT_COPY_BATCH_SIZE = 10000
+
+# Rows per server-side cursor batch (and Arrow record batch) in GET /object/export
+EXPORT_BATCH_SIZE = 10000
+
+# Cached plan baselines (GET /master_plan/{id}/baseline), keyed by plan and data versions
+BASELINE_CACHE_SIZE = 256
+
+# Cached AI chat context strings, keyed by plan, selected object ids and data versions
+CHAT_CONTEXT_CACHE_SIZE = 128
+CHAT_CONTEXT_CACHE_TTL_SECONDS = 600
+
+# Response header carrying the keyset cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Mapbox Vector Tiles: zoom range, tile extent and clip buffer (tile units)
+MAX_TILE_ZOOM = 22
+MVT_EXTENT = 4096
+MVT_BUFFER = 64
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+# Server-side clustering: grid cells per 256px tile width (i.e. ~64px cells)
+CLUSTER_GRID_CELLS_PER_TILE = 4
+
+# Nearest-neighbour search: max k, and how many <-> (planar) candidates to re-rank geodesically
+MAX_NEAREST_K = 100
+NEAREST_CANDIDATE_FACTOR = 4
+
+# In-process object_type / function_type cache: seconds between data version checks
+LOOKUP_CACHE_TTL_SECONDS = 30
+
+# Streaming list exports (selected via Accept header) and server-side cursor batch size
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+GEOJSON_MEDIA_TYPE = "application/geo+json"
+STREAM_BATCH_SIZE = 500
+
+# AI chat token streaming (POST /ai/chat/stream)
+SSE_MEDIA_TYPE = "text/event-stream"
+
 __all__ = [
+    "AI_JOB_POLL_SECONDS",
+    "BASELINE_CACHE_SIZE",
+    "CHAT_CONTEXT_CACHE_SIZE",
+    "CHAT_CONTEXT_CACHE_TTL_SECONDS",
+    "CLUSTER_GRID_CELLS_PER_TILE",
     "ERROR_MESSAGE_AI_CHAT_NOT_CONFIGURED",
+    "ERROR_MESSAGE_AI_CHAT_STREAM_FAILED",
+    "ERROR_MESSAGE_AI_JOB_FAILED",
+    "ERROR_MESSAGE_AI_JOB_NOT_FOUND",
+    "ERROR_MESSAGE_AI_JOB_TIMEOUT",
     "ERROR_MESSAGE_AI_NOT_CONFIGURED",
+    "ERROR_MESSAGE_BATCH_DUPLICATE_ID",
+    "ERROR_MESSAGE_BBOX_FORMAT",
+    "ERROR_MESSAGE_BBOX_RANGE",
     "ERROR_MESSAGE_EMAIL_ALREADY_REGISTERED",
     "ERROR_MESSAGE_FILE_NOT_FOUND",
     "ERROR_MESSAGE_GEOMETRY_COORDS_LNG_LAT",
     "ERROR_MESSAGE_GEOMETRY_COORDS_NUMBERS",
     "ERROR_MESSAGE_GEOMETRY_TYPE_POINT",
+    "ERROR_MESSAGE_IMPORT_DUPLICATE_OBJECT_ID",
+    "ERROR_MESSAGE_IMPORT_FORMAT",
+    "ERROR_MESSAGE_IMPORT_GEOJSON",
+    "ERROR_MESSAGE_IMPORT_UNREADABLE",
+    "ERROR_MESSAGE_IMPORT_VALUE",
     "ERROR_MESSAGE_INCORRECT_EMAIL_OR_PASSWORD",
+    "ERROR_MESSAGE_INVALID_CURSOR",
     "ERROR_MESSAGE_MASTER_PLAN_NOT_FOUND",
     "ERROR_MESSAGE_NO_RESPONSE_FROM_MODEL",
     "ERROR_MESSAGE_NOT_AUTHENTICATED",
     "ERROR_MESSAGE_OBJECT_NOT_FOUND",
     "ERROR_MESSAGE_PROJECT_NOT_FOUND",
+    "ERROR_MESSAGE_TILE_OUT_OF_RANGE",
+    "ERROR_MESSAGE_UNKNOWN_FIELDS",
+    "EXPORT_BATCH_SIZE",
+    "GEOJSON_MEDIA_TYPE",
+    "IMPORT_COPY_BATCH_SIZE",
+    "LOOKUP_CACHE_TTL_SECONDS",
+    "MAX_NEAREST_K",
+    "MAX_OBJECT_BATCH_SIZE",
+    "MAX_OBJECT_PAGE_SIZE",
     "MAX_OBJECTS_IN_AI_CONTEXT",
+    "MAX_TILE_ZOOM",
+    "MVT_BUFFER",
+    "MVT_EXTENT",
+    "MVT_MEDIA_TYPE",
+    "NDJSON_MEDIA_TYPE",
+    "NEAREST_CANDIDATE_FACTOR",
+    "NEXT_CURSOR_HEADER",
+    "REPORT_CANDIDATES_MAX_PER_SERVICE",
+    "REPORT_CANDIDATES_PER_SERVICE",
+    "REPORT_ENGINE_VERSION",
+    "SSE_MEDIA_TYPE",
+    "STREAM_BATCH_SIZE",
 ]
@@ -19,6 +19,10 @@ ERROR_MESSAGE_AI_CHAT_NOT_CONFIGURED = (
     "AI chat is not configured. Set AI_API_KEY in .env to enable."
 )
 ERROR_MESSAGE_NO_RESPONSE_FROM_MODEL = "No response from the model."
+ERROR_MESSAGE_AI_CHAT_STREAM_FAILED = "The model response was interrupted."
+ERROR_MESSAGE_AI_JOB_NOT_FOUND = "AI job not found"
+ERROR_MESSAGE_AI_JOB_FAILED = "Report generation failed"
+ERROR_MESSAGE_AI_JOB_TIMEOUT = "Report generation timed out"
 
 # Geometry (object point)
 ERROR_MESSAGE_GEOMETRY_TYPE_POINT = "Object geometry must be type 'Point'"
@@ -26,3 +30,28 @@ ERROR_MESSAGE_GEOMETRY_COORDS_LNG_LAT = (
     "Point geometry must have coordinates [lng, lat]"
 )
 ERROR_MESSAGE_GEOMETRY_COORDS_NUMBERS = "Point coordinates must be numbers"
+
+# Query parameters (list filters, pagination)
+ERROR_MESSAGE_BBOX_FORMAT = "bbox must be four numbers: minx,miny,maxx,maxy"
+ERROR_MESSAGE_BBOX_RANGE = (
+    "bbox must satisfy -180 <= minx <= maxx <= 180 and -90 <= miny <= maxy <= 90"
+)
+ERROR_MESSAGE_INVALID_CURSOR = "Invalid pagination cursor"
+ERROR_MESSAGE_UNKNOWN_FIELDS = "Unknown or empty fields"
+ERROR_MESSAGE_TILE_OUT_OF_RANGE = "Tile coordinates are out of range for this zoom"
+
+# Batch writes
+ERROR_MESSAGE_BATCH_DUPLICATE_ID = (
+    "Batch operations must target each object id at most once"
+)
+
+# Bulk import
+ERROR_MESSAGE_IMPORT_FORMAT = (
+    "Import format must be 'csv' or 'geojson' (or inferable from the file name)"
+)
+ERROR_MESSAGE_IMPORT_GEOJSON = "Import file is not a GeoJSON FeatureCollection"
+ERROR_MESSAGE_IMPORT_UNREADABLE = "Import file could not be read: {error}"
+ERROR_MESSAGE_IMPORT_VALUE = (
+    "Import row {row}: {column} is too long or out of range for the column"
+)
+ERROR_MESSAGE_IMPORT_DUPLICATE_OBJECT_ID = "Import file repeats object_id {object_id!r}"
@@ -1,11 +1,11 @@
 """AI prompt text and report schema constants. Prompt-related logic lives in app.utils.prompt_utils or app.services."""
 
-# Analyst prompt template: {master_plan_context} and {list_of_objects} are replaced.
+# Analyst prompt template: {master_plan_context}, {list_of_objects} and {precomputed_needs} are replaced.
 DEVELOPMENT_REPORT_PROMPT = """РОЛЬ
 Ты — аналитик градостроительного программирования. Формируешь 15-летнюю программу развития территории: что нужно построить/расширить, в каких фазах и на каких объектах.
 
 ВХОД
-Тебе дают два параметра:
+Тебе дают параметры:
 
 Мастер план (контекст — id, название, площадь в м²; используй только объекты из этого плана):
 
@@ -13,7 +13,7 @@ DEVELOPMENT_REPORT_PROMPT = """РОЛЬ
 
 и
 
-Лист Объектов (все объекты, попадающие в границы этого мастер-плана):
+Лист Объектов (кандидаты для проектов из границ этого мастер-плана, заранее отобранные и ранжированные на сервере; у каждого есть accessibility_rank — 1 = лучшая доступность в плане, и candidate_for — для каких service_type объект кандидат, с готовыми eligibility и required_interventions):
 
 {list_of_objects}
 
@@ -22,7 +22,7 @@ DEVELOPMENT_REPORT_PROMPT = """РОЛЬ
 ОГРАНИЧЕНИЯ
 - Не создавай новые объекты и не изменяй координаты. Используй только входной список объектов.
 - Если каких-то данных не хватает, используй допущения (assumptions) и явно отмечай, что это допущения.
-- Все количественные выводы (сколько проектов) должны объясняться формулой/логикой и исходными полями.
+- Все количественные выводы (сколько проектов) берутся из готового расчёта ниже; обоснование выбора объектов — по исходным полям.
 
 ПОЛЯ ОБЪЕКТОВ, КОТОРЫЕ МОЖНО ИСПОЛЬЗОВАТЬ
 Используй только эти поля (если они есть у объекта):
@@ -35,66 +35,22 @@ DEVELOPMENT_REPORT_PROMPT = """РОЛЬ
 
 УПРОЩЁННАЯ БИЗНЕС-ЛОГИКА
 
-1) Инвентаризация (baseline)
-- Посчитай:
-  - objects_total = количество всех объектов
-  - housing_units_total = сумма unit_count по объектам жилья. Жильё: function_type начинается с "residential" или "housing" или содержит "residential"/"housing"; или object_type = "building" с функцией жилья. unit_count без значения считай 0.
-  - school_seats_total = сумма student_capacity по education_* (школы/лицеи/колледжи/университеты — отдельно можно выделить, но минимум: sum(student_capacity))
-  - kindergarten_seats_total = сумма student_capacity по education_kindergarten
-  - hospital_beds_total = сумма bed_count по health_hospital
-  - clinic_capacity_total = сумма capacity_people_max по health_clinic (если пусто — считать 0)
-  - parking_spaces_total = сумма parking_spaces_total по всем объектам
-  - green_objects_total = количество объектов с object_type=green_space (если нет площадей, используем count)
-
-2) Оценка населения (обязательно заполни population_estimated для расчёта потребностей)
-- Если housing_units_total > 0: pop_est = housing_units_total * avg_household_size (источник: жильё).
-- Иначе используй ОЦЕНКУ ПО МОЩНОСТЯМ (чтобы не оставлять needs и phases пустыми):
-  - если school_seats_total > 0: pop_est = round(school_seats_total / school_age_share) (оценка по школам);
-  - иначе если kindergarten_seats_total > 0: pop_est = round(kindergarten_seats_total / (kindergarten_age_share * kindergarten_coverage));
-  - иначе если clinic_capacity_total > 0: грубая оценка pop_est по клинике (например 2–3× clinic_capacity_total), укажи в questions;
-  - иначе pop_est = null и в questions обязательно попроси уточнить население или жилые единицы.
-- avg_household_size — допущение (по умолчанию 3.6).
-- В questions укажи, что население оценено по школам/детсадам/клинике, если не по жилью.
-
-3) Расчёт потребностей (needs) через допущения (если пользователь не дал нормы)
-Используй базовые допущения (их можно менять в assumptions):
-- school_age_share = 0.14  (доля школьного возраста от населения)
-- kindergarten_age_share = 0.07 (доля дошкольников)
-- kindergarten_coverage = 0.60 (целевое покрытие детсадом)
-- school_unit_capacity = 900 мест (типовой объект)
-- kindergarten_unit_capacity = 240 мест
-- parking_spaces_per_unit = 0.35 мест на 1 квартиру
-- parking_multilevel_capacity = 300 мест
-- env_risk_max = 0.60 (порог "желательно" для BUILD_NOW)
-- park_rule_people_per_green_object = 12000 (1 зелёный объект на N жителей, раз нет м²)
-
-Тогда (если pop_est != null — всегда считай required и gaps):
-- required_school_seats = pop_est * school_age_share
-- required_kindergarten_seats = pop_est * kindergarten_age_share * kindergarten_coverage
-- required_parking_spaces = housing_units_total * parking_spaces_per_unit (если housing_units_total = 0, используй pop_est/avg_household_size как оценку числа квартир для парковок)
-- required_green_objects = ceil(pop_est / park_rule_people_per_green_object)
-
-4) Дефициты (gap)
-- school_seats_gap = max(0, required_school_seats - school_seats_total)
-- kindergarten_seats_gap = max(0, required_kindergarten_seats - kindergarten_seats_total)
-- parking_spaces_gap = max(0, required_parking_spaces - parking_spaces_total)
-- green_objects_gap = max(0, required_green_objects - green_objects_total)
-
-5) Перевод дефицитов в количество проектов и ОБЯЗАТЕЛЬНОЕ заполнение phases
-- new_schools = ceil(school_seats_gap / school_unit_capacity)
-- new_kindergartens = ceil(kindergarten_seats_gap / kindergarten_unit_capacity)
-- new_parking_multilevel = ceil(parking_spaces_gap / parking_multilevel_capacity)
-- new_green_spaces = green_objects_gap  (так как считаем по объектам)
-- КРИТИЧНО: если какой-либо gap > 0 или есть потребность в клинике (см. ниже), ты ОБЯЗАН заполнить phases.projects конкретными проектами: у каждого проекта укажи project_id (PRJ-001, PRJ-002, ...), service_type, action, target_object_id (id из входного списка объектов), backup_object_ids, eligibility, why_this_object, required_interventions. Не оставляй phases с пустыми projects при наличии дефицитов.
-
-Про клинику (упрощённо):
-- Если clinic_capacity_total == 0 и pop_est != null и pop_est > 15000 → предложи 1 "амбулатория/поликлиника"
-- Если clinic_capacity_total > 0 → оставь 0, но можешь предложить "расширение" при высоком pop_est (как CONDITIONAL), если не хватает данных — добавь вопрос
+1–5) Инвентаризация, население, потребности, дефициты и количество проектов
+Эти шаги уже рассчитаны на сервере по формулам и допущениям (assumptions) и переданы тебе как готовый результат:
+
+{precomputed_needs}
+
+- Не пересчитывай эти числа: перенеси assumptions, baseline и needs_15y в ответ без изменений.
+- Количество проектов по каждому service_type бери из needs_15y.projects_summary[].new_projects.
+- КРИТИЧНО: если new_projects > 0 для какого-либо service_type, ты ОБЯЗАН заполнить phases.projects конкретными проектами (по одному на каждый новый проект): у каждого проекта укажи project_id (PRJ-001, PRJ-002, ...), service_type, action, target_object_id (id из входного списка объектов), backup_object_ids, eligibility, why_this_object, required_interventions. Не оставляй phases с пустыми projects при наличии дефицитов.
+- Если clinic_capacity_total > 0 и population_estimated высокое, можешь предложить расширение клиники (CONDITIONAL); если не хватает данных — добавь вопрос.
+- Вопросы из блока questions выше включи в свой questions.
 
 6) Выбор target_object_id (привязка проектов к объектам)
 Для каждого проекта выбери:
-- target_object_id (1 основной) + backup_object_ids (1–2)
-Правила пригодности:
+- target_object_id (1 основной) + backup_object_ids (1–2) только среди объектов, у которых candidate_for содержит service_type проекта
+- eligibility и required_interventions бери из candidate_for[service_type] без изменений; при равных условиях предпочитай меньший accessibility_rank
+Правила пригодности (уже применены на сервере, приведены для обоснования why_this_object):
 - REJECT для капитальных объектов (школа/детсад/клиника/парковка), если:
   protected_zone=Да OR heritage_zone=Да OR flood_zone=Да
 - BUILD_NOW если:
@@ -0,0 +1,51 @@
+"""Application-wide AsyncOpenAI client: one keep-alive connection pool to AI_BASE_URL.
+
+Opened in the app lifespan and closed on shutdown. Pool size, timeouts and retries come from
+the AI_HTTP_* / AI_*_TIMEOUT_SECONDS / AI_MAX_RETRIES settings.
+"""
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from app.core.config import settings
+
+
+class AiClient:
+    """Holder for the shared client, so AI calls reuse connections instead of new TLS handshakes."""
+
+    def __init__(self) -> None:
+        self._client: AsyncOpenAI | None = None
+
+    def open(self) -> AsyncOpenAI:
+        client = AsyncOpenAI(
+            base_url=settings.AI_BASE_URL,
+            api_key=settings.AI_API_KEY,
+            max_retries=settings.AI_MAX_RETRIES,
+            timeout=httpx.Timeout(
+                settings.AI_TIMEOUT_SECONDS,
+                connect=settings.AI_CONNECT_TIMEOUT_SECONDS,
+            ),
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=settings.AI_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.AI_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            ),
+        )
+        self._client = client
+        return client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def get(self) -> AsyncOpenAI:
+        """Return the shared client (opened on first use when running outside the app, e.g. scripts)."""
+        if self._client is None:
+            return self.open()
+        return self._client
+
+
+ai_client = AiClient()
@@ -45,6 +45,12 @@ class Settings(BaseSettings):
         description="Access token validity in minutes",
     )
 
+    # GeoJSON responses
+    GEOJSON_MAX_DECIMAL_DIGITS: int = Field(
+        default=7,
+        description="Coordinate decimal digits in GeoJSON responses (ST_AsGeoJSON maxdecimaldigits)",
+    )
+
     # AI (OpenAI-compatible)
     AI_BASE_URL: str = Field(
         default="https://api.openai.com/v1",
@@ -58,6 +64,38 @@ class Settings(BaseSettings):
         default="gpt-4o-mini",
         description="AI model name",
     )
+    AI_MAX_RETRIES: int = Field(
+        default=2,
+        description="Retries (with backoff) for failed or rate-limited AI requests",
+    )
+    AI_TIMEOUT_SECONDS: float = Field(
+        default=300.0,
+        description="Timeout for one AI request (seconds)",
+    )
+    AI_CONNECT_TIMEOUT_SECONDS: float = Field(
+        default=5.0,
+        description="Timeout for opening a connection to the AI API (seconds)",
+    )
+    AI_HTTP_MAX_CONNECTIONS: int = Field(
+        default=100,
+        description="Maximum concurrent connections to the AI API",
+    )
+    AI_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=20,
+        description="Idle connections to the AI API kept open for reuse",
+    )
+    AI_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = Field(
+        default=30.0,
+        description="Idle AI API connections are closed after this many seconds",
+    )
+    AI_JOB_WORKERS: int = Field(
+        default=2,
+        description="Background report jobs run concurrently per API process",
+    )
+    AI_JOB_TIMEOUT_SECONDS: int = Field(
+        default=600,
+        description="A running report job older than this is failed (or reclaimed after a crash)",
+    )
 
     # File upload
     UPLOAD_DIR: str = Field(
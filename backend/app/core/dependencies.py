@@ -1,8 +1,9 @@
-"""FastAPI dependency injection: database session, current user."""
+"""FastAPI dependency injection: database session, current user, conditional GET."""
 
+from collections.abc import Awaitable, Callable
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +12,9 @@ from app.constants import ERROR_MESSAGE_NOT_AUTHENTICATED
 from app.core.database import get_database_session
 from app.core.security import decode_access_token
 from app.models.user import User
+from app.services import data_version_service
+from app.services.type_lookup_service import type_lookups
+from app.utils.http_headers import etag_matches, http_date, make_etag
 
 bearer_security = HTTPBearer(auto_error=False)
 
@@ -40,3 +44,37 @@ async def require_current_user(
             detail=ERROR_MESSAGE_NOT_AUTHENTICATED,
         )
     return current_user
+
+
+def conditional_get(
+    *table_names: str,
+) -> Callable[..., Awaitable[dict[str, str]]]:
+    """Dependency factory for ETag / Last-Modified driven by the data versions of table_names.
+
+    A matching If-None-Match is answered with 304 before the endpoint runs (one
+    data_version lookup, no ORM loads). Otherwise the validators are set on the
+    response and also returned, for endpoints that build their own Response.
+    """
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        database_session: Annotated[AsyncSession, Depends(get_database_session)],
+    ) -> dict[str, str]:
+        versions, last_modified = await data_version_service.get_versions(
+            database_session, table_names
+        )
+        variant = f"{request.url.path}?{request.url.query}|{request.headers.get('accept', '')}"
+        headers = {"ETag": make_etag(versions, variant), "Cache-Control": "no-cache"}
+        if last_modified is not None:
+            headers["Last-Modified"] = http_date(last_modified)
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+        # The body must be at least as new as its ETag; type codes come from the in-process cache
+        await type_lookups.sync_versions(database_session, versions)
+        response.headers.update(headers)
+        return headers
+
+    return dependency
@@ -1,15 +1,21 @@
-"""GeoJSON <-> WKB geometry conversion (GeoAlchemy2 / Shapely). Area is computed in DB via PostGIS ST_Area(geometry::geography). Point geometry validation for objects."""
+"""GeoJSON <-> WKB geometry conversion (GeoAlchemy2 / Shapely); DB-side GeoJSON encoding (ST_AsGeoJSON) for read paths. Plan area is computed in DB via PostGIS ST_Area(geometry::geography) on write and stored in master_plan.area_m2. Point geometry validation for objects."""
 
+import json
 from typing import Any
 
+from geoalchemy2.functions import ST_AsGeoJSON
 from geoalchemy2.shape import from_shape, to_shape
 from shapely.geometry import shape as shapely_shape
+from sqlalchemy import ColumnElement
 
 from app.constants import (
+    ERROR_MESSAGE_BBOX_FORMAT,
+    ERROR_MESSAGE_BBOX_RANGE,
     ERROR_MESSAGE_GEOMETRY_COORDS_LNG_LAT,
     ERROR_MESSAGE_GEOMETRY_COORDS_NUMBERS,
     ERROR_MESSAGE_GEOMETRY_TYPE_POINT,
 )
+from app.core.config import settings
 
 
 def geometry_to_geojson(geometry: Any) -> dict[str, Any] | None:
@@ -23,6 +29,16 @@ def geometry_to_geojson(geometry: Any) -> dict[str, Any] | None:
         return None
 
 
+def geojson_expression(geometry_column: Any) -> ColumnElement[str]:
+    """ST_AsGeoJSON(column) at the configured precision: the DB returns the GeoJSON text, no Shapely decode."""
+    return ST_AsGeoJSON(geometry_column, settings.GEOJSON_MAX_DECIMAL_DIGITS)
+
+
+def geojson_text_to_dict(value: str | None) -> dict[str, Any] | None:
+    """Parse GeoJSON text selected with geojson_expression."""
+    return json.loads(value) if value is not None else None
+
+
 def geojson_to_wkb(geojson: dict[str, Any] | None):
     """Convert GeoJSON to WKB. Expects coordinates in [lng, lat] per GeoJSON spec."""
     if geojson is None:
@@ -48,6 +64,20 @@ def require_point_geojson(geometry: dict[str, Any]) -> None:
         raise ValueError(ERROR_MESSAGE_GEOMETRY_COORDS_NUMBERS)
 
 
+def parse_bbox(value: str) -> tuple[float, float, float, float]:
+    """Parse "minx,miny,maxx,maxy" (lng/lat, EPSG:4326). Raise ValueError if malformed or out of range."""
+    parts = [p.strip() for p in value.split(",")]
+    if len(parts) != 4:
+        raise ValueError(ERROR_MESSAGE_BBOX_FORMAT)
+    try:
+        min_x, min_y, max_x, max_y = (float(p) for p in parts)
+    except ValueError:
+        raise ValueError(ERROR_MESSAGE_BBOX_FORMAT)
+    if not (-180 <= min_x <= max_x <= 180 and -90 <= min_y <= max_y <= 90):
+        raise ValueError(ERROR_MESSAGE_BBOX_RANGE)
+    return (min_x, min_y, max_x, max_y)
+
+
 def first_coordinate_pair(
     geometry: dict[str, Any] | None,
 ) -> tuple[float | None, float | None]:
@@ -3,6 +3,10 @@ Master Plan Intelligence API.
 
 REST endpoints (all under API base URL, JSON unless noted):
 
+GET /object_type, /function_type, /master_plan, /master_plan/{id}/baseline and /object
+send ETag and Last-Modified (from per-table data versions) and answer If-None-Match
+with 304 Not Modified.
+
   Health
     GET  /health
 
@@ -17,6 +21,7 @@ REST endpoints (all under API base URL, JSON unless noted):
     GET    /master_plan
     POST   /master_plan
     GET    /master_plan/{master_plan_id}
+    GET    /master_plan/{master_plan_id}/baseline   (SQL aggregates: housing units, seats, beds, parking, green)
     GET    /master_plan/{master_plan_id}/objects
     PATCH  /master_plan/{master_plan_id}
     DELETE /master_plan/{master_plan_id}
@@ -27,9 +32,19 @@ REST endpoints (all under API base URL, JSON unless noted):
   Function types (tag: function_type)
     GET  /function_type
 
-  Objects (tag: object). List supports ?object_type_id=
+  Objects (tag: object). List supports ?object_type_id=, ?bbox=minx,miny,maxx,maxy
+  and keyset pagination via ?limit=&cursor= (next cursor in X-Next-Cursor header).
+  GET /object and GET /master_plan/{id}/objects stream rows when the request sends
+  Accept: application/x-ndjson (one object per line) or application/geo+json
+  (FeatureCollection). GET /object, GET /object/{id} and GET /master_plan/{id}/objects
+  accept ?fields=id,object_type_code,... to return only those fields.
     GET    /object
+    GET    /object/clusters?bbox=&zoom=   (grid clusters: centroid, count, per-type counts)
+    GET    /object/nearest?lng=&lat=&k=   (KNN, geodesic distance_m; type filters)
     POST   /object
+    POST   /object/batch   (create/update/delete list in one transaction; per-item results)
+    POST   /object/import  (multipart CSV or GeoJSON file; COPY into staging, then merge)
+    GET    /object/export?format=parquet|fgb   (GeoParquet / FlatGeobuf file of all objects)
     GET    /object/{object_id}
     PATCH  /object/{object_id}
     DELETE /object/{object_id}
@@ -41,17 +56,25 @@ REST endpoints (all under API base URL, JSON unless noted):
     PATCH  /project/{project_id}
     DELETE /project/{project_id}
     POST   /project/{project_id}/analyze
-    POST   /project/{project_id}/report
+    POST   /project/{project_id}/report   (same cache and ?force=true as /ai/report)
 
   AI (tag: ai)
     POST /ai/chat
-    POST /ai/report/{master_plan_id}
+    POST /ai/chat/stream   (text/event-stream: {"delta": ...} events, then "done")
+    POST /ai/report/{master_plan_id}   (202 + queued job; cached by input hash; ?force=true regenerates)
+    GET  /ai/jobs/{job_id}   (job status/progress; result holds the report when succeeded)
+
+  Tiles (tag: tile). Mapbox Vector Tiles, layers "object" and "master_plan"
+    GET  /tiles/{z}/{x}/{y}.mvt   (returns application/vnd.mapbox-vector-tile)
 
   Files (tag: file). GET requires auth.
     POST /file
     GET  /file/{file_id}   (returns bytes)
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -64,9 +87,15 @@ from app.routes import (
     function_type as function_type_router,
     project as project_router,
     file as file_router,
+    tile as tile_router,
     ai,
 )
+from app.constants import NEXT_CURSOR_HEADER
+from app.core.ai_client import ai_client
 from app.core.config import settings
+from app.core.database import async_session_maker
+from app.services.ai_job_service import report_jobs
+from app.services.type_lookup_service import type_lookups
 
 
 def _cors_origins() -> list[str]:
@@ -75,9 +104,22 @@ def _cors_origins() -> list[str]:
     return [x.strip() for x in s.split(",") if x.strip()]
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    async with async_session_maker() as session:
+        await type_lookups.load(session)
+    if settings.AI_API_KEY:
+        ai_client.open()
+    report_jobs.start(settings.AI_JOB_WORKERS)
+    yield
+    await report_jobs.stop()
+    await ai_client.close()
+
+
 app = FastAPI(
     title="Master Plan Intelligence API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -86,6 +128,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
@@ -100,6 +143,7 @@ app.include_router(
 app.include_router(object_router.router, prefix="/object", tags=["object"])
 app.include_router(project_router.router, prefix="/project", tags=["project"])
 app.include_router(file_router.router, prefix="/file", tags=["file"])
+app.include_router(tile_router.router, prefix="/tiles", tags=["tile"])
 app.include_router(ai.router, prefix="/ai", tags=["ai"])
 
 
@@ -1,17 +1,25 @@
 from app.models.user import User
 from app.models.master_plan import MasterPlan
+from app.models.master_plan_object import MasterPlanObject
 from app.models.object_type import ObjectType
 from app.models.function_type import FunctionType
 from app.models.object import Object
 from app.models.file import File
 from app.models.project import Project
+from app.models.data_version import DataVersion
+from app.models.ai_report_cache import AiReportCache
+from app.models.ai_job import AiJob
 
 __all__ = [
     "User",
     "MasterPlan",
+    "MasterPlanObject",
     "ObjectType",
     "FunctionType",
     "Object",
     "File",
     "Project",
+    "DataVersion",
+    "AiReportCache",
+    "AiJob",
 ]
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class AiJob(Base):
+    """Queued AI work (development reports), claimed and run by ai_job_service workers."""
+
+    __tablename__ = "ai_job"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    # queued -> running -> succeeded | failed
+    status: Mapped[str] = mapped_column(String(16), nullable=False, index=True)
+    progress: Mapped[str] = mapped_column(String(32), nullable=False)
+    master_plan_id: Mapped[int] = mapped_column(
+        ForeignKey("master_plan.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    params: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_by: Mapped[int | None] = mapped_column(
+        ForeignKey("user.id", ondelete="SET NULL"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
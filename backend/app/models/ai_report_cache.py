@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class AiReportCache(Base):
+    """Generated development reports keyed by a hash of their inputs (report_cache_service.report_cache_key)."""
+
+    __tablename__ = "ai_report_cache"
+    # One (latest) report per plan and assumptions; also serves lookups by plan
+    __table_args__ = (
+        UniqueConstraint(
+            "master_plan_id",
+            "assumptions_key",
+            name="uq_ai_report_cache_master_plan_id_assumptions_key",
+        ),
+    )
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    master_plan_id: Mapped[int] = mapped_column(
+        ForeignKey("master_plan.id", ondelete="CASCADE"), nullable=False
+    )
+    assumptions_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    model: Mapped[str] = mapped_column(String(256), nullable=False)
+    report: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
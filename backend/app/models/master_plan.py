@@ -2,9 +2,9 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from geoalchemy2 import Geometry
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, func
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, query_expression
 
 from app.core.database import Base
 
@@ -20,6 +20,8 @@ class MasterPlan(Base):
     geometry: Mapped[Any] = mapped_column(
         Geometry(geometry_type="GEOMETRY", srid=4326), nullable=True
     )
+    # Geodesic area, ST_Area(geometry::geography); set by the service on geometry writes
+    area_m2: Mapped[float | None] = mapped_column(Float, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -36,3 +38,5 @@ class MasterPlan(Base):
         ForeignKey("user.id", ondelete="SET NULL"), nullable=True, index=True
     )
     ai_development_report: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # GeoJSON text of geometry when the query adds with_expression(...); None otherwise
+    geometry_geojson: Mapped[str | None] = query_expression()
@@ -0,0 +1,17 @@
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class MasterPlanObject(Base):
+    """Objects within a master plan boundary (ST_Within), maintained on object and plan writes."""
+
+    __tablename__ = "master_plan_object"
+
+    master_plan_id: Mapped[int] = mapped_column(
+        ForeignKey("master_plan.id", ondelete="CASCADE"), primary_key=True
+    )
+    object_id: Mapped[int] = mapped_column(
+        ForeignKey("object.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
@@ -7,12 +7,13 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     func,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from app.core.database import Base
 
@@ -24,6 +25,7 @@ if TYPE_CHECKING:
 
 class Object(Base):
     __tablename__ = "object"
+    __table_args__ = (Index("ix_object_updated_at_id", "updated_at", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     object_type_id: Mapped[int] = mapped_column(
@@ -82,6 +84,8 @@ class Object(Base):
     updated_by: Mapped[int | None] = mapped_column(
         ForeignKey("user.id", ondelete="SET NULL"), nullable=True, index=True
     )
+    # GeoJSON text of geometry when the query adds with_expression(...); None otherwise
+    geometry_geojson: Mapped[str | None] = query_expression()
 
     object_type: Mapped["ObjectType"] = relationship("ObjectType")
     function_type: Mapped["FunctionType | None"] = relationship("FunctionType")
@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_database_session
 from app.core.dependencies import get_current_user, require_current_user
 from app.core.exceptions import handle_domain_errors
 from app.models.user import User
-from app.schemas.ai import ChatRequest, ChatResponse, ReportResponse
-from app.services import ai_service, master_plan_service
+from app.schemas.ai import (
+    AiJobResponse,
+    ChatRequest,
+    ChatResponse,
+    ReportRequest,
+)
+from app.services import ai_job_service, ai_service
+from app.utils.streaming import SSE_RESPONSES, sse_response
 
 router = APIRouter()
 
@@ -22,27 +29,63 @@ async def chat(
         master_plan_id=body.master_plan_id,
         object_ids=body.object_ids,
     )
+    # End the read transaction so its pooled connection is free while the model runs
+    await database_session.commit()
     message = await ai_service.chat(body, context=context)
     return ChatResponse(message=message)
 
 
-@router.post("/report/{master_plan_id}", response_model=ReportResponse)
+@router.post("/chat/stream", responses=SSE_RESPONSES)
+async def chat_stream(
+    body: ChatRequest,
+    database_session: AsyncSession = Depends(get_database_session),
+    current_user: User | None = Depends(get_current_user),
+) -> StreamingResponse:
+    """Same as POST /ai/chat, streamed as Server-Sent Events: {"delta": text} per chunk, then "done"."""
+    context = await ai_service.build_chat_context(
+        database_session,
+        master_plan_id=body.master_plan_id,
+        object_ids=body.object_ids,
+    )
+    # The session dependency outlives the stream; do not keep its connection checked out
+    await database_session.commit()
+    return sse_response(ai_service.chat_stream(body, context=context))
+
+
+@router.post(
+    "/report/{master_plan_id}",
+    response_model=AiJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 @handle_domain_errors
 async def generate_report(
     master_plan_id: int,
+    body: ReportRequest | None = None,
+    force: bool = Query(
+        False, description="Regenerate even if a cached report matches the inputs"
+    ),
     database_session: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(require_current_user),
-) -> ReportResponse:
-    try:
-        report = await ai_service.generate_development_report(
-            database_session, master_plan_id
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e),
-        ) from e
-    await master_plan_service.update_ai_development_report(
-        database_session, master_plan_id, report
+) -> AiJobResponse:
+    """Queue report generation and return the job (202); poll GET /ai/jobs/{job_id} for the result."""
+    job = await ai_job_service.enqueue_report_job(
+        database_session,
+        master_plan_id,
+        assumptions=body.assumptions if body else None,
+        force=force,
+        current_user=current_user,
     )
-    return ReportResponse(report=report)
+    await database_session.commit()
+    ai_job_service.report_jobs.notify()
+    return AiJobResponse.model_validate(job)
+
+
+@router.get("/jobs/{job_id}", response_model=AiJobResponse)
+@handle_domain_errors
+async def get_job(
+    job_id: int,
+    database_session: AsyncSession = Depends(get_database_session),
+    current_user: User = Depends(require_current_user),
+) -> AiJobResponse:
+    job = await ai_job_service.get_job(database_session, job_id)
+    return AiJobResponse.model_validate(job)
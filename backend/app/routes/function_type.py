@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 
 from app.core.database import get_database_session
+from app.core.dependencies import conditional_get
 from app.schemas.function_type import FunctionTypeResponse
 from app.services import function_type_service
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,7 +9,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 router = APIRouter()
 
 
-@router.get("", response_model=list[FunctionTypeResponse])
+@router.get(
+    "",
+    dependencies=[Depends(conditional_get("function_type"))],
+    response_model=list[FunctionTypeResponse],
+)
 async def list_function_types(
     database_session: AsyncSession = Depends(get_database_session),
 ) -> list[FunctionTypeResponse]:
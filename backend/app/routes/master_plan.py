@@ -1,16 +1,24 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from starlette.responses import Response
 
 from app.core.database import get_database_session
-from app.core.dependencies import require_current_user
+from app.core.dependencies import conditional_get, require_current_user
 from app.core.exceptions import handle_domain_errors
 from app.models.user import User
 from app.schemas.master_plan import (
+    MasterPlanBaseline,
     MasterPlanCreate,
     MasterPlanResponse,
     MasterPlanUpdate,
 )
 from app.schemas.object import ObjectResponse
-from app.services import master_plan_service, object_service
+from app.services import master_plan_service, object_service, plan_baseline_service
+from app.utils.json_response import FastJSONResponse
+from app.utils.streaming import (
+    STREAMING_RESPONSES,
+    negotiate_stream_media_type,
+    streaming_list_response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
@@ -18,12 +26,14 @@ router = APIRouter()
 
 @router.get("", response_model=list[MasterPlanResponse])
 async def list_master_plans(
+    validators: dict[str, str] = Depends(conditional_get("master_plan")),
     database_session: AsyncSession = Depends(get_database_session),
-) -> list[MasterPlanResponse]:
-    rows = await master_plan_service.list_master_plans(database_session)
-    return [
-        master_plan_service.plan_to_response(plan, area_m2) for plan, area_m2 in rows
-    ]
+) -> Response:
+    plans = await master_plan_service.list_master_plans(database_session)
+    return FastJSONResponse(
+        [master_plan_service.plan_to_json_row(plan) for plan in plans],
+        headers=validators,
+    )
 
 
 @router.post("", response_model=MasterPlanResponse, status_code=201)
@@ -33,10 +43,10 @@ async def create_master_plan(
     database_session: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(require_current_user),
 ) -> MasterPlanResponse:
-    plan, area_m2 = await master_plan_service.create_master_plan(
+    plan = await master_plan_service.create_master_plan(
         database_session, body, current_user=current_user
     )
-    return master_plan_service.plan_to_response(plan, area_m2)
+    return master_plan_service.plan_to_response(plan)
 
 
 @router.get("/{master_plan_id}", response_model=MasterPlanResponse)
@@ -45,25 +55,68 @@ async def get_master_plan(
     master_plan_id: int,
     database_session: AsyncSession = Depends(get_database_session),
 ) -> MasterPlanResponse:
-    plan, area_m2 = await master_plan_service.get_by_id(
+    plan = await master_plan_service.get_by_id(database_session, master_plan_id)
+    return master_plan_service.plan_to_response(plan)
+
+
+@router.get(
+    "/{master_plan_id}/baseline",
+    response_model=MasterPlanBaseline,
+    dependencies=[Depends(conditional_get("object", "master_plan"))],
+)
+@handle_domain_errors
+async def get_master_plan_baseline(
+    master_plan_id: int,
+    database_session: AsyncSession = Depends(get_database_session),
+) -> MasterPlanBaseline:
+    """Report baseline aggregates (housing units, seats, beds, parking, green objects) for the plan."""
+    return await plan_baseline_service.get_plan_baseline(
         database_session, master_plan_id
     )
-    return master_plan_service.plan_to_response(plan, area_m2)
 
 
 @router.get(
     "/{master_plan_id}/objects",
     response_model=list[ObjectResponse],
+    responses=STREAMING_RESPONSES,
 )
 @handle_domain_errors
 async def list_master_plan_objects(
     master_plan_id: int,
+    fields: str | None = Query(
+        None,
+        description="Comma-separated ObjectResponse fields to return, e.g. id,object_type_code,geometry",
+    ),
+    accept: str | None = Header(None),
     database_session: AsyncSession = Depends(get_database_session),
-) -> list[ObjectResponse]:
-    rows = await master_plan_service.list_objects_in_plan(
+) -> Response:
+    stream_media_type = negotiate_stream_media_type(accept)
+    if stream_media_type is not None:
+        await master_plan_service.get_by_id(database_session, master_plan_id)
+        return streaming_list_response(
+            stream_media_type,
+            lambda session: master_plan_service.stream_objects_in_plan(
+                session, master_plan_id
+            ),
+            to_item=object_service.object_to_json_row,
+            to_feature=object_service.object_to_feature,
+        )
+    if fields:
+        try:
+            selected = object_service.parse_object_fields(fields)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e),
+            ) from e
+        items = await master_plan_service.list_object_fields_in_plan(
+            database_session, master_plan_id, selected
+        )
+        return FastJSONResponse(items)
+    objects = await master_plan_service.list_objects_in_plan(
         database_session, master_plan_id
     )
-    return [object_service.object_to_response(obj, area_m2) for obj, area_m2 in rows]
+    return FastJSONResponse([object_service.object_to_json_row(obj) for obj in objects])
 
 
 @router.patch("/{master_plan_id}", response_model=MasterPlanResponse)
@@ -74,10 +127,10 @@ async def update_master_plan(
     database_session: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(require_current_user),
 ) -> MasterPlanResponse:
-    plan, area_m2 = await master_plan_service.update_master_plan(
+    plan = await master_plan_service.update_master_plan(
         database_session, master_plan_id, body, current_user=current_user
     )
-    return master_plan_service.plan_to_response(plan, area_m2)
+    return master_plan_service.plan_to_response(plan)
 
 
 @router.delete("/{master_plan_id}", status_code=204)
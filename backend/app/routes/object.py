@@ -1,25 +1,186 @@
-from fastapi import APIRouter, Depends, Query
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Literal
 
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
+
+from app.constants import (
+    ERROR_MESSAGE_IMPORT_FORMAT,
+    MAX_NEAREST_K,
+    MAX_OBJECT_PAGE_SIZE,
+    MAX_TILE_ZOOM,
+    NEXT_CURSOR_HEADER,
+)
 from app.core.database import get_database_session
-from app.core.dependencies import require_current_user
+from app.core.dependencies import conditional_get, require_current_user
 from app.core.exceptions import handle_domain_errors
+from app.core.geography import parse_bbox
 from app.models.user import User
-from app.schemas.object import ObjectCreate, ObjectResponse, ObjectUpdate
-from app.services import object_service
+from app.schemas.object import (
+    ObjectBatchRequest,
+    ObjectBatchResponse,
+    ObjectClusterResponse,
+    ObjectCreate,
+    ObjectImportResponse,
+    ObjectNearestResponse,
+    ObjectResponse,
+    ObjectUpdate,
+)
+from app.services import object_export_service, object_import_service, object_service
+from app.services.type_lookup_service import type_lookups
+from app.utils.json_response import FastJSONResponse
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.streaming import (
+    STREAMING_RESPONSES,
+    negotiate_stream_media_type,
+    streaming_list_response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
 
-@router.get("", response_model=list[ObjectResponse])
+def _list_headers(
+    validators: dict[str, str], next_after: tuple[datetime, int] | None
+) -> dict[str, str]:
+    """ETag / Last-Modified plus the next-page cursor, for responses returned directly."""
+    headers = dict(validators)
+    if next_after is not None:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(*next_after)
+    return headers
+
+
+@router.get("", response_model=list[ObjectResponse], responses=STREAMING_RESPONSES)
 async def list_objects(
+    object_type_id: int | None = Query(None, description="Filter by object type"),
+    bbox: str | None = Query(
+        None, description="Filter by bounding box: minx,miny,maxx,maxy (lng/lat)"
+    ),
+    limit: int | None = Query(
+        None,
+        ge=1,
+        le=MAX_OBJECT_PAGE_SIZE,
+        description=f"Page size; next page cursor is returned in {NEXT_CURSOR_HEADER}",
+    ),
+    cursor: str | None = Query(
+        None, description=f"Cursor from a previous {NEXT_CURSOR_HEADER} header"
+    ),
+    fields: str | None = Query(
+        None,
+        description="Comma-separated ObjectResponse fields to return, e.g. id,object_type_code,geometry",
+    ),
+    accept: str | None = Header(None),
+    validators: dict[str, str] = Depends(
+        conditional_get("object", "object_type", "function_type")
+    ),
+    database_session: AsyncSession = Depends(get_database_session),
+) -> Response:
+    try:
+        bounds = parse_bbox(bbox) if bbox is not None else None
+        after = decode_cursor(cursor) if cursor is not None else None
+        selected = object_service.parse_object_fields(fields) if fields else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+    stream_media_type = negotiate_stream_media_type(accept)
+    if stream_media_type is not None:
+        # Full filtered list, row by row; ?limit= / ?cursor= do not apply.
+        return streaming_list_response(
+            stream_media_type,
+            lambda session: object_service.stream_objects(
+                session, object_type_id=object_type_id, bbox=bounds
+            ),
+            to_item=object_service.object_to_json_row,
+            to_feature=object_service.object_to_feature,
+        )
+    if selected is not None:
+        # Sparse rows: returned as-is, not validated against ObjectResponse
+        items, next_after = await object_service.list_object_fields(
+            database_session,
+            selected,
+            limit=limit or (MAX_OBJECT_PAGE_SIZE if after is not None else None),
+            after=after,
+            object_type_id=object_type_id,
+            bbox=bounds,
+        )
+        return FastJSONResponse(items, headers=_list_headers(validators, next_after))
+    next_after = None
+    if limit is None and after is None:
+        objects = await object_service.list_objects(
+            database_session, object_type_id=object_type_id, bbox=bounds
+        )
+    else:
+        objects, next_after = await object_service.list_objects_page(
+            database_session,
+            limit=limit or MAX_OBJECT_PAGE_SIZE,
+            after=after,
+            object_type_id=object_type_id,
+            bbox=bounds,
+        )
+    return FastJSONResponse(
+        [object_service.object_to_json_row(obj) for obj in objects],
+        headers=_list_headers(validators, next_after),
+    )
+
+
+@router.get("/clusters", response_model=list[ObjectClusterResponse])
+async def list_object_clusters(
+    bbox: str = Query(..., description="Bounding box: minx,miny,maxx,maxy (lng/lat)"),
+    zoom: int = Query(..., ge=0, le=MAX_TILE_ZOOM, description="Map zoom level"),
     object_type_id: int | None = Query(None, description="Filter by object type"),
     database_session: AsyncSession = Depends(get_database_session),
-) -> list[ObjectResponse]:
-    rows = await object_service.list_objects(
-        database_session, object_type_id=object_type_id
+) -> list[ObjectClusterResponse]:
+    try:
+        bounds = parse_bbox(bbox)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+    return await object_service.cluster_objects(
+        database_session, bounds, zoom, object_type_id=object_type_id
     )
-    return [object_service.object_to_response(obj, area_m2) for obj, area_m2 in rows]
+
+
+@router.get("/nearest", response_model=list[ObjectNearestResponse])
+async def list_nearest_objects(
+    lng: float = Query(
+        ..., ge=-180, le=180, description="Longitude of the query point"
+    ),
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the query point"),
+    k: int = Query(10, ge=1, le=MAX_NEAREST_K, description="Number of objects"),
+    object_type_id: int | None = Query(None, description="Filter by object type"),
+    function_type_id: int | None = Query(None, description="Filter by function type"),
+    database_session: AsyncSession = Depends(get_database_session),
+) -> list[ObjectNearestResponse]:
+    rows = await object_service.nearest_objects(
+        database_session,
+        longitude=lng,
+        latitude=lat,
+        k=k,
+        object_type_id=object_type_id,
+        function_type_id=function_type_id,
+    )
+    return [
+        object_service.object_to_nearest_response(obj, distance_m)
+        for obj, distance_m in rows
+    ]
 
 
 @router.post("", response_model=ObjectResponse, status_code=201)
@@ -29,20 +190,132 @@ async def create_object(
     database_session: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(require_current_user),
 ) -> ObjectResponse:
-    object_entity, area_m2 = await object_service.create_object(
+    object_entity = await object_service.create_object(
         database_session, body, current_user
     )
-    return object_service.object_to_response(object_entity, area_m2)
+    return object_service.object_to_response(object_entity)
+
+
+@router.post("/batch", response_model=ObjectBatchResponse)
+async def apply_object_batch(
+    body: ObjectBatchRequest,
+    database_session: AsyncSession = Depends(get_database_session),
+    current_user: User = Depends(require_current_user),
+) -> ObjectBatchResponse:
+    try:
+        results = await object_service.apply_object_batch(
+            database_session, body.operations, current_user
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+    return ObjectBatchResponse(results=results)
+
+
+@router.get(
+    "/export",
+    response_class=FileResponse,
+    responses={
+        200: {
+            "content": {
+                media_type: {}
+                for media_type in object_export_service.EXPORT_MEDIA_TYPES.values()
+            }
+        }
+    },
+)
+async def export_objects(
+    format: object_export_service.ExportFormat = Query(
+        "parquet", description="parquet (GeoParquet) or fgb (FlatGeobuf)"
+    ),
+    database_session: AsyncSession = Depends(get_database_session),
+) -> FileResponse:
+    """Whole object table as a typed GeoParquet or spatially indexed FlatGeobuf file."""
+    suffix = object_export_service.EXPORT_SUFFIXES[format]
+    fd, name = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    path = Path(name)
+    try:
+        await object_export_service.export_objects(database_session, format, path)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return FileResponse(
+        path,
+        media_type=object_export_service.EXPORT_MEDIA_TYPES[format],
+        filename=f"objects{suffix}",
+        background=BackgroundTask(path.unlink, missing_ok=True),
+    )
+
+
+@router.post("/import", response_model=ObjectImportResponse)
+async def import_objects(
+    file: UploadFile = File(...),
+    format: Literal["csv", "geojson"] | None = Query(
+        None, description="File format; inferred from the file name when omitted"
+    ),
+    database_session: AsyncSession = Depends(get_database_session),
+    current_user: User = Depends(require_current_user),
+) -> ObjectImportResponse:
+    """Bulk-load objects from a seed-format CSV or a GeoJSON FeatureCollection."""
+    if format is None:
+        filename = (file.filename or "").lower()
+        if filename.endswith(".csv"):
+            format = "csv"
+        elif filename.endswith((".geojson", ".json")):
+            format = "geojson"
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=ERROR_MESSAGE_IMPORT_FORMAT,
+            )
+    rows = (
+        object_import_service.iter_csv_rows(file.file)
+        if format == "csv"
+        else object_import_service.iter_geojson_rows(file.file)
+    )
+    try:
+        result = await object_import_service.import_objects(
+            database_session, rows, current_user
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+    if result.object_types_created or result.function_types_created:
+        # Reload only once committed, so the cache never holds rolled-back type codes
+        await database_session.commit()
+        await type_lookups.load(database_session)
+    return result
 
 
 @router.get("/{object_id}", response_model=ObjectResponse)
 @handle_domain_errors
 async def get_object(
     object_id: int,
+    fields: str | None = Query(
+        None,
+        description="Comma-separated ObjectResponse fields to return, e.g. id,object_type_code,geometry",
+    ),
     database_session: AsyncSession = Depends(get_database_session),
-) -> ObjectResponse:
-    object_entity, area_m2 = await object_service.get_by_id(database_session, object_id)
-    return object_service.object_to_response(object_entity, area_m2)
+) -> ObjectResponse | Response:
+    if fields:
+        try:
+            selected = object_service.parse_object_fields(fields)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e),
+            ) from e
+        item = await object_service.get_object_fields(
+            database_session, object_id, selected
+        )
+        return FastJSONResponse(item)
+    object_entity = await object_service.get_by_id(database_session, object_id)
+    return object_service.object_to_response(object_entity)
 
 
 @router.patch("/{object_id}", response_model=ObjectResponse)
@@ -53,10 +326,10 @@ async def update_object(
     database_session: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(require_current_user),
 ) -> ObjectResponse:
-    object_entity, area_m2 = await object_service.update_object(
+    object_entity = await object_service.update_object(
         database_session, object_id, body, current_user
     )
-    return object_service.object_to_response(object_entity, area_m2)
+    return object_service.object_to_response(object_entity)
 
 
 @router.delete("/{object_id}", status_code=204)
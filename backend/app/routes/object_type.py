@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 
 from app.core.database import get_database_session
+from app.core.dependencies import conditional_get
 from app.schemas.object_type import ObjectTypeResponse
 from app.services import object_type_service
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,7 +9,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 router = APIRouter()
 
 
-@router.get("", response_model=list[ObjectTypeResponse])
+@router.get(
+    "",
+    dependencies=[Depends(conditional_get("object_type"))],
+    response_model=list[ObjectTypeResponse],
+)
 async def list_object_types(
     database_session: AsyncSession = Depends(get_database_session),
 ) -> list[ObjectTypeResponse]:
@@ -4,14 +4,14 @@ from app.core.database import get_database_session
 from app.core.dependencies import get_current_user, require_current_user
 from app.core.exceptions import handle_domain_errors
 from app.models.user import User
-from app.schemas.ai import ReportResponse
+from app.schemas.ai import ReportRequest, ReportResponse
 from app.schemas.project import (
     AnalyzeStubResponse,
     ProjectCreate,
     ProjectResponse,
     ProjectUpdate,
 )
-from app.services import ai_service, master_plan_service, project_service
+from app.services import ai_service, project_service
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
@@ -92,6 +92,10 @@ async def analyze_project(
 @handle_domain_errors
 async def report_project(
     project_id: int,
+    body: ReportRequest | None = None,
+    force: bool = Query(
+        False, description="Regenerate even if a cached report matches the inputs"
+    ),
     database_session: AsyncSession = Depends(get_database_session),
     current_user: User = Depends(require_current_user),
 ) -> ReportResponse:
@@ -101,16 +105,17 @@ async def report_project(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Project has no master plan. Set master_plan_id to generate a report.",
         )
+    # End the read transaction so its pooled connection is free while the model runs
+    await database_session.commit()
     try:
         report_data = await ai_service.generate_development_report(
-            database_session, project.master_plan_id
+            project.master_plan_id,
+            assumptions=body.assumptions if body else None,
+            force=force,
         )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(e),
         ) from e
-    await master_plan_service.update_ai_development_report(
-        database_session, project.master_plan_id, report_data
-    )
     return ReportResponse(report=report_data)
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from starlette.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import MVT_MEDIA_TYPE
+from app.core.database import get_database_session
+from app.services import tile_service
+
+router = APIRouter()
+
+
+@router.get("/{z}/{x}/{y}.mvt")
+async def get_tile(
+    z: int,
+    x: int,
+    y: int,
+    database_session: AsyncSession = Depends(get_database_session),
+) -> Response:
+    try:
+        tile = await tile_service.get_tile(database_session, z, x, y)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+    return Response(content=tile, media_type=MVT_MEDIA_TYPE)
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, Field
 
 
 class ChatMessage(BaseModel):
@@ -24,3 +26,43 @@ class ReportResponse(BaseModel):
     """Development report JSON (same schema as stored in master_plan.ai_development_report)."""
 
     report: dict
+
+
+class ReportAssumptions(BaseModel):
+    """Planning norms for the development report (the report's "assumptions" block; defaults from the prompt)."""
+
+    avg_household_size: float = Field(3.6, gt=0)
+    school_age_share: float = Field(0.14, gt=0, le=1)
+    kindergarten_age_share: float = Field(0.07, gt=0, le=1)
+    kindergarten_coverage: float = Field(0.60, gt=0, le=1)
+    school_unit_capacity: int = Field(900, gt=0)
+    kindergarten_unit_capacity: int = Field(240, gt=0)
+    parking_spaces_per_unit: float = Field(0.35, ge=0)
+    parking_multilevel_capacity: int = Field(300, gt=0)
+    env_risk_max: float = Field(0.60, ge=0, le=1)
+    park_rule_people_per_green_object: int = Field(12000, gt=0)
+    clinic_population_per_capacity: float = Field(2.5, gt=0)
+    clinic_population_threshold: int = Field(15000, ge=0)
+
+
+class ReportRequest(BaseModel):
+    """Optional body of the report endpoints; omitted fields use the default assumptions."""
+
+    assumptions: ReportAssumptions = Field(default_factory=ReportAssumptions)
+
+
+class AiJobResponse(BaseModel):
+    """Background AI job; result holds the report once status is "succeeded"."""
+
+    id: int
+    kind: str
+    status: str
+    progress: str
+    master_plan_id: int
+    result: dict | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
@@ -29,3 +29,20 @@ class MasterPlanResponse(MasterPlanBase):
     ai_development_report: dict | None = None
 
     model_config = {"from_attributes": True, "populate_by_name": True}
+
+
+class MasterPlanBaselineCapacities(BaseModel):
+    school_seats_total: int
+    kindergarten_seats_total: int
+    hospital_beds_total: int
+    clinic_capacity_total: int
+    parking_spaces_total: int
+    green_objects_total: int
+
+
+class MasterPlanBaseline(BaseModel):
+    """Baseline inventory of the objects in a plan (the report's "baseline" block, without population)."""
+
+    objects_total: int
+    housing_units_total: int
+    capacities: MasterPlanBaselineCapacities
@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
+from app.constants import MAX_OBJECT_BATCH_SIZE
 from app.core.geography import require_point_geojson
 from app.schemas.geography import GeoJSONGeometry
 
@@ -102,3 +103,72 @@ class ObjectResponse(ObjectBase):
     area_m2: float | None = None
 
     model_config = {"from_attributes": True}
+
+
+class ObjectClusterResponse(BaseModel):
+    """Grid cluster of objects at a zoom level; object_id is set when the cluster holds one object."""
+
+    longitude: float
+    latitude: float
+    count: int
+    object_type_counts: dict[str, int]
+    object_id: int | None = None
+
+
+class ObjectNearestResponse(ObjectResponse):
+    """Object with geodesic distance in meters from the query point."""
+
+    distance_m: float
+
+
+class ObjectBatchCreate(BaseModel):
+    op: Literal["create"]
+    object: ObjectCreate
+
+
+class ObjectBatchUpdate(BaseModel):
+    op: Literal["update"]
+    id: int
+    object: ObjectUpdate
+
+
+class ObjectBatchDelete(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+
+ObjectBatchOperation = Annotated[
+    ObjectBatchCreate | ObjectBatchUpdate | ObjectBatchDelete,
+    Field(discriminator="op"),
+]
+
+
+class ObjectBatchRequest(BaseModel):
+    """Create/update/delete operations applied in one transaction. An id may appear in at most one operation."""
+
+    operations: list[ObjectBatchOperation] = Field(
+        min_length=1, max_length=MAX_OBJECT_BATCH_SIZE
+    )
+
+
+class ObjectBatchItemResult(BaseModel):
+    """Result for operations[index]: the created/updated object, or error (e.g. not found) when it was skipped."""
+
+    index: int
+    op: Literal["create", "update", "delete"]
+    id: int | None = None
+    object: ObjectResponse | None = None
+    error: str | None = None
+
+
+class ObjectBatchResponse(BaseModel):
+    results: list[ObjectBatchItemResult]
+
+
+class ObjectImportResponse(BaseModel):
+    """Result of POST /object/import: rows inserted, rows skipped (no type or coordinates)."""
+
+    imported: int
+    skipped: int
+    object_types_created: int
+    function_types_created: int
@@ -0,0 +1,207 @@
+"""Background AI jobs: development reports are queued in ai_job and run by in-process workers.
+
+POST /ai/report/{id} inserts a queued row and returns at once; AI_JOB_WORKERS asyncio tasks
+started in the app lifespan claim rows with FOR UPDATE SKIP LOCKED (so several API processes
+can share the table), run ai_service.generate_development_report (which stores the report on
+the plan) and copy the report onto the job. Clients poll GET /ai/jobs/{id}.
+
+A job still "running" after AI_JOB_TIMEOUT_SECONDS (plus one poll interval) belongs to a worker
+that died and is claimed again.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy import func, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import (
+    AI_JOB_POLL_SECONDS,
+    ERROR_MESSAGE_AI_JOB_FAILED,
+    ERROR_MESSAGE_AI_JOB_NOT_FOUND,
+    ERROR_MESSAGE_AI_JOB_TIMEOUT,
+)
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.exceptions import NotFoundError
+from app.models.ai_job import AiJob
+from app.models.user import User
+from app.schemas.ai import ReportAssumptions
+from app.services import ai_service, master_plan_service
+
+JOB_KIND_REPORT = "report"
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+# Coarse progress stages shown to polling clients
+PROGRESS_QUEUED = "queued"
+PROGRESS_GENERATING = "generating"
+PROGRESS_DONE = "done"
+
+logger = logging.getLogger(__name__)
+
+_CLAIM_SQL = text(
+    """
+    UPDATE ai_job
+    SET status = :running, progress = :generating, started_at = now(),
+        error = NULL
+    WHERE id = (
+        SELECT id FROM ai_job
+        WHERE status = :queued
+           OR (status = :running AND started_at < now() - make_interval(secs => :stale_seconds))
+        ORDER BY id
+        FOR UPDATE SKIP LOCKED
+        LIMIT 1
+    )
+    RETURNING id, master_plan_id, params
+    """
+)
+
+
+async def enqueue_report_job(
+    db: AsyncSession,
+    master_plan_id: int,
+    assumptions: ReportAssumptions | None,
+    force: bool,
+    current_user: User | None = None,
+) -> AiJob:
+    """Queue a development report for the plan. Raises NotFoundError if the plan does not exist.
+
+    The caller must commit before report_jobs.notify() so workers can see the row.
+    """
+    await master_plan_service.get_by_id(db, master_plan_id)
+    job = AiJob(
+        kind=JOB_KIND_REPORT,
+        status=STATUS_QUEUED,
+        progress=PROGRESS_QUEUED,
+        master_plan_id=master_plan_id,
+        params={
+            "assumptions": (assumptions or ReportAssumptions()).model_dump(),
+            "force": force,
+        },
+        created_by=current_user.id if current_user else None,
+    )
+    db.add(job)
+    await db.flush()
+    await db.refresh(job)
+    return job
+
+
+async def get_job(db: AsyncSession, job_id: int) -> AiJob:
+    """Return job by id. Raises NotFoundError if missing."""
+    job = await db.get(AiJob, job_id)
+    if job is None:
+        raise NotFoundError(ERROR_MESSAGE_AI_JOB_NOT_FOUND)
+    return job
+
+
+async def _set_job(job_id: int, **values: Any) -> None:
+    """Update job columns in a short transaction of its own."""
+    async with async_session_maker() as session:
+        await session.execute(update(AiJob).where(AiJob.id == job_id).values(**values))
+        await session.commit()
+
+
+async def _claim_job() -> tuple[int, int, dict[str, Any]] | None:
+    """Mark the oldest queued (or stale running) job as running; return (id, master_plan_id, params)."""
+    async with async_session_maker() as session:
+        row = (
+            await session.execute(
+                _CLAIM_SQL,
+                {
+                    "queued": STATUS_QUEUED,
+                    "running": STATUS_RUNNING,
+                    "generating": PROGRESS_GENERATING,
+                    "stale_seconds": float(
+                        settings.AI_JOB_TIMEOUT_SECONDS + AI_JOB_POLL_SECONDS
+                    ),
+                },
+            )
+        ).first()
+        await session.commit()
+    return (row.id, row.master_plan_id, row.params) if row is not None else None
+
+
+async def _run_job(job_id: int, master_plan_id: int, params: dict[str, Any]) -> None:
+    try:
+        report = await asyncio.wait_for(
+            ai_service.generate_development_report(
+                master_plan_id,
+                assumptions=ReportAssumptions.model_validate(params["assumptions"]),
+                force=params["force"],
+            ),
+            timeout=settings.AI_JOB_TIMEOUT_SECONDS,
+        )
+        await _set_job(
+            job_id,
+            status=STATUS_SUCCEEDED,
+            progress=PROGRESS_DONE,
+            result=report,
+            finished_at=func.now(),
+        )
+    except TimeoutError:
+        await _fail_job(job_id, ERROR_MESSAGE_AI_JOB_TIMEOUT)
+    except (ValueError, NotFoundError) as e:
+        await _fail_job(job_id, str(e))
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        logger.exception("AI job %s failed", job_id)
+        await _fail_job(job_id, ERROR_MESSAGE_AI_JOB_FAILED)
+
+
+async def _fail_job(job_id: int, error: str) -> None:
+    await _set_job(
+        job_id,
+        status=STATUS_FAILED,
+        progress=PROGRESS_DONE,
+        error=error,
+        finished_at=func.now(),
+    )
+
+
+class AiJobRunner:
+    """Pool of worker tasks that drain the ai_job queue. Started and stopped by the app lifespan."""
+
+    def __init__(self) -> None:
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def start(self, workers: int) -> None:
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(workers)]
+
+    async def stop(self) -> None:
+        """Cancel workers; an interrupted job stays "running" and is reclaimed once stale."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake idle workers after a job was committed."""
+        self._wakeup.set()
+
+    async def _worker(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                claimed = await _claim_job()
+                if claimed is not None:
+                    await _run_job(*claimed)
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Typically the database is unavailable; retry after the poll interval
+                logger.exception("AI job worker iteration failed")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=AI_JOB_POLL_SECONDS)
+            except TimeoutError:
+                pass
+
+
+report_jobs = AiJobRunner()
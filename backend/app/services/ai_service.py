@@ -1,12 +1,15 @@
 """AI chat using an OpenAI-compatible API (config: AI_BASE_URL, AI_API_KEY, AI_MODEL)."""
 
 import json
+from collections.abc import AsyncIterator
 from typing import Any
 
-from openai import AsyncOpenAI
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants import (
+    CHAT_CONTEXT_CACHE_SIZE,
+    CHAT_CONTEXT_CACHE_TTL_SECONDS,
     ERROR_MESSAGE_AI_CHAT_NOT_CONFIGURED,
     ERROR_MESSAGE_AI_NOT_CONFIGURED,
     ERROR_MESSAGE_NO_RESPONSE_FROM_MODEL,
@@ -17,12 +20,25 @@ from app.constants.prompts import (
     CHAT_SYSTEM_PROMPT,
     REPORT_SYSTEM_MESSAGE,
 )
+from app.core.ai_client import ai_client
+from app.core.cache import LRUCache
 from app.core.config import settings
-from app.core.geography import first_coordinate_pair, geom_to_geojson
+from app.core.database import async_session_maker
+from app.core.geography import first_coordinate_pair
+from app.models.master_plan import MasterPlan
 from app.models.object import Object
-from app.schemas.ai import ChatRequest
+from app.schemas.ai import ChatRequest, ReportAssumptions
+from app.schemas.master_plan import MasterPlanBaseline
 from app.services import master_plan_service
 from app.services import object_service
+from app.services import (
+    data_version_service,
+    plan_baseline_service,
+    report_cache_service,
+    report_candidate_service,
+    report_needs_service,
+)
+from app.services.type_lookup_service import type_lookups
 from app.utils.prompt_utils import (
     build_report_prompt,
     strip_json_from_completion,
@@ -30,46 +46,63 @@ from app.utils.prompt_utils import (
 )
 
 
+# Every table whose rows (or type codes) appear in the chat context
+_CHAT_CONTEXT_TABLES = ("master_plan", "object", "object_type", "function_type")
+
+_chat_context_cache: LRUCache[
+    tuple[int | None, tuple[int, ...] | None, tuple[int, ...]], str
+] = LRUCache(CHAT_CONTEXT_CACHE_SIZE, ttl_seconds=CHAT_CONTEXT_CACHE_TTL_SECONDS)
+
+
 async def build_chat_context(
     db: AsyncSession,
     master_plan_id: int | None,
     object_ids: list[int] | None,
 ) -> str:
-    """Load master plan(s) and object(s) per selection and return a compact context string."""
+    """Load master plan(s) and object(s) per selection and return a compact context string.
+
+    Cached per (plan, selected object ids, data versions): later turns of a conversation cost
+    one data_version lookup, and any plan, object or type write changes the key.
+    """
+    versions, _ = await data_version_service.get_versions(db, _CHAT_CONTEXT_TABLES)
+    key = (
+        master_plan_id,
+        tuple(sorted(set(object_ids))) if object_ids else None,
+        tuple(versions[name] for name in _CHAT_CONTEXT_TABLES),
+    )
+    context = _chat_context_cache.get(key)
+    if context is None:
+        context = await _load_chat_context(db, master_plan_id, object_ids)
+        _chat_context_cache.set(key, context)
+    return context
+
+
+async def _load_chat_context(
+    db: AsyncSession,
+    master_plan_id: int | None,
+    object_ids: list[int] | None,
+) -> str:
     plans_data: list[dict[str, Any]] = []
     objects_data: list[dict[str, Any]] = []
 
     object_id_set = set(object_ids) if object_ids else None
 
     if master_plan_id is not None:
-        plan, plan_area = await master_plan_service.get_by_id(db, master_plan_id)
-        plans_data = [
-            {
-                "id": plan.id,
-                "name": plan.name,
-                "area_m2": round(plan_area, 2) if plan_area is not None else None,
-            }
-        ]
-        rows = await master_plan_service.list_objects_in_plan(db, master_plan_id)
-        for obj, area_m2 in rows:
+        plan = await master_plan_service.get_by_id(db, master_plan_id)
+        plans_data = [_plan_to_context_dict(plan)]
+        objects = await master_plan_service.list_objects_in_plan(db, master_plan_id)
+        for obj in objects:
             if object_id_set is not None and obj.id not in object_id_set:
                 continue
-            objects_data.append(_object_to_context_dict(obj, area_m2))
+            objects_data.append(_object_to_context_dict(obj))
     else:
-        plan_rows = await master_plan_service.list_master_plans(db)
-        plans_data = [
-            {
-                "id": p.id,
-                "name": p.name,
-                "area_m2": round(a, 2) if a is not None else None,
-            }
-            for p, a in plan_rows
-        ]
-        obj_rows = await object_service.list_objects(db, object_type_id=None)
-        for obj, area_m2 in obj_rows:
+        plans = await master_plan_service.list_master_plans(db)
+        plans_data = [_plan_to_context_dict(p) for p in plans]
+        objects = await object_service.list_objects(db, object_type_id=None)
+        for obj in objects:
             if object_id_set is not None and obj.id not in object_id_set:
                 continue
-            objects_data.append(_object_to_context_dict(obj, area_m2))
+            objects_data.append(_object_to_context_dict(obj))
 
     if len(objects_data) > MAX_OBJECTS_IN_AI_CONTEXT:
         objects_data = objects_data[:MAX_OBJECTS_IN_AI_CONTEXT]
@@ -90,14 +123,23 @@ async def build_chat_context(
     )
 
 
-def _object_to_context_dict(obj: Object, area_m2: float | None) -> dict[str, Any]:
+def _plan_to_context_dict(plan: MasterPlan) -> dict[str, Any]:
+    """Build a compact dict for one master plan (no geometry)."""
+    return {
+        "id": plan.id,
+        "name": plan.name,
+        "area_m2": round(plan.area_m2, 2) if plan.area_m2 is not None else None,
+    }
+
+
+def _object_to_context_dict(obj: Object) -> dict[str, Any]:
     """Build a compact dict for one object (no geometry)."""
     d: dict[str, Any] = {
         "id": obj.id,
         "name": obj.name,
-        "object_type_code": obj.object_type.code if obj.object_type else None,
-        "function_type_code": obj.function_type.code if obj.function_type else None,
-        "area_m2": round(area_m2, 2) if area_m2 is not None else None,
+        "object_type_code": type_lookups.object_type_code(obj.object_type_id),
+        "function_type_code": type_lookups.function_type_code(obj.function_type_id),
+        "area_m2": object_service.object_area_m2(obj),
         "district": obj.district,
         "address_full": obj.address_full,
         "capacity_people_max": obj.capacity_people_max,
@@ -113,14 +155,14 @@ def _object_to_context_dict(obj: Object, area_m2: float | None) -> dict[str, Any
 
 def _object_to_report_dict(obj: Object) -> dict[str, Any]:
     """Build dict for one object for the development report prompt (allowed fields only)."""
-    geom = geom_to_geojson(obj.geometry)
+    geom = object_service.object_geojson(obj)
     longitude, latitude = first_coordinate_pair(geom)
     d: dict[str, Any] = {
         "id": obj.id,
         "object_id": obj.object_id,
         "parcel_id": obj.parcel_id,
-        "object_type": obj.object_type.code if obj.object_type else None,
-        "function_type": obj.function_type.code if obj.function_type else None,
+        "object_type": type_lookups.object_type_code(obj.object_type_id),
+        "function_type": type_lookups.function_type_code(obj.function_type_id),
         "name_ru": obj.name,
         "latitude": latitude,
         "longitude": longitude,
@@ -151,36 +193,99 @@ async def build_report_context(
     db: AsyncSession, master_plan_id: int
 ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
     """Load master plan and objects in plan; return (plan_info, objects_list) for the report prompt."""
-    plan, plan_area = await master_plan_service.get_by_id(db, master_plan_id)
-    rows = await master_plan_service.list_objects_in_plan(db, master_plan_id)
-    plan_info = {
-        "id": plan.id,
-        "name": plan.name,
-        "area_m2": round(plan_area, 2) if plan_area is not None else None,
-    }
-    objects_list = [_object_to_report_dict(obj) for obj, _ in rows]
+    plan = await master_plan_service.get_by_id(db, master_plan_id)
+    objects = await master_plan_service.list_objects_in_plan(db, master_plan_id)
+    plan_info = _plan_to_context_dict(plan)
+    objects_list = [_object_to_report_dict(obj) for obj in objects]
     return (plan_info, objects_list)
 
 
 async def generate_development_report(
-    db: AsyncSession, master_plan_id: int
+    master_plan_id: int,
+    assumptions: ReportAssumptions | None = None,
+    force: bool = False,
 ) -> dict[str, Any]:
-    """Build objects list, call LLM with analyst prompt, parse JSON, validate. Raises ValueError on parse/validation failure."""
-    if not settings.AI_API_KEY:
-        raise ValueError(ERROR_MESSAGE_AI_NOT_CONFIGURED)
+    """Build objects list, call LLM with analyst prompt, parse JSON, validate, and store the report
+    on the plan. Raises ValueError on parse/validation failure, NotFoundError if the plan is missing.
+
+    Baseline, population, needs and project counts are computed locally (report_needs_service)
+    and passed to the model, which only selects sites and writes phases; the computed blocks
+    replace whatever the model returns for them. Only pre-ranked candidate objects
+    (report_candidate_service) are listed, not the whole plan.
+
+    Reports are cached by a hash of their inputs (report_cache_service); force=True skips the
+    lookup and regenerates. A cache hit the plan already holds is returned without writing, so
+    repeated requests do not bump the master_plan data version.
+
+    Runs in three phases so no pooled connection is held while the model works: inputs are read
+    in a short session, the model is called with no session open, and the report is written in
+    a fresh transaction.
+    """
+    assumptions = assumptions or ReportAssumptions()
+    async with async_session_maker() as session:
+        cache_key = await report_cache_service.report_cache_key(
+            session, master_plan_id, assumptions
+        )
+        report = (
+            None
+            if force
+            else await report_cache_service.get_cached_report(session, cache_key)
+        )
+        if report is not None:
+            current = await session.scalar(
+                select(MasterPlan.ai_development_report).where(
+                    MasterPlan.id == master_plan_id
+                )
+            )
+            if current == report:
+                return report
+        else:
+            if not settings.AI_API_KEY:
+                raise ValueError(ERROR_MESSAGE_AI_NOT_CONFIGURED)
+            plan_info, objects_list = await build_report_context(
+                session, master_plan_id
+            )
+            baseline = await plan_baseline_service.get_plan_baseline(
+                session, master_plan_id
+            )
+
+    generated = report is None
+    if generated:
+        report = await _request_report(plan_info, objects_list, baseline, assumptions)
+
+    async with async_session_maker() as session:
+        if generated:
+            await report_cache_service.store_report(
+                session, cache_key, master_plan_id, assumptions, report
+            )
+        await master_plan_service.update_ai_development_report(
+            session, master_plan_id, report
+        )
+        await session.commit()
+    return report
 
-    plan_info, objects_list = await build_report_context(db, master_plan_id)
+
+async def _request_report(
+    plan_info: dict[str, Any],
+    objects_list: list[dict[str, Any]],
+    baseline: MasterPlanBaseline,
+    assumptions: ReportAssumptions,
+) -> dict[str, Any]:
+    """Compute needs and candidates, ask the model for the report and merge the computed blocks in."""
+    needs = report_needs_service.compute_needs(baseline, assumptions)
+    candidates = report_candidate_service.select_candidates(
+        objects_list, needs, assumptions
+    )
     master_plan_context_str = json.dumps(
         plan_info, ensure_ascii=False, separators=(",", ": ")
     )
-    list_of_objects_str = json.dumps(objects_list, ensure_ascii=False, indent=2)
-    prompt = build_report_prompt(master_plan_context_str, list_of_objects_str)
-
-    client = AsyncOpenAI(
-        base_url=settings.AI_BASE_URL,
-        api_key=settings.AI_API_KEY,
+    list_of_objects_str = json.dumps(candidates, ensure_ascii=False, indent=2)
+    precomputed_needs_str = json.dumps(needs, ensure_ascii=False, indent=2)
+    prompt = build_report_prompt(
+        master_plan_context_str, list_of_objects_str, precomputed_needs_str
     )
-    response = await client.chat.completions.create(
+
+    response = await ai_client.get().chat.completions.create(
         model=settings.AI_MODEL,
         messages=[
             {"role": "system", "content": REPORT_SYSTEM_MESSAGE},
@@ -198,18 +303,18 @@ async def generate_development_report(
         raise ValueError(f"Model did not return valid JSON: {e}") from e
 
     validate_report_top_level(report)
+    report["assumptions"] = needs["assumptions"]
+    report["baseline"] = needs["baseline"]
+    report["needs_15y"] = needs["needs_15y"]
+    questions = report["questions"] if isinstance(report["questions"], list) else []
+    report["questions"] = needs["questions"] + [
+        q for q in questions if q not in needs["questions"]
+    ]
     return report
 
 
-async def chat(body: ChatRequest, context: str) -> str:
-    if not settings.AI_API_KEY:
-        return ERROR_MESSAGE_AI_CHAT_NOT_CONFIGURED
-
-    client = AsyncOpenAI(
-        base_url=settings.AI_BASE_URL,
-        api_key=settings.AI_API_KEY,
-    )
-
+def _chat_messages(body: ChatRequest, context: str) -> list[dict[str, str]]:
+    """System prompt plus the conversation, with context prepended to the first user message."""
     system_parts = [CHAT_SYSTEM_PROMPT]
     if body.locale:
         system_parts.append(CHAT_LOCALE_INSTRUCTION_TEMPLATE.format(locale=body.locale))
@@ -226,12 +331,41 @@ async def chat(body: ChatRequest, context: str) -> str:
             first_user_seen = True
             content = f"Context (master plans and objects):\n{context}\n\nUser message:\n{content}"
         api_messages.append({"role": role, "content": content})
+    return api_messages
+
+
+async def chat(body: ChatRequest, context: str) -> str:
+    if not settings.AI_API_KEY:
+        return ERROR_MESSAGE_AI_CHAT_NOT_CONFIGURED
 
-    response = await client.chat.completions.create(
+    response = await ai_client.get().chat.completions.create(
         model=settings.AI_MODEL,
-        messages=api_messages,
+        messages=_chat_messages(body, context),
     )
     choice = response.choices[0] if response.choices else None
     if choice and choice.message and choice.message.content:
         return choice.message.content
     return ERROR_MESSAGE_NO_RESPONSE_FROM_MODEL
+
+
+async def chat_stream(body: ChatRequest, context: str) -> AsyncIterator[str]:
+    """Same as chat, but yields the answer in pieces as the model streams them (stream=True)."""
+    if not settings.AI_API_KEY:
+        yield ERROR_MESSAGE_AI_CHAT_NOT_CONFIGURED
+        return
+
+    stream = await ai_client.get().chat.completions.create(
+        model=settings.AI_MODEL,
+        messages=_chat_messages(body, context),
+        stream=True,
+    )
+    received = False
+    # Closes the upstream response also when the client disconnects mid-stream
+    async with stream:
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                received = True
+                yield delta
+    if not received:
+        yield ERROR_MESSAGE_NO_RESPONSE_FROM_MODEL
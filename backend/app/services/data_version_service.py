@@ -0,0 +1,40 @@
+"""Per-table data versions (data_version table) for conditional GET."""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.data_version import DataVersion
+
+
+async def bump(db: AsyncSession, *table_names: str) -> None:
+    """Increment the version of each table. Runs in the caller's transaction, so it commits with the write."""
+    stmt = insert(DataVersion).values(
+        [{"table_name": name, "version": 1} for name in table_names]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DataVersion.table_name],
+        set_={"version": DataVersion.version + 1, "updated_at": func.now()},
+    )
+    await db.execute(stmt)
+
+
+async def get_versions(
+    db: AsyncSession, table_names: Sequence[str]
+) -> tuple[dict[str, int], datetime | None]:
+    """Current version per table (0 if never written) and the latest change time across them."""
+    result = await db.execute(
+        select(
+            DataVersion.table_name, DataVersion.version, DataVersion.updated_at
+        ).where(DataVersion.table_name.in_(table_names))
+    )
+    versions = dict.fromkeys(table_names, 0)
+    last_modified: datetime | None = None
+    for name, version, updated_at in result.all():
+        versions[name] = version
+        if last_modified is None or updated_at > last_modified:
+            last_modified = updated_at
+    return (versions, last_modified)
@@ -1,13 +1,14 @@
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.function_type import FunctionType
 from app.schemas.function_type import FunctionTypeResponse
+from app.services.type_lookup_service import type_lookups
 
 
 async def list_function_types(db: AsyncSession) -> list[FunctionType]:
-    result = await db.execute(select(FunctionType).order_by(FunctionType.code))
-    return list(result.scalars().all())
+    """Served from the in-process lookup cache (reloaded when the table's data version changes)."""
+    await type_lookups.ensure_fresh(db)
+    return type_lookups.function_types
 
 
 def function_type_to_response(ft: FunctionType) -> FunctionTypeResponse:
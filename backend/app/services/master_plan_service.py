@@ -1,15 +1,22 @@
+from collections.abc import AsyncIterator
 from typing import Any
 
-from geoalchemy2.functions import ST_Area, ST_Within
+from geoalchemy2.functions import ST_Area
 from geoalchemy2.types import Geography
-from sqlalchemy import cast, select
+from sqlalchemy import Select, cast, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import with_expression
 
-from app.constants import ERROR_MESSAGE_MASTER_PLAN_NOT_FOUND
+from app.constants import ERROR_MESSAGE_MASTER_PLAN_NOT_FOUND, STREAM_BATCH_SIZE
 from app.core.exceptions import NotFoundError
-from app.core.geography import geojson_to_wkb, geom_to_geojson
+from app.core.geography import (
+    geojson_expression,
+    geojson_text_to_dict,
+    geojson_to_wkb,
+    geom_to_geojson,
+)
 from app.models.master_plan import MasterPlan
+from app.models.master_plan_object import MasterPlanObject
 from app.models.object import Object
 from app.models.user import User
 from app.schemas.master_plan import (
@@ -17,11 +24,13 @@ from app.schemas.master_plan import (
     MasterPlanResponse,
     MasterPlanUpdate,
 )
-from app.services.object_service import _AREA_M2 as _OBJECT_AREA_M2
-
-_PLAN_AREA_M2 = ST_Area(cast(MasterPlan.geometry, Geography(srid=4326))).label(
-    "area_m2"
+from app.services import (
+    data_version_service,
+    object_service,
+    plan_membership_service,
 )
+from app.services.type_lookup_service import type_lookups
+from app.utils.json_response import json_fragment
 
 # Default boundary polygon for new master plans (slightly larger square near Tashkent)
 DEFAULT_PLAN_GEOMETRY: dict[str, Any] = {
@@ -37,52 +46,75 @@ DEFAULT_PLAN_GEOMETRY: dict[str, Any] = {
     ],
 }
 
+# Loader option: select ST_AsGeoJSON(geometry) into MasterPlan.geometry_geojson
+_WITH_GEOJSON = with_expression(
+    MasterPlan.geometry_geojson, geojson_expression(MasterPlan.geometry)
+)
+
+
+def plan_geojson(plan: MasterPlan) -> dict[str, Any] | None:
+    if plan.geometry_geojson is not None:
+        return geojson_text_to_dict(plan.geometry_geojson)
+    return geom_to_geojson(plan.geometry)
+
+
+def _plan_values(plan: MasterPlan, geometry: Any) -> dict[str, Any]:
+    return {
+        "name": plan.name,
+        "id": plan.id,
+        "created_at": plan.created_at,
+        "created_by": plan.created_by,
+        "updated_at": plan.updated_at,
+        "updated_by": plan.updated_by,
+        "geometry": geometry,
+        "area_m2": round(plan.area_m2, 2) if plan.area_m2 is not None else None,
+        "ai_development_report": plan.ai_development_report,
+    }
+
+
+def plan_to_response(plan: MasterPlan) -> MasterPlanResponse:
+    return MasterPlanResponse.model_validate(_plan_values(plan, plan_geojson(plan)))
 
-def plan_to_response(
-    plan: MasterPlan, area_m2: float | None = None
-) -> MasterPlanResponse:
-    rounded_area = round(area_m2, 2) if area_m2 is not None else None
-    return MasterPlanResponse.model_validate(
-        {
-            "id": plan.id,
-            "name": plan.name,
-            "geometry": geom_to_geojson(plan.geometry),
-            "created_at": plan.created_at,
-            "created_by": plan.created_by,
-            "updated_at": plan.updated_at,
-            "updated_by": plan.updated_by,
-            "area_m2": rounded_area,
-            "ai_development_report": plan.ai_development_report,
-        }
+
+def plan_to_json_row(plan: MasterPlan) -> dict[str, Any]:
+    """MasterPlanResponse-shaped dict (same keys and order) for FastJSONResponse, without Pydantic validation."""
+    if plan.geometry_geojson is not None:
+        return _plan_values(plan, json_fragment(plan.geometry_geojson))
+    return _plan_values(plan, geom_to_geojson(plan.geometry))
+
+
+async def _store_area(db: AsyncSession, master_plan_id: int) -> None:
+    """Compute the geodesic area once per geometry write; reads use the stored column."""
+    await db.execute(
+        update(MasterPlan)
+        .where(MasterPlan.id == master_plan_id)
+        .values(area_m2=ST_Area(cast(MasterPlan.geometry, Geography(srid=4326))))
+        .execution_options(synchronize_session=False)
     )
 
 
-async def list_master_plans(
-    db: AsyncSession,
-) -> list[tuple[MasterPlan, float | None]]:
+async def list_master_plans(db: AsyncSession) -> list[MasterPlan]:
     result = await db.execute(
-        select(MasterPlan, _PLAN_AREA_M2).order_by(MasterPlan.updated_at.desc())
+        select(MasterPlan).options(_WITH_GEOJSON).order_by(MasterPlan.updated_at.desc())
     )
-    return [(row[0], row[1]) for row in result.all()]
+    return list(result.scalars().all())
 
 
-async def get_by_id(
-    db: AsyncSession, master_plan_id: int
-) -> tuple[MasterPlan, float | None]:
+async def get_by_id(db: AsyncSession, master_plan_id: int) -> MasterPlan:
     result = await db.execute(
-        select(MasterPlan, _PLAN_AREA_M2).where(MasterPlan.id == master_plan_id)
+        select(MasterPlan).where(MasterPlan.id == master_plan_id).options(_WITH_GEOJSON)
     )
-    row = result.one_or_none()
-    if row is None:
+    plan = result.scalar_one_or_none()
+    if plan is None:
         raise NotFoundError(ERROR_MESSAGE_MASTER_PLAN_NOT_FOUND)
-    return (row[0], row[1])
+    return plan
 
 
 async def create_master_plan(
     db: AsyncSession,
     body: MasterPlanCreate,
     current_user: User | None = None,
-) -> tuple[MasterPlan, float | None]:
+) -> MasterPlan:
     geometry = body.geometry if body.geometry is not None else DEFAULT_PLAN_GEOMETRY
     user_id = current_user.id if current_user else None
     plan = MasterPlan(
@@ -93,36 +125,61 @@ async def create_master_plan(
     )
     db.add(plan)
     await db.flush()
+    await _store_area(db, plan.id)
+    await plan_membership_service.refresh_plan_membership(db, plan.id)
+    await data_version_service.bump(db, "master_plan")
     await db.refresh(plan)
-    result = await db.execute(select(_PLAN_AREA_M2).where(MasterPlan.id == plan.id))
-    row = result.one_or_none()
-    return (plan, row[0] if row else None)
+    return plan
+
+
+def _objects_in_plan_query(
+    master_plan_id: int, fields: list[str] | None = None
+) -> Select:
+    if fields is None:
+        q = select(Object).options(object_service.WITH_GEOJSON)
+    else:
+        q = object_service.sparse_object_select(fields)
+    return (
+        q.join(MasterPlanObject, MasterPlanObject.object_id == Object.id)
+        .where(MasterPlanObject.master_plan_id == master_plan_id)
+        .order_by(Object.updated_at.desc())
+    )
 
 
 async def list_objects_in_plan(
     db: AsyncSession,
     master_plan_id: int,
-) -> list[tuple[Object, float | None]]:
+) -> list[Object]:
     await get_by_id(db, master_plan_id)  # ensure plan exists
-    plan_geom_subq = (
-        select(MasterPlan.geometry)
-        .where(MasterPlan.id == master_plan_id)
-        .scalar_subquery()
-    )
-    q = (
-        select(Object, _OBJECT_AREA_M2)
-        .where(
-            Object.geometry.isnot(None),
-            ST_Within(Object.geometry, plan_geom_subq),
-        )
-        .options(
-            selectinload(Object.object_type),
-            selectinload(Object.function_type),
-        )
-        .order_by(Object.updated_at.desc())
+    await type_lookups.ensure_fresh(db)
+    result = await db.execute(_objects_in_plan_query(master_plan_id))
+    return list(result.scalars().all())
+
+
+async def list_object_fields_in_plan(
+    db: AsyncSession,
+    master_plan_id: int,
+    fields: list[str],
+) -> list[dict[str, Any]]:
+    """Sparse variant of list_objects_in_plan: only `fields` are selected."""
+    await get_by_id(db, master_plan_id)  # ensure plan exists
+    await type_lookups.ensure_fresh(db)
+    result = await db.execute(_objects_in_plan_query(master_plan_id, fields))
+    return [object_service.sparse_row_to_dict(row, fields) for row in result.all()]
+
+
+async def stream_objects_in_plan(
+    db: AsyncSession,
+    master_plan_id: int,
+) -> AsyncIterator[Object]:
+    """Yield objects in plan through a server-side cursor. Caller checks that the plan exists."""
+    await type_lookups.ensure_fresh(db)
+    q = _objects_in_plan_query(master_plan_id).execution_options(
+        yield_per=STREAM_BATCH_SIZE
     )
-    result = await db.execute(q)
-    return [(row[0], row[1]) for row in result.unique().all()]
+    result = await db.stream_scalars(q)
+    async for obj in result:
+        yield obj
 
 
 async def update_master_plan(
@@ -130,8 +187,8 @@ async def update_master_plan(
     master_plan_id: int,
     body: MasterPlanUpdate,
     current_user: User | None = None,
-) -> tuple[MasterPlan, float | None]:
-    plan, _ = await get_by_id(db, master_plan_id)
+) -> MasterPlan:
+    plan = await get_by_id(db, master_plan_id)
     if body.name is not None:
         plan.name = body.name
     if body.geometry is not None:
@@ -139,18 +196,21 @@ async def update_master_plan(
     if current_user is not None:
         plan.updated_by = current_user.id
     await db.flush()
+    if body.geometry is not None:
+        await _store_area(db, plan.id)
+        await plan_membership_service.refresh_plan_membership(db, plan.id)
+    await data_version_service.bump(db, "master_plan")
     await db.refresh(plan)
-    result = await db.execute(select(_PLAN_AREA_M2).where(MasterPlan.id == plan.id))
-    row = result.one_or_none()
-    return (plan, row[0] if row else None)
+    return plan
 
 
 async def delete_master_plan(
     db: AsyncSession,
     master_plan_id: int,
 ) -> None:
-    plan, _ = await get_by_id(db, master_plan_id)
+    plan = await get_by_id(db, master_plan_id)
     await db.delete(plan)
+    await data_version_service.bump(db, "master_plan")
 
 
 async def update_ai_development_report(
@@ -159,8 +219,9 @@ async def update_ai_development_report(
     report: dict[str, Any],
 ) -> MasterPlan:
     """Update master plan ai_development_report and return the plan."""
-    plan, _ = await get_by_id(db, master_plan_id)
+    plan = await get_by_id(db, master_plan_id)
     plan.ai_development_report = report
     await db.flush()
+    await data_version_service.bump(db, "master_plan")
     await db.refresh(plan)
     return plan
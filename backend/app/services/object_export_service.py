@@ -0,0 +1,160 @@
+"""Columnar export of the object table: GeoParquet and FlatGeobuf.
+
+Rows are read through a server-side cursor EXPORT_BATCH_SIZE at a time and converted to
+typed Arrow record batches (int32 capacities, bool flags, float64 risk score, WKB geometry),
+so memory stays bounded by one batch regardless of table size.
+
+GeoParquet is written batch by batch with pyarrow. FlatGeobuf needs every feature before it
+can write its packed R-tree, so batches are first spooled to an Arrow IPC file on disk and then
+handed to GDAL (pyogrio) as one stream. Arrow conversion and file writes run in worker threads.
+"""
+
+import asyncio
+import json
+import tempfile
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Literal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyogrio
+import sqlalchemy as sa
+from geoalchemy2 import Geometry
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import EXPORT_BATCH_SIZE
+from app.models.function_type import FunctionType
+from app.models.object import Object
+from app.models.object_type import ObjectType
+
+ExportFormat = Literal["parquet", "fgb"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "parquet": "application/vnd.apache.parquet",
+    "fgb": "application/flatgeobuf",
+}
+EXPORT_SUFFIXES: dict[str, str] = {"parquet": ".parquet", "fgb": ".fgb"}
+
+# Scalar object columns in export order; type codes and WKB geometry follow
+_SCALAR_COLUMNS = [
+    c for c in Object.__table__.columns if not isinstance(c.type, Geometry)
+]
+
+
+def _arrow_type(column_type: sa.types.TypeEngine) -> pa.DataType:
+    if isinstance(column_type, sa.BigInteger):
+        return pa.int64()
+    if isinstance(column_type, sa.Integer):
+        return pa.int32()
+    if isinstance(column_type, sa.Boolean):
+        return pa.bool_()
+    if isinstance(column_type, sa.Float):
+        return pa.float64()
+    if isinstance(column_type, sa.DateTime):
+        return pa.timestamp("us", tz="UTC")
+    return pa.string()
+
+
+def _arrow_schema() -> pa.Schema:
+    fields = [
+        pa.field(c.name, _arrow_type(c.type), nullable=c.nullable)
+        for c in _SCALAR_COLUMNS
+    ]
+    fields.append(pa.field("object_type_code", pa.string(), nullable=False))
+    fields.append(pa.field("function_type_code", pa.string()))
+    fields.append(pa.field("geometry", pa.binary(), nullable=False))
+    return pa.schema(fields)
+
+
+def _geoparquet_metadata() -> bytes:
+    """GeoParquet 1.1 file metadata; no "crs" means OGC:CRS84 (lng/lat, i.e. SRID 4326 axis order)."""
+    return json.dumps(
+        {
+            "version": "1.1.0",
+            "primary_column": "geometry",
+            "columns": {"geometry": {"encoding": "WKB", "geometry_types": ["Point"]}},
+        }
+    ).encode()
+
+
+def _export_query() -> sa.Select:
+    return (
+        select(
+            *_SCALAR_COLUMNS,
+            ObjectType.code.label("object_type_code"),
+            FunctionType.code.label("function_type_code"),
+            func.ST_AsBinary(Object.geometry).label("geometry"),
+        )
+        .join(ObjectType, ObjectType.id == Object.object_type_id)
+        .outerjoin(FunctionType, FunctionType.id == Object.function_type_id)
+        .order_by(Object.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+
+async def _write_batches(
+    db: AsyncSession, schema: pa.Schema, write_batch: Callable[[pa.RecordBatch], None]
+) -> int:
+    """Stream the export query and pass each partition to write_batch as a RecordBatch.
+
+    Arrow conversion and write_batch (zstd compression for Parquet) are CPU-bound, so each
+    partition is handled in a worker thread; the event loop only awaits the cursor.
+    """
+    result = await db.stream(_export_query())
+    keys = list(result.keys())
+
+    def write_partition(partition: Sequence[sa.Row]) -> None:
+        columns = dict(zip(keys, zip(*partition)))
+        write_batch(
+            pa.record_batch(
+                [pa.array(columns[field.name], type=field.type) for field in schema],
+                schema=schema,
+            )
+        )
+
+    rows_written = 0
+    async for partition in result.partitions():
+        await asyncio.to_thread(write_partition, partition)
+        rows_written += len(partition)
+    return rows_written
+
+
+async def export_objects(db: AsyncSession, format: ExportFormat, path: Path) -> int:
+    """Write every object to path as GeoParquet or FlatGeobuf. Returns the number of rows."""
+    schema = _arrow_schema()
+    if format == "parquet":
+        schema = schema.with_metadata({b"geo": _geoparquet_metadata()})
+        writer = await asyncio.to_thread(
+            pq.ParquetWriter, path, schema, compression="zstd"
+        )
+        try:
+            return await _write_batches(db, schema, writer.write_batch)
+        finally:
+            await asyncio.to_thread(writer.close)
+
+    with tempfile.TemporaryDirectory() as spool_dir:
+        spool_path = Path(spool_dir) / "objects.arrow"
+        with pa.ipc.new_file(str(spool_path), schema) as writer:
+            rows_written = await _write_batches(db, schema, writer.write_batch)
+
+        def write_flatgeobuf() -> None:
+            with pa.memory_map(str(spool_path)) as source:
+                reader = pa.ipc.open_file(source)
+                pyogrio.write_arrow(
+                    pa.RecordBatchReader.from_batches(
+                        schema,
+                        (reader.get_batch(i) for i in range(reader.num_record_batches)),
+                    ),
+                    str(path),
+                    driver="FlatGeobuf",
+                    geometry_name="geometry",
+                    geometry_type="Point",
+                    crs="EPSG:4326",
+                    layer="object",
+                    SPATIAL_INDEX="YES",
+                )
+
+        await asyncio.to_thread(write_flatgeobuf)
+    return rows_written
@@ -0,0 +1,392 @@
+"""Bulk object import: CSV (seed format) or GeoJSON FeatureCollection, loaded with COPY.
+
+Rows are parsed one at a time from the uploaded file and sent to a temporary staging
+table with asyncpg copy_records_to_table in IMPORT_COPY_BATCH_SIZE batches, so memory
+stays bounded by one batch. File reads and parsing are blocking, so each batch is built in
+a worker thread and the event loop only awaits the COPY. A single set-based merge then creates missing object /
+function types, inserts the objects and their master plan memberships.
+
+Values are checked against the object column limits while parsing, and an object_id may
+appear only once per file; both raise ValueError (422) instead of a database error.
+"""
+
+import asyncio
+import codecs
+import csv
+import io
+import json
+from collections.abc import Callable, Iterator
+from typing import Any, BinaryIO
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import (
+    ERROR_MESSAGE_IMPORT_DUPLICATE_OBJECT_ID,
+    ERROR_MESSAGE_IMPORT_GEOJSON,
+    ERROR_MESSAGE_IMPORT_UNREADABLE,
+    ERROR_MESSAGE_IMPORT_VALUE,
+    IMPORT_COPY_BATCH_SIZE,
+)
+from app.models.function_type import FunctionType
+from app.models.object import Object
+from app.models.object_type import ObjectType
+from app.models.user import User
+from app.schemas.object import ObjectImportResponse
+from app.services import data_version_service
+from app.utils.seed_csv import (
+    function_type_name,
+    normalize_header,
+    object_type_name,
+    parse_bool_da_net,
+    parse_float,
+    parse_int,
+    parse_str,
+)
+
+_STAGING_TABLE = "object_import_staging"
+
+# Object attribute columns by staging type, in COPY order
+_TEXT_COLUMNS = (
+    "object_id",
+    "parcel_id",
+    "name",
+    "administrative_region",
+    "district",
+    "mahalla",
+    "address_full",
+    "data_source_reference",
+)
+_INT_COLUMNS = (
+    "capacity_people_max",
+    "student_capacity",
+    "bed_count",
+    "unit_count",
+    "distance_public_transport_m",
+    "distance_primary_road_m",
+    "parking_spaces_total",
+    "available_power_capacity_kw",
+)
+_BOOL_COLUMNS = (
+    "protected_zone",
+    "heritage_zone",
+    "flood_zone",
+    "power_connected",
+    "water_connected",
+    "sewer_connected",
+)
+_FLOAT_COLUMNS = ("environmental_risk_score",)
+_ATTRIBUTE_COLUMNS = _TEXT_COLUMNS + _INT_COLUMNS + _BOOL_COLUMNS + _FLOAT_COLUMNS
+# Column limits checked before staging (None: unbounded text)
+_TEXT_LENGTHS = {
+    "object_type_code": ObjectType.__table__.c.code.type.length,
+    "function_type_code": FunctionType.__table__.c.code.type.length,
+} | {c: Object.__table__.c[c].type.length for c in _TEXT_COLUMNS}
+_INT_MIN, _INT_MAX = -(2**31), 2**31 - 1  # PostgreSQL integer
+_STAGING_COLUMNS = (
+    "object_type_code",
+    "function_type_code",
+    "longitude",
+    "latitude",
+) + _ATTRIBUTE_COLUMNS
+
+
+def _row_to_record(row: dict[str, Any], number: int) -> tuple[Any, ...] | None:
+    """Staging record from one parsed row, or None if it has no object type or coordinates.
+
+    Raises ValueError naming the row number and column if a value does not fit its column.
+    """
+    object_type_code = (parse_str(row.get("object_type")) or "").lower()
+    longitude = parse_float(row.get("longitude"))
+    latitude = parse_float(row.get("latitude"))
+    if not object_type_code or longitude is None or latitude is None:
+        return None
+    function_type_code = (parse_str(row.get("function_type")) or "").lower() or None
+    values: list[Any] = [object_type_code, function_type_code, longitude, latitude]
+    values += [
+        parse_str(row.get("name") or row.get("name_ru")) or "Object"
+        if c == "name"
+        else parse_str(row.get(c))
+        for c in _TEXT_COLUMNS
+    ]
+    values += [parse_int(row.get(c)) for c in _INT_COLUMNS]
+    values += [parse_bool_da_net(row.get(c)) for c in _BOOL_COLUMNS]
+    values += [parse_float(row.get(c)) for c in _FLOAT_COLUMNS]
+    for column, value in zip(_STAGING_COLUMNS, values):
+        if value is None:
+            continue
+        if column in _TEXT_LENGTHS:
+            limit = _TEXT_LENGTHS[column]
+            fits = limit is None or len(value) <= limit
+        elif column in _INT_COLUMNS:
+            fits = _INT_MIN <= value <= _INT_MAX
+        else:
+            continue
+        if not fits:
+            raise ValueError(
+                ERROR_MESSAGE_IMPORT_VALUE.format(row=number, column=column)
+            )
+    return tuple(values)
+
+
+def iter_csv_rows(file: BinaryIO) -> Iterator[dict[str, str]]:
+    """Seed CSV layout: Russian header row, English header row, description row, then data."""
+    reader = csv.reader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    if next(reader, None) is None:  # Russian headers
+        return
+    headers = [normalize_header(h) for h in next(reader, [])]
+    next(reader, None)  # description row
+    for row in reader:
+        if any(cell.strip() for cell in row):
+            yield dict(zip(headers, row))
+
+
+def iter_geojson_rows(
+    file: BinaryIO, chunk_size: int = 1 << 16
+) -> Iterator[dict[str, Any]]:
+    """Features of a FeatureCollection, decoded one at a time (the document is never fully loaded).
+
+    Each row is the feature's properties plus longitude/latitude of its Point geometry;
+    object_type_code / function_type_code are accepted as aliases of object_type / function_type.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        chunk = file.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[position:] + utf8.decode(chunk, final=eof)
+        position = 0
+        return True
+
+    def skip(chars: str) -> str:
+        """Skip whitespace and the given separators; return the next significant character."""
+        nonlocal position
+        while True:
+            while position < len(buffer) and (
+                buffer[position].isspace() or buffer[position] in chars
+            ):
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                raise ValueError(ERROR_MESSAGE_IMPORT_GEOJSON)
+
+    def value() -> Any:
+        nonlocal position
+        skip("")
+        while True:
+            try:
+                result, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if not fill():
+                    raise ValueError(ERROR_MESSAGE_IMPORT_GEOJSON)
+                continue
+            if end == len(buffer) and not eof:
+                fill()  # a number may continue in the next chunk
+                continue
+            position = end
+            return result
+
+    if skip("") != "{":
+        raise ValueError(ERROR_MESSAGE_IMPORT_GEOJSON)
+    position += 1
+    while skip(",") != "}":
+        key = value()
+        if skip("") != ":":
+            raise ValueError(ERROR_MESSAGE_IMPORT_GEOJSON)
+        position += 1
+        if key != "features":
+            value()
+            continue
+        if skip("") != "[":
+            raise ValueError(ERROR_MESSAGE_IMPORT_GEOJSON)
+        position += 1
+        while skip(",") != "]":
+            feature = value()
+            if not isinstance(feature, dict):
+                raise ValueError(ERROR_MESSAGE_IMPORT_GEOJSON)
+            row = dict(feature.get("properties") or {})
+            row.setdefault("object_type", row.get("object_type_code"))
+            row.setdefault("function_type", row.get("function_type_code"))
+            geometry = feature.get("geometry") or {}
+            coordinates = geometry.get("coordinates") or []
+            if geometry.get("type") == "Point" and len(coordinates) >= 2:
+                row["longitude"], row["latitude"] = coordinates[0], coordinates[1]
+            yield row
+        position += 1
+
+
+async def _create_types(
+    db: AsyncSession,
+    model: type[ObjectType] | type[FunctionType],
+    staging_column: str,
+    name_for_code: Callable[[str], str],
+    current_user: User,
+) -> int:
+    """Insert the staged type codes that do not exist yet (named like the seed); return how many."""
+    codes = (
+        await db.scalars(
+            text(
+                f"SELECT DISTINCT {staging_column} FROM {_STAGING_TABLE} "
+                f"WHERE {staging_column} IS NOT NULL"
+            )
+        )
+    ).all()
+    if not codes:
+        return 0
+    stmt = (
+        insert(model)
+        .values(
+            [
+                {
+                    "code": code,
+                    "name": name_for_code(code),
+                    "created_by": current_user.id,
+                    "updated_by": current_user.id,
+                }
+                for code in codes
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=[model.code])
+        .returning(model.id)
+    )
+    return len((await db.execute(stmt)).all())
+
+
+def _record_batches(
+    rows: Iterator[dict[str, Any]],
+) -> Iterator[tuple[list[tuple[Any, ...]], int]]:
+    """Staging records in IMPORT_COPY_BATCH_SIZE batches, each with the number of rows skipped.
+
+    Raises ValueError for undecodable or malformed files (csv.Error, UnicodeDecodeError).
+    """
+    batch: list[tuple[Any, ...]] = []
+    skipped = 0
+    try:
+        for number, row in enumerate(rows, start=1):
+            record = _row_to_record(row, number)
+            if record is None:
+                skipped += 1
+                continue
+            batch.append(record)
+            if len(batch) >= IMPORT_COPY_BATCH_SIZE:
+                yield batch, skipped
+                batch, skipped = [], 0
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise ValueError(ERROR_MESSAGE_IMPORT_UNREADABLE.format(error=e)) from e
+    if batch or skipped:
+        yield batch, skipped
+
+
+async def import_objects(
+    db: AsyncSession,
+    rows: Iterator[dict[str, Any]],
+    current_user: User,
+) -> ObjectImportResponse:
+    """COPY rows into a temporary staging table, then merge into object in one statement.
+
+    Does not commit. When types were created, the caller reloads type_lookups after committing,
+    so the process-wide cache never holds codes from a transaction that rolls back.
+    """
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    asyncpg_connection = raw_connection.driver_connection
+    attribute_types = (
+        ["text"] * len(_TEXT_COLUMNS)
+        + ["integer"] * len(_INT_COLUMNS)
+        + ["boolean"] * len(_BOOL_COLUMNS)
+        + ["double precision"] * len(_FLOAT_COLUMNS)
+    )
+    column_definitions = ", ".join(
+        f"{name} {type_}"
+        for name, type_ in zip(
+            _STAGING_COLUMNS,
+            ["text", "text", "double precision", "double precision"] + attribute_types,
+        )
+    )
+    await db.execute(
+        text(
+            f"CREATE TEMPORARY TABLE {_STAGING_TABLE} ({column_definitions}) ON COMMIT DROP"
+        )
+    )
+
+    skipped = 0
+    batches = _record_batches(rows)
+    while (item := await asyncio.to_thread(next, batches, None)) is not None:
+        batch, batch_skipped = item
+        skipped += batch_skipped
+        if batch:
+            await asyncpg_connection.copy_records_to_table(
+                _STAGING_TABLE, records=batch, columns=_STAGING_COLUMNS
+            )
+
+    duplicate = await db.scalar(
+        text(
+            f"SELECT object_id FROM {_STAGING_TABLE} WHERE object_id IS NOT NULL "
+            "GROUP BY object_id HAVING count(*) > 1 LIMIT 1"
+        )
+    )
+    if duplicate is not None:
+        raise ValueError(
+            ERROR_MESSAGE_IMPORT_DUPLICATE_OBJECT_ID.format(object_id=duplicate)
+        )
+
+    params = {"user_id": current_user.id}
+    object_types_created = await _create_types(
+        db, ObjectType, "object_type_code", object_type_name, current_user
+    )
+    function_types_created = await _create_types(
+        db, FunctionType, "function_type_code", function_type_name, current_user
+    )
+    attributes = ", ".join(_ATTRIBUTE_COLUMNS)
+    staged_attributes = ", ".join(f"s.{c}" for c in _ATTRIBUTE_COLUMNS)
+    imported = (
+        await db.execute(
+            text(
+                f"""
+                WITH inserted AS (
+                    INSERT INTO object (
+                        object_type_id, function_type_id, geometry, {attributes},
+                        created_by, updated_by
+                    )
+                    SELECT ot.id, ft.id, ST_SetSRID(ST_MakePoint(s.longitude, s.latitude), 4326),
+                           {staged_attributes}, :user_id, :user_id
+                    FROM {_STAGING_TABLE} s
+                    JOIN object_type ot ON ot.code = s.object_type_code
+                    LEFT JOIN function_type ft ON ft.code = s.function_type_code
+                    RETURNING id, geometry
+                ),
+                membership AS (
+                    INSERT INTO master_plan_object (master_plan_id, object_id)
+                    SELECT mp.id, i.id
+                    FROM inserted i
+                    JOIN master_plan mp
+                      ON mp.geometry IS NOT NULL AND ST_Within(i.geometry, mp.geometry)
+                )
+                SELECT count(*) FROM inserted
+                """
+            ),
+            params,
+        )
+    ).scalar_one()
+
+    changed = ["object"]
+    if object_types_created:
+        changed.append("object_type")
+    if function_types_created:
+        changed.append("function_type")
+    await data_version_service.bump(db, *changed)
+    return ObjectImportResponse(
+        imported=imported,
+        skipped=skipped,
+        object_types_created=object_types_created,
+        function_types_created=function_types_created,
+    )
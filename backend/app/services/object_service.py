@@ -1,23 +1,71 @@
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
-from geoalchemy2.functions import ST_Area
+from geoalchemy2.functions import (
+    ST_Distance,
+    ST_GeomFromGeoJSON,
+    ST_Intersects,
+    ST_MakeEnvelope,
+    ST_MakePoint,
+    ST_SetSRID,
+    ST_X,
+    ST_Y,
+)
 from geoalchemy2.types import Geography
-from sqlalchemy import cast, select
+from sqlalchemy import (
+    Integer,
+    Row,
+    Select,
+    Text,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    select,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import with_expression
 
-from app.constants import ERROR_MESSAGE_OBJECT_NOT_FOUND
+from app.constants import (
+    CLUSTER_GRID_CELLS_PER_TILE,
+    ERROR_MESSAGE_BATCH_DUPLICATE_ID,
+    ERROR_MESSAGE_OBJECT_NOT_FOUND,
+    ERROR_MESSAGE_UNKNOWN_FIELDS,
+    NEAREST_CANDIDATE_FACTOR,
+    STREAM_BATCH_SIZE,
+)
 from app.core.exceptions import NotFoundError
 from app.core.geography import (
+    geojson_expression,
+    geojson_text_to_dict,
     geojson_to_wkb,
     geom_to_geojson,
     require_point_geojson,
 )
 from app.models.object import Object
 from app.models.user import User
-from app.schemas.object import ObjectCreate, ObjectResponse, ObjectUpdate
-
-_AREA_M2 = ST_Area(cast(Object.geometry, Geography(srid=4326))).label("area_m2")
+from app.schemas.object import (
+    ObjectBatchCreate,
+    ObjectBatchDelete,
+    ObjectBatchItemResult,
+    ObjectBatchOperation,
+    ObjectBatchUpdate,
+    ObjectClusterResponse,
+    ObjectCreate,
+    ObjectNearestResponse,
+    ObjectResponse,
+    ObjectUpdate,
+)
+from app.services import data_version_service, plan_membership_service
+from app.services.type_lookup_service import type_lookups
+from app.utils.json_response import json_fragment
 
 # Default point near Tashkent (lng, lat) for new objects without geometry
 DEFAULT_GEOMETRY: dict[str, Any] = {
@@ -25,81 +73,366 @@ DEFAULT_GEOMETRY: dict[str, Any] = {
     "coordinates": [69.279, 41.308],
 }
 
+# Field order of ObjectResponse JSON, reproduced by object_to_json_row
+_RESPONSE_FIELDS = tuple(ObjectResponse.model_fields)
+
+# Loader option: select ST_AsGeoJSON(geometry) into Object.geometry_geojson
+WITH_GEOJSON = with_expression(
+    Object.geometry_geojson, geojson_expression(Object.geometry)
+)
+
+
+def object_geojson(obj: Object) -> dict[str, Any] | None:
+    """GeoJSON of obj.geometry; uses the DB-encoded text when loaded WITH_GEOJSON, else decodes the WKB."""
+    if obj.geometry_geojson is not None:
+        return geojson_text_to_dict(obj.geometry_geojson)
+    return geom_to_geojson(obj.geometry)
+
+
+def object_area_m2(obj: Object) -> float | None:
+    """Objects are points (chk_object_point), so their area is 0; no geodesic ST_Area needed."""
+    return 0.0 if obj.geometry is not None else None
+
+
+def _object_values(obj: Object, geometry: Any) -> dict[str, Any]:
+    return {
+        "id": obj.id,
+        "object_type_id": obj.object_type_id,
+        "object_type_code": type_lookups.object_type_code(obj.object_type_id),
+        "function_type_id": obj.function_type_id,
+        "function_type_code": type_lookups.function_type_code(obj.function_type_id),
+        "parent_id": obj.parent_id,
+        "object_id": obj.object_id,
+        "parcel_id": obj.parcel_id,
+        "name": obj.name,
+        "administrative_region": obj.administrative_region,
+        "district": obj.district,
+        "mahalla": obj.mahalla,
+        "address_full": obj.address_full,
+        "capacity_people_max": obj.capacity_people_max,
+        "student_capacity": obj.student_capacity,
+        "bed_count": obj.bed_count,
+        "unit_count": obj.unit_count,
+        "distance_public_transport_m": obj.distance_public_transport_m,
+        "distance_primary_road_m": obj.distance_primary_road_m,
+        "parking_spaces_total": obj.parking_spaces_total,
+        "protected_zone": obj.protected_zone,
+        "heritage_zone": obj.heritage_zone,
+        "flood_zone": obj.flood_zone,
+        "environmental_risk_score": obj.environmental_risk_score,
+        "power_connected": obj.power_connected,
+        "available_power_capacity_kw": obj.available_power_capacity_kw,
+        "water_connected": obj.water_connected,
+        "sewer_connected": obj.sewer_connected,
+        "data_source_reference": obj.data_source_reference,
+        "created_by": obj.created_by,
+        "created_at": obj.created_at,
+        "updated_at": obj.updated_at,
+        "updated_by": obj.updated_by,
+        "geometry": geometry,
+        "area_m2": object_area_m2(obj),
+    }
+
 
-def object_to_response(obj: Object, area_m2: float | None = None) -> ObjectResponse:
-    rounded_area = round(area_m2, 2) if area_m2 is not None else None
-    return ObjectResponse.model_validate(
-        {
-            "id": obj.id,
-            "object_type_id": obj.object_type_id,
-            "object_type_code": obj.object_type.code if obj.object_type else None,
-            "function_type_id": obj.function_type_id,
-            "function_type_code": obj.function_type.code if obj.function_type else None,
-            "parent_id": obj.parent_id,
-            "object_id": obj.object_id,
-            "parcel_id": obj.parcel_id,
-            "name": obj.name,
-            "administrative_region": obj.administrative_region,
-            "district": obj.district,
-            "mahalla": obj.mahalla,
-            "address_full": obj.address_full,
-            "capacity_people_max": obj.capacity_people_max,
-            "student_capacity": obj.student_capacity,
-            "bed_count": obj.bed_count,
-            "unit_count": obj.unit_count,
-            "distance_public_transport_m": obj.distance_public_transport_m,
-            "distance_primary_road_m": obj.distance_primary_road_m,
-            "parking_spaces_total": obj.parking_spaces_total,
-            "protected_zone": obj.protected_zone,
-            "heritage_zone": obj.heritage_zone,
-            "flood_zone": obj.flood_zone,
-            "environmental_risk_score": obj.environmental_risk_score,
-            "power_connected": obj.power_connected,
-            "available_power_capacity_kw": obj.available_power_capacity_kw,
-            "water_connected": obj.water_connected,
-            "sewer_connected": obj.sewer_connected,
-            "data_source_reference": obj.data_source_reference,
-            "created_by": obj.created_by,
-            "created_at": obj.created_at,
-            "updated_at": obj.updated_at,
-            "updated_by": obj.updated_by,
-            "geometry": geom_to_geojson(obj.geometry),
-            "area_m2": rounded_area,
-        }
+def object_to_response(obj: Object) -> ObjectResponse:
+    """Build the response. Type codes come from type_lookups, so the caller must have awaited
+    type_lookups.ensure_fresh(db) in the same request (every loader in this module does)."""
+    return ObjectResponse.model_validate(_object_values(obj, object_geojson(obj)))
+
+
+def object_to_json_row(obj: Object) -> dict[str, Any]:
+    """ObjectResponse-shaped dict (same keys and order) for FastJSONResponse, without Pydantic validation.
+
+    Values come straight from typed ORM columns; DB-encoded GeoJSON is embedded as-is.
+    """
+    if obj.geometry_geojson is not None:
+        geometry = json_fragment(obj.geometry_geojson)
+    else:
+        geometry = geom_to_geojson(obj.geometry)
+    values = _object_values(obj, geometry)
+    return {name: values[name] for name in _RESPONSE_FIELDS}
+
+
+def object_to_feature(obj: Object) -> dict[str, Any]:
+    """GeoJSON Feature for one object: geometry plus all other ObjectResponse fields as properties."""
+    properties = object_to_json_row(obj)
+    geometry = properties.pop("geometry")
+    return {
+        "type": "Feature",
+        "id": obj.id,
+        "geometry": geometry,
+        "properties": properties,
+    }
+
+
+def object_to_nearest_response(obj: Object, distance_m: float) -> ObjectNearestResponse:
+    return ObjectNearestResponse(
+        **object_to_response(obj).model_dump(), distance_m=round(distance_m, 2)
     )
 
 
+def parse_object_fields(value: str) -> list[str]:
+    """Parse ?fields=a,b,c into ObjectResponse field names (order kept, duplicates dropped)."""
+    fields = list(dict.fromkeys(f.strip() for f in value.split(",") if f.strip()))
+    unknown = [f for f in fields if f not in ObjectResponse.model_fields]
+    if unknown:
+        raise ValueError(f"{ERROR_MESSAGE_UNKNOWN_FIELDS}: {', '.join(unknown)}")
+    if not fields:
+        raise ValueError(ERROR_MESSAGE_UNKNOWN_FIELDS)
+    return fields
+
+
+def _sparse_column(field: str) -> Any:
+    if field == "object_type_code":  # resolved from type_lookups in sparse_row_to_dict
+        return Object.object_type_id.label(field)
+    if field == "function_type_code":
+        return Object.function_type_id.label(field)
+    if field == "geometry":
+        return geojson_expression(Object.geometry).label(field)
+    if field == "area_m2":  # see object_area_m2
+        return case((Object.geometry.is_(None), None), else_=0.0).label(field)
+    return getattr(Object, field).label(field)
+
+
+def sparse_object_select(fields: list[str]) -> Select:
+    """SELECT of only the requested fields (plus id/updated_at for ordering and cursors).
+
+    Reads only the object table and never builds Object instances; type codes are
+    mapped from their ids in memory.
+    """
+    return select(
+        *(_sparse_column(f) for f in fields),
+        Object.id.label("_id"),
+        Object.updated_at.label("_updated_at"),
+    ).select_from(Object)
+
+
+def sparse_row_to_dict(row: Row[Any], fields: list[str]) -> dict[str, Any]:
+    """Row as a dict for FastJSONResponse; geometry stays the DB-encoded GeoJSON text."""
+    item = {f: row._mapping[f] for f in fields}
+    if "geometry" in item:
+        item["geometry"] = json_fragment(item["geometry"])
+    if "object_type_code" in item:
+        item["object_type_code"] = type_lookups.object_type_code(
+            item["object_type_code"]
+        )
+    if "function_type_code" in item:
+        item["function_type_code"] = type_lookups.function_type_code(
+            item["function_type_code"]
+        )
+    return item
+
+
+def _list_objects_query(
+    object_type_id: int | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+    fields: list[str] | None = None,
+) -> Select:
+    """Base list query, newest first. bbox filter is served by the GIST index ix_object_geometry."""
+    if fields is None:
+        q = select(Object).options(WITH_GEOJSON)
+    else:
+        q = sparse_object_select(fields)
+    q = q.order_by(Object.updated_at.desc(), Object.id.desc())
+    if object_type_id is not None:
+        q = q.where(Object.object_type_id == object_type_id)
+    if bbox is not None:
+        q = q.where(ST_Intersects(Object.geometry, ST_MakeEnvelope(*bbox, 4326)))
+    return q
+
+
 async def list_objects(
     db: AsyncSession,
     object_type_id: int | None = None,
-) -> list[tuple[Object, float | None]]:
+    bbox: tuple[float, float, float, float] | None = None,
+) -> list[Object]:
+    await type_lookups.ensure_fresh(db)
+    result = await db.execute(_list_objects_query(object_type_id, bbox))
+    return list(result.scalars().all())
+
+
+async def stream_objects(
+    db: AsyncSession,
+    object_type_id: int | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> AsyncIterator[Object]:
+    """Yield objects through a server-side cursor, STREAM_BATCH_SIZE at a time."""
+    await type_lookups.ensure_fresh(db)
+    q = _list_objects_query(object_type_id, bbox).execution_options(
+        yield_per=STREAM_BATCH_SIZE
+    )
+    result = await db.stream_scalars(q)
+    async for obj in result:
+        yield obj
+
+
+async def list_objects_page(
+    db: AsyncSession,
+    limit: int,
+    after: tuple[datetime, int] | None = None,
+    object_type_id: int | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> tuple[list[Object], tuple[datetime, int] | None]:
+    """Keyset page on (updated_at, id) after the given position. Returns (objects, next_after); next_after is None on the last page."""
+    await type_lookups.ensure_fresh(db)
+    q = _list_objects_query(object_type_id, bbox)
+    if after is not None:
+        q = q.where(tuple_(Object.updated_at, Object.id) < tuple_(*after))
+    result = await db.execute(q.limit(limit + 1))
+    objects = list(result.scalars().all())
+    if len(objects) <= limit:
+        return (objects, None)
+    objects = objects[:limit]
+    last = objects[-1]
+    return (objects, (last.updated_at, last.id))
+
+
+async def list_object_fields(
+    db: AsyncSession,
+    fields: list[str],
+    limit: int | None = None,
+    after: tuple[datetime, int] | None = None,
+    object_type_id: int | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> tuple[list[dict[str, Any]], tuple[datetime, int] | None]:
+    """Sparse variant of list_objects / list_objects_page: only `fields` are selected.
+
+    Without limit the full list is returned and next_after is None.
+    """
+    await type_lookups.ensure_fresh(db)
+    q = _list_objects_query(object_type_id, bbox, fields)
+    if after is not None:
+        q = q.where(tuple_(Object.updated_at, Object.id) < tuple_(*after))
+    if limit is not None:
+        q = q.limit(limit + 1)
+    result = await db.execute(q)
+    rows = list(result.all())
+    next_after = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_after = (rows[-1]._updated_at, rows[-1]._id)
+    return ([sparse_row_to_dict(row, fields) for row in rows], next_after)
+
+
+async def cluster_objects(
+    db: AsyncSession,
+    bbox: tuple[float, float, float, float],
+    zoom: int,
+    object_type_id: int | None = None,
+) -> list[ObjectClusterResponse]:
+    """Group objects in bbox into a zoom-dependent lng/lat grid.
+
+    One grouped query returns (cell, object type) buckets with count and mean position;
+    buckets are folded into per-cell clusters here. Cell size halves with each zoom level.
+    """
+    cell_size = 360.0 / (2**zoom) / CLUSTER_GRID_CELLS_PER_TILE
+    longitude = ST_X(Object.geometry)
+    latitude = ST_Y(Object.geometry)
+    cell_x = func.floor(longitude / cell_size).label("cell_x")
+    cell_y = func.floor(latitude / cell_size).label("cell_y")
     q = (
-        select(Object, _AREA_M2)
-        .options(
-            selectinload(Object.object_type),
-            selectinload(Object.function_type),
+        select(
+            cell_x,
+            cell_y,
+            Object.object_type_id,
+            func.count().label("count"),
+            func.sum(longitude).label("sum_longitude"),
+            func.sum(latitude).label("sum_latitude"),
+            func.min(Object.id).label("min_id"),
         )
-        .order_by(Object.updated_at.desc())
+        .where(ST_Intersects(Object.geometry, ST_MakeEnvelope(*bbox, 4326)))
+        .group_by(cell_x, cell_y, Object.object_type_id)
     )
     if object_type_id is not None:
         q = q.where(Object.object_type_id == object_type_id)
+    await type_lookups.ensure_fresh(db)
+    result = await db.execute(q)
+
+    cells: dict[tuple[int, int], dict[str, Any]] = {}
+    for cx, cy, type_id, count, sum_lng, sum_lat, min_id in result.all():
+        code = type_lookups.object_type_code(type_id) or str(type_id)
+        cell = cells.setdefault(
+            (cx, cy),
+            {"count": 0, "sum_lng": 0.0, "sum_lat": 0.0, "types": {}, "min_id": min_id},
+        )
+        cell["count"] += count
+        cell["sum_lng"] += sum_lng
+        cell["sum_lat"] += sum_lat
+        cell["types"][code] = cell["types"].get(code, 0) + count
+        cell["min_id"] = min(cell["min_id"], min_id)
+    return [
+        ObjectClusterResponse(
+            longitude=cell["sum_lng"] / cell["count"],
+            latitude=cell["sum_lat"] / cell["count"],
+            count=cell["count"],
+            object_type_counts=cell["types"],
+            object_id=cell["min_id"] if cell["count"] == 1 else None,
+        )
+        for cell in cells.values()
+    ]
+
+
+async def nearest_objects(
+    db: AsyncSession,
+    longitude: float,
+    latitude: float,
+    k: int,
+    object_type_id: int | None = None,
+    function_type_id: int | None = None,
+) -> list[tuple[Object, float]]:
+    """k closest objects to (longitude, latitude) with geodesic distance in meters, nearest first.
+
+    The inner query walks ix_object_geometry with the KNN operator (<->, planar degrees)
+    for k * NEAREST_CANDIDATE_FACTOR candidates; the outer query re-ranks them by
+    geodesic distance so longitude/latitude scale differences do not skew the order.
+    """
+    point = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)
+    candidates = select(Object.id).where(Object.geometry.isnot(None))
+    if object_type_id is not None:
+        candidates = candidates.where(Object.object_type_id == object_type_id)
+    if function_type_id is not None:
+        candidates = candidates.where(Object.function_type_id == function_type_id)
+    candidates = candidates.order_by(Object.geometry.distance_centroid(point)).limit(
+        k * NEAREST_CANDIDATE_FACTOR
+    )
+    distance_m = ST_Distance(
+        cast(Object.geometry, Geography(srid=4326)),
+        cast(point, Geography(srid=4326)),
+    ).label("distance_m")
+    q = (
+        select(Object, distance_m)
+        .where(Object.id.in_(candidates.scalar_subquery()))
+        .options(WITH_GEOJSON)
+        .order_by(distance_m, Object.id)
+        .limit(k)
+    )
+    await type_lookups.ensure_fresh(db)
     result = await db.execute(q)
     return [(row[0], row[1]) for row in result.all()]
 
 
-async def get_by_id(db: AsyncSession, object_id: int) -> tuple[Object, float | None]:
+async def get_by_id(db: AsyncSession, object_id: int) -> Object:
+    await type_lookups.ensure_fresh(db)
     result = await db.execute(
-        select(Object, _AREA_M2)
-        .where(Object.id == object_id)
-        .options(
-            selectinload(Object.object_type),
-            selectinload(Object.function_type),
-        )
+        select(Object).where(Object.id == object_id).options(WITH_GEOJSON)
+    )
+    obj = result.scalar_one_or_none()
+    if obj is None:
+        raise NotFoundError(ERROR_MESSAGE_OBJECT_NOT_FOUND)
+    return obj
+
+
+async def get_object_fields(
+    db: AsyncSession, object_id: int, fields: list[str]
+) -> dict[str, Any]:
+    await type_lookups.ensure_fresh(db)
+    result = await db.execute(
+        sparse_object_select(fields).where(Object.id == object_id)
     )
     row = result.one_or_none()
     if row is None:
         raise NotFoundError(ERROR_MESSAGE_OBJECT_NOT_FOUND)
-    return (row[0], row[1])
+    return sparse_row_to_dict(row, fields)
 
 
 def _apply_object_create(obj: Object, body: ObjectCreate) -> None:
@@ -112,7 +445,7 @@ async def create_object(
     db: AsyncSession,
     body: ObjectCreate,
     current_user: User,
-) -> tuple[Object, float | None]:
+) -> Object:
     geometry = body.geometry if body.geometry is not None else DEFAULT_GEOMETRY
     require_point_geojson(geometry)
     obj = Object(
@@ -123,16 +456,11 @@ async def create_object(
     _apply_object_create(obj, body)
     db.add(obj)
     await db.flush()
-    result = await db.execute(
-        select(Object, _AREA_M2)
-        .where(Object.id == obj.id)
-        .options(
-            selectinload(Object.object_type),
-            selectinload(Object.function_type),
-        )
-    )
-    row = result.one()
-    return (row[0], row[1])
+    await plan_membership_service.refresh_object_membership(db, obj.id)
+    await data_version_service.bump(db, "object")
+    await type_lookups.ensure_fresh(db)
+    await db.refresh(obj)
+    return obj
 
 
 def _apply_object_update(obj: Object, body: ObjectUpdate) -> None:
@@ -149,22 +477,16 @@ async def update_object(
     object_id: int,
     body: ObjectUpdate,
     current_user: User,
-) -> tuple[Object, float | None]:
-    obj, _ = await get_by_id(db, object_id)
+) -> Object:
+    obj = await get_by_id(db, object_id)
     obj.updated_by = current_user.id
     _apply_object_update(obj, body)
     await db.flush()
+    if body.geometry is not None:
+        await plan_membership_service.refresh_object_membership(db, obj.id)
+    await data_version_service.bump(db, "object")
     await db.refresh(obj)
-    result = await db.execute(
-        select(Object, _AREA_M2)
-        .where(Object.id == obj.id)
-        .options(
-            selectinload(Object.object_type),
-            selectinload(Object.function_type),
-        )
-    )
-    row = result.one()
-    return (row[0], row[1])
+    return obj
 
 
 async def delete_object(
@@ -176,4 +498,154 @@ async def delete_object(
     obj = result.scalar_one_or_none()
     if obj is None:
         raise NotFoundError(ERROR_MESSAGE_OBJECT_NOT_FOUND)
-    await db.delete(obj)
+    await db.delete(obj)  # master_plan_object rows go with it (ON DELETE CASCADE)
+    await data_version_service.bump(db, "object")
+
+
+async def _batch_update(
+    db: AsyncSession,
+    field_names: tuple[str, ...],
+    ops: list[tuple[ObjectBatchUpdate, dict[str, Any]]],
+    current_user: User,
+) -> set[int]:
+    """UPDATE object SET ... FROM (VALUES ...) for updates that change the same fields. Returns updated ids."""
+    columns = [name for name in field_names if name != "geometry"]
+    value_columns = [column("id", Integer)] + [
+        column(name, Object.__table__.c[name].type) for name in columns
+    ]
+    if "geometry" in field_names:
+        value_columns.append(column("geometry", Text))
+    rows = []
+    for op, data in ops:
+        row = [op.id] + [data[name] for name in columns]
+        if "geometry" in field_names:
+            row.append(json.dumps(data["geometry"]))
+        rows.append(tuple(row))
+    batch = values(*value_columns, name="batch").data(rows)
+    # Cast: a column that is NULL in every VALUES row would otherwise resolve to text
+    assignments: dict[str, Any] = {
+        name: cast(batch.c[name], Object.__table__.c[name].type) for name in columns
+    }
+    if "geometry" in field_names:
+        assignments["geometry"] = ST_SetSRID(ST_GeomFromGeoJSON(batch.c.geometry), 4326)
+    assignments["updated_by"] = current_user.id
+    result = await db.execute(
+        update(Object)
+        .where(Object.id == batch.c.id)
+        .values(**assignments)
+        .returning(Object.id)
+        .execution_options(synchronize_session=False)
+    )
+    return set(result.scalars().all())
+
+
+async def apply_object_batch(
+    db: AsyncSession,
+    operations: list[ObjectBatchOperation],
+    current_user: User,
+) -> list[ObjectBatchItemResult]:
+    """Apply create/update/delete operations in the caller's transaction with set-based statements.
+
+    One DELETE ... RETURNING, one UPDATE ... FROM (VALUES ...) per distinct set of changed
+    fields, one multi-row INSERT ... RETURNING, then one membership refresh and one SELECT
+    for the returned objects. Updates/deletes of missing ids are reported per item.
+    """
+    targeted = [op.id for op in operations if not isinstance(op, ObjectBatchCreate)]
+    if len(targeted) != len(set(targeted)):
+        raise ValueError(ERROR_MESSAGE_BATCH_DUPLICATE_ID)
+
+    deleted: set[int] = set()
+    delete_ids = [op.id for op in operations if isinstance(op, ObjectBatchDelete)]
+    if delete_ids:
+        # master_plan_object rows go with them (ON DELETE CASCADE)
+        result = await db.execute(
+            delete(Object).where(Object.id.in_(delete_ids)).returning(Object.id)
+        )
+        deleted = set(result.scalars().all())
+
+    updated: set[int] = set()
+    moved: set[int] = set()
+    groups: dict[tuple[str, ...], list[tuple[ObjectBatchUpdate, dict[str, Any]]]] = {}
+    for op in operations:
+        if isinstance(op, ObjectBatchUpdate):
+            data = op.object.model_dump(exclude_unset=True)
+            if data.get("geometry") is None:
+                data.pop(
+                    "geometry", None
+                )  # as in update_object: null geometry is ignored
+            groups.setdefault(tuple(sorted(data)), []).append((op, data))
+    for field_names, group in groups.items():
+        ids = await _batch_update(db, field_names, group, current_user)
+        updated |= ids
+        if "geometry" in field_names:
+            moved |= ids
+
+    created_ids: list[int] = []
+    creates = [op for op in operations if isinstance(op, ObjectBatchCreate)]
+    if creates:
+        rows = []
+        for op in creates:
+            geometry = (
+                op.object.geometry
+                if op.object.geometry is not None
+                else DEFAULT_GEOMETRY
+            )
+            require_point_geojson(geometry)
+            rows.append(
+                {
+                    **op.object.model_dump(exclude={"geometry"}),
+                    "geometry": geojson_to_wkb(geometry),
+                    "created_by": current_user.id,
+                    "updated_by": current_user.id,
+                }
+            )
+        result = await db.execute(
+            insert(Object).returning(Object.id, sort_by_parameter_order=True), rows
+        )
+        created_ids = list(result.scalars().all())
+        moved.update(created_ids)
+
+    await plan_membership_service.refresh_objects_membership(db, sorted(moved))
+    if deleted or updated or created_ids:
+        await data_version_service.bump(db, "object")
+
+    await type_lookups.ensure_fresh(db)
+    loaded: dict[int, Object] = {}
+    if updated or created_ids:
+        result = await db.execute(
+            select(Object)
+            .where(Object.id.in_([*created_ids, *updated]))
+            .options(WITH_GEOJSON)
+            .execution_options(populate_existing=True)
+        )
+        loaded = {obj.id: obj for obj in result.scalars().all()}
+
+    results: list[ObjectBatchItemResult] = []
+    created = iter(created_ids)
+    for index, op in enumerate(operations):
+        if isinstance(op, ObjectBatchCreate):
+            object_id = next(created)
+            item = ObjectBatchItemResult(
+                index=index,
+                op=op.op,
+                id=object_id,
+                object=object_to_response(loaded[object_id]),
+            )
+        elif isinstance(op, ObjectBatchUpdate) and op.id in updated:
+            item = ObjectBatchItemResult(
+                index=index,
+                op=op.op,
+                id=op.id,
+                object=object_to_response(loaded[op.id]),
+            )
+        elif isinstance(op, ObjectBatchDelete) and op.id in deleted:
+            item = ObjectBatchItemResult(index=index, op=op.op, id=op.id)
+        else:
+            item = ObjectBatchItemResult(
+                index=index,
+                op=op.op,
+                id=op.id,
+                error=ERROR_MESSAGE_OBJECT_NOT_FOUND,
+            )
+        results.append(item)
+    return results
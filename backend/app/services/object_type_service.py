@@ -1,13 +1,14 @@
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.object_type import ObjectType
 from app.schemas.object_type import ObjectTypeResponse
+from app.services.type_lookup_service import type_lookups
 
 
 async def list_object_types(db: AsyncSession) -> list[ObjectType]:
-    result = await db.execute(select(ObjectType).order_by(ObjectType.code))
-    return list(result.scalars().all())
+    """Served from the in-process lookup cache (reloaded when the table's data version changes)."""
+    await type_lookups.ensure_fresh(db)
+    return type_lookups.object_types
 
 
 def object_type_to_response(ot: ObjectType) -> ObjectTypeResponse:
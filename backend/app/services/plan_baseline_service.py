@@ -0,0 +1,108 @@
+"""Baseline inventory of a master plan (step 1 of DEVELOPMENT_REPORT_PROMPT), computed in SQL.
+
+All aggregates come from one query over the plan's objects, with FILTER clauses that apply
+the prompt's function_type / object_type rules. Results are cached in process, keyed by
+plan id and the object / master_plan data versions, so any write invalidates them.
+"""
+
+from sqlalchemy import ColumnElement, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import BASELINE_CACHE_SIZE, ERROR_MESSAGE_MASTER_PLAN_NOT_FOUND
+from app.core.cache import LRUCache
+from app.core.exceptions import NotFoundError
+from app.models.function_type import FunctionType
+from app.models.master_plan import MasterPlan
+from app.models.master_plan_object import MasterPlanObject
+from app.models.object import Object
+from app.models.object_type import ObjectType
+from app.schemas.master_plan import MasterPlanBaseline, MasterPlanBaselineCapacities
+from app.services import data_version_service
+
+_VERSION_TABLES = ("object", "master_plan")
+
+# Category rules from DEVELOPMENT_REPORT_PROMPT. School seats cover education_* except
+# kindergartens, which have their own total (otherwise they would be counted twice).
+IS_HOUSING: ColumnElement[bool] = or_(
+    FunctionType.code.contains("residential", autoescape=True),
+    FunctionType.code.contains("housing", autoescape=True),
+)
+IS_KINDERGARTEN: ColumnElement[bool] = FunctionType.code.startswith(
+    "education_kindergarten", autoescape=True
+)
+IS_SCHOOL: ColumnElement[bool] = (
+    FunctionType.code.startswith("education_", autoescape=True) & ~IS_KINDERGARTEN
+)
+IS_HOSPITAL: ColumnElement[bool] = FunctionType.code.startswith(
+    "health_hospital", autoescape=True
+)
+IS_CLINIC: ColumnElement[bool] = FunctionType.code.startswith(
+    "health_clinic", autoescape=True
+)
+IS_GREEN: ColumnElement[bool] = ObjectType.code == "green_space"
+
+_cache: LRUCache[tuple[int, tuple[int, ...]], MasterPlanBaseline] = LRUCache(
+    BASELINE_CACHE_SIZE
+)
+
+
+def _total(column: ColumnElement, where: ColumnElement[bool] | None = None):
+    aggregate = func.sum(column)
+    if where is not None:
+        aggregate = aggregate.filter(where)
+    return func.coalesce(aggregate, 0)
+
+
+_BASELINE_QUERY = (
+    select(
+        func.count(Object.id).label("objects_total"),
+        _total(Object.unit_count, IS_HOUSING).label("housing_units_total"),
+        _total(Object.student_capacity, IS_SCHOOL).label("school_seats_total"),
+        _total(Object.student_capacity, IS_KINDERGARTEN).label(
+            "kindergarten_seats_total"
+        ),
+        _total(Object.bed_count, IS_HOSPITAL).label("hospital_beds_total"),
+        _total(Object.capacity_people_max, IS_CLINIC).label("clinic_capacity_total"),
+        _total(Object.parking_spaces_total).label("parking_spaces_total"),
+        func.count(Object.id).filter(IS_GREEN).label("green_objects_total"),
+    )
+    .select_from(MasterPlanObject)
+    .join(Object, Object.id == MasterPlanObject.object_id)
+    .join(ObjectType, ObjectType.id == Object.object_type_id)
+    .outerjoin(FunctionType, FunctionType.id == Object.function_type_id)
+)
+
+
+async def get_plan_baseline(
+    db: AsyncSession, master_plan_id: int
+) -> MasterPlanBaseline:
+    versions, _ = await data_version_service.get_versions(db, _VERSION_TABLES)
+    key = (master_plan_id, tuple(versions[name] for name in _VERSION_TABLES))
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    exists = await db.scalar(
+        select(MasterPlan.id).where(MasterPlan.id == master_plan_id)
+    )
+    if exists is None:
+        raise NotFoundError(ERROR_MESSAGE_MASTER_PLAN_NOT_FOUND)
+    row = (
+        await db.execute(
+            _BASELINE_QUERY.where(MasterPlanObject.master_plan_id == master_plan_id)
+        )
+    ).one()
+    baseline = MasterPlanBaseline(
+        objects_total=row.objects_total,
+        housing_units_total=row.housing_units_total,
+        capacities=MasterPlanBaselineCapacities(
+            school_seats_total=row.school_seats_total,
+            kindergarten_seats_total=row.kindergarten_seats_total,
+            hospital_beds_total=row.hospital_beds_total,
+            clinic_capacity_total=row.clinic_capacity_total,
+            parking_spaces_total=row.parking_spaces_total,
+            green_objects_total=row.green_objects_total,
+        ),
+    )
+    _cache.set(key, baseline)
+    return baseline
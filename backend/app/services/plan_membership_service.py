@@ -0,0 +1,61 @@
+"""Maintain master_plan_object: which objects lie within which master plan (ST_Within).
+
+Writes recompute only the changed side: the written objects against all plan polygons,
+or one plan against all objects. Reads of plan objects then join on the table instead of
+evaluating the spatial predicate.
+"""
+
+from collections.abc import Sequence
+
+from geoalchemy2.functions import ST_Within
+from sqlalchemy import Select, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.master_plan import MasterPlan
+from app.models.master_plan_object import MasterPlanObject
+from app.models.object import Object
+
+
+def _membership_select() -> Select:
+    return select(MasterPlan.id, Object.id).where(
+        MasterPlan.geometry.isnot(None),
+        Object.geometry.isnot(None),
+        ST_Within(Object.geometry, MasterPlan.geometry),
+    )
+
+
+async def refresh_object_membership(db: AsyncSession, object_id: int) -> None:
+    """Recompute the plans containing one object (after create or geometry change)."""
+    await refresh_objects_membership(db, [object_id])
+
+
+async def refresh_objects_membership(
+    db: AsyncSession, object_ids: Sequence[int]
+) -> None:
+    """Recompute the plans containing each of object_ids, in two statements."""
+    if not object_ids:
+        return
+    await db.execute(
+        delete(MasterPlanObject).where(MasterPlanObject.object_id.in_(object_ids))
+    )
+    await db.execute(
+        insert(MasterPlanObject).from_select(
+            ["master_plan_id", "object_id"],
+            _membership_select().where(Object.id.in_(object_ids)),
+        )
+    )
+
+
+async def refresh_plan_membership(db: AsyncSession, master_plan_id: int) -> None:
+    """Recompute the objects inside one plan (after create or geometry change)."""
+    await db.execute(
+        delete(MasterPlanObject).where(
+            MasterPlanObject.master_plan_id == master_plan_id
+        )
+    )
+    await db.execute(
+        insert(MasterPlanObject).from_select(
+            ["master_plan_id", "object_id"],
+            _membership_select().where(MasterPlan.id == master_plan_id),
+        )
+    )
@@ -0,0 +1,116 @@
+"""Content-addressed cache of generated development reports (ai_report_cache table).
+
+The key hashes everything the report depends on: the plan id, name and geometry, every object
+row in the plan (hashed in SQL, so no rows are transferred), the report prompt text, the needs /
+candidate engine (REPORT_ENGINE_VERSION and candidate limits), the model name and the
+assumptions. Any change to one of them yields a new key; unchanged inputs hit the cache.
+
+Only the latest report per (plan, assumptions) is kept: storing a report replaces the entry
+for the same assumptions_key, so edits to a plan's objects do not accumulate stale rows.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import (
+    ERROR_MESSAGE_MASTER_PLAN_NOT_FOUND,
+    REPORT_CANDIDATES_MAX_PER_SERVICE,
+    REPORT_CANDIDATES_PER_SERVICE,
+    REPORT_ENGINE_VERSION,
+)
+from app.constants.prompts import DEVELOPMENT_REPORT_PROMPT, REPORT_SYSTEM_MESSAGE
+from app.core.config import settings
+from app.core.exceptions import NotFoundError
+from app.models.ai_report_cache import AiReportCache
+from app.schemas.ai import ReportAssumptions
+
+# Changes whenever the prompt template or system message text changes
+REPORT_PROMPT_VERSION = hashlib.sha256(
+    (DEVELOPMENT_REPORT_PROMPT + "\0" + REPORT_SYSTEM_MESSAGE).encode()
+).hexdigest()[:16]
+
+_PLAN_DIGEST_SQL = text(
+    """
+    SELECT encode(sha256(convert_to(concat_ws('|',
+        mp.name,
+        ST_AsEWKT(mp.geometry),
+        (
+            SELECT string_agg(md5(row_to_json(o)::text), ',' ORDER BY o.id)
+            FROM master_plan_object mpo
+            JOIN "object" o ON o.id = mpo.object_id
+            WHERE mpo.master_plan_id = mp.id
+        )
+    ), 'UTF8')), 'hex')
+    FROM master_plan mp
+    WHERE mp.id = :master_plan_id
+    """
+)
+
+
+def _digest(payload: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def assumptions_key(assumptions: ReportAssumptions) -> str:
+    """Identifies the report variant within a plan; one cache row is kept per plan and variant."""
+    return _digest(assumptions.model_dump())
+
+
+async def report_cache_key(
+    db: AsyncSession, master_plan_id: int, assumptions: ReportAssumptions
+) -> str:
+    plan_digest = await db.scalar(_PLAN_DIGEST_SQL, {"master_plan_id": master_plan_id})
+    if plan_digest is None:
+        raise NotFoundError(ERROR_MESSAGE_MASTER_PLAN_NOT_FOUND)
+    return _digest(
+        {
+            "master_plan_id": master_plan_id,
+            "plan": plan_digest,
+            "prompt": REPORT_PROMPT_VERSION,
+            "engine": [
+                REPORT_ENGINE_VERSION,
+                REPORT_CANDIDATES_PER_SERVICE,
+                REPORT_CANDIDATES_MAX_PER_SERVICE,
+            ],
+            "model": settings.AI_MODEL,
+            "assumptions": assumptions.model_dump(),
+        }
+    )
+
+
+async def get_cached_report(db: AsyncSession, cache_key: str) -> dict[str, Any] | None:
+    return await db.scalar(
+        select(AiReportCache.report).where(AiReportCache.cache_key == cache_key)
+    )
+
+
+async def store_report(
+    db: AsyncSession,
+    cache_key: str,
+    master_plan_id: int,
+    assumptions: ReportAssumptions,
+    report: dict[str, Any],
+) -> None:
+    """Store the report, replacing the plan's previous report for the same assumptions."""
+    stmt = insert(AiReportCache).values(
+        cache_key=cache_key,
+        master_plan_id=master_plan_id,
+        assumptions_key=assumptions_key(assumptions),
+        model=settings.AI_MODEL,
+        report=report,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AiReportCache.master_plan_id, AiReportCache.assumptions_key],
+        set_={
+            "cache_key": stmt.excluded.cache_key,
+            "model": stmt.excluded.model,
+            "report": stmt.excluded.report,
+            "created_at": stmt.excluded.created_at,
+        },
+    )
+    await db.execute(stmt)
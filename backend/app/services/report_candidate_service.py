@@ -0,0 +1,117 @@
+"""Site eligibility and candidate pre-ranking for the development report (step 6 of DEVELOPMENT_REPORT_PROMPT).
+
+Each object in the plan gets the prompt's BUILD_NOW / CONDITIONAL / REJECT status (per service
+type: zone restrictions only reject capital projects) and a global accessibility rank by
+distance to public transport plus primary road. Only the best REPORT_CANDIDATES_PER_SERVICE
+objects (three per needed project, at most REPORT_CANDIDATES_MAX_PER_SERVICE) per service type
+that needs new projects are sent to the model, so the prompt size no longer grows with the plan.
+"""
+
+import math
+from typing import Any
+
+from app.constants import (
+    REPORT_CANDIDATES_MAX_PER_SERVICE,
+    REPORT_CANDIDATES_PER_SERVICE,
+)
+from app.schemas.ai import ReportAssumptions
+
+BUILD_NOW = "BUILD_NOW"
+CONDITIONAL = "CONDITIONAL"
+REJECT = "REJECT"
+
+_ELIGIBILITY_ORDER = {BUILD_NOW: 0, CONDITIONAL: 1, REJECT: 2}
+
+# Service types of projects that are capital construction (zone restrictions reject them)
+CAPITAL_SERVICE_TYPES = frozenset(
+    {"school", "kindergarten", "clinic", "parking_multilevel"}
+)
+
+_ZONE_INTERVENTIONS = {
+    "protected_zone": "объект в охранной зоне",
+    "heritage_zone": "объект в зоне культурного наследия",
+    "flood_zone": "объект в зоне затопления",
+}
+_UTILITY_INTERVENTIONS = {
+    "power_connected": "подключение к электросети",
+    "water_connected": "подключение к водоснабжению",
+    "sewer_connected": "подключение к канализации",
+}
+INTERVENTION_POWER_CAPACITY = (
+    "усиление электрической мощности (available_power_capacity_kw пусто)"
+)
+INTERVENTION_ENV_RISK = "меры по снижению экологического риска или перенос (environmental_risk_score выше порога)"
+
+
+def assess_eligibility(
+    obj: dict[str, Any], assumptions: ReportAssumptions, capital: bool
+) -> tuple[str, list[str]]:
+    """(eligibility, required_interventions) for one report object dict."""
+    if capital:
+        zones = [text for key, text in _ZONE_INTERVENTIONS.items() if obj.get(key)]
+        if zones:
+            return (REJECT, zones)
+    interventions = [
+        text for key, text in _UTILITY_INTERVENTIONS.items() if not obj.get(key)
+    ]
+    if not obj.get("available_power_capacity_kw"):
+        interventions.append(INTERVENTION_POWER_CAPACITY)
+    risk = obj.get("environmental_risk_score")
+    if risk is not None and risk > assumptions.env_risk_max:
+        interventions.append(INTERVENTION_ENV_RISK)
+    return (CONDITIONAL if interventions else BUILD_NOW, interventions)
+
+
+def accessibility_distance(obj: dict[str, Any]) -> float:
+    """Transport + primary road distance in metres; unknown distances sort last."""
+    transport = obj.get("distance_public_transport_m")
+    road = obj.get("distance_primary_road_m")
+    if transport is None and road is None:
+        return math.inf
+    return (transport if transport is not None else road) + (
+        road if road is not None else transport
+    )
+
+
+def select_candidates(
+    objects: list[dict[str, Any]],
+    needs: dict[str, Any],
+    assumptions: ReportAssumptions,
+    per_service: int = REPORT_CANDIDATES_PER_SERVICE,
+    max_per_service: int = REPORT_CANDIDATES_MAX_PER_SERVICE,
+) -> list[dict[str, Any]]:
+    """Top candidates per service type with new_projects > 0, annotated for the prompt.
+
+    Each returned object gets accessibility_rank (1 = best in the plan) and, per service type
+    it is a candidate for, the eligibility and required_interventions under "candidate_for".
+    """
+    ranked = sorted(objects, key=lambda obj: (accessibility_distance(obj), obj["id"]))
+    accessibility_rank = {obj["id"]: rank for rank, obj in enumerate(ranked, start=1)}
+
+    selected: dict[int, dict[str, Any]] = {}
+    for summary in needs["needs_15y"]["projects_summary"]:
+        service_type = summary["service_type"]
+        if summary["new_projects"] <= 0:
+            continue
+        capital = service_type in CAPITAL_SERVICE_TYPES
+        assessed = [
+            (obj, *assess_eligibility(obj, assumptions, capital)) for obj in ranked
+        ]
+        assessed.sort(
+            key=lambda item: _ELIGIBILITY_ORDER[item[1]]
+        )  # stable: keeps rank order
+        limit = min(max(per_service, summary["new_projects"] * 3), max_per_service)
+        for obj, eligibility, interventions in assessed[:limit]:
+            candidate = selected.setdefault(
+                obj["id"],
+                {
+                    **obj,
+                    "accessibility_rank": accessibility_rank[obj["id"]],
+                    "candidate_for": {},
+                },
+            )
+            candidate["candidate_for"][service_type] = {
+                "eligibility": eligibility,
+                "required_interventions": interventions,
+            }
+    return sorted(selected.values(), key=lambda obj: obj["accessibility_rank"])
@@ -0,0 +1,183 @@
+"""Needs-and-gaps engine for the development report (steps 1–5 of DEVELOPMENT_REPORT_PROMPT).
+
+Population estimate, required capacities, gaps and ceil-based project counts are plain
+formulas over the plan baseline (plan_baseline_service, aggregated in SQL) and the
+assumptions block, so they are computed here instead of by the model. The result has the
+report's own shape and overwrites whatever the model returns for those blocks.
+
+As in the prompt's formulas, required capacities and gaps are computed from unrounded values;
+reported required/gap figures are rounded up (_ceil), so a gap is positive exactly when at
+least one project is needed (e.g. 900.4 required seats against 900 gives gap 1 and one school).
+"""
+
+import math
+from typing import Any
+
+from app.schemas.ai import ReportAssumptions
+from app.schemas.master_plan import MasterPlanBaseline
+
+QUESTION_POPULATION_UNKNOWN = (
+    "Нет жилых единиц и мощностей школ/детсадов/клиник: уточните население "
+    "или количество жилых единиц."
+)
+QUESTION_POPULATION_BASIS_TEMPLATE = (
+    "Население оценено по {basis}, а не по жилью: уточните фактическое население."
+)
+
+
+# Absorbs float noise such as 0.14 * 9000 = 1260.0000000000002 before rounding up
+_CEIL_TOLERANCE = 1e-9
+
+
+def _ceil(value: float) -> int:
+    return math.ceil(value - _CEIL_TOLERANCE)
+
+
+def estimate_population(
+    baseline: MasterPlanBaseline, assumptions: ReportAssumptions
+) -> tuple[float | None, str | None]:
+    """(population_estimated, basis) per step 2: housing first, then schools, kindergartens, clinics.
+
+    The housing estimate is exact (housing_units_total * avg_household_size); the capacity
+    fallbacks are rounded like the prompt's. basis names the fallback capacity used (for the
+    question to the user); None for housing.
+    """
+    capacities = baseline.capacities
+    if baseline.housing_units_total > 0:
+        return (
+            baseline.housing_units_total * assumptions.avg_household_size,
+            None,
+        )
+    if capacities.school_seats_total > 0:
+        return (
+            round(capacities.school_seats_total / assumptions.school_age_share),
+            "школам",
+        )
+    if capacities.kindergarten_seats_total > 0:
+        return (
+            round(
+                capacities.kindergarten_seats_total
+                / (
+                    assumptions.kindergarten_age_share
+                    * assumptions.kindergarten_coverage
+                )
+            ),
+            "детсадам",
+        )
+    if capacities.clinic_capacity_total > 0:
+        return (
+            round(
+                capacities.clinic_capacity_total
+                * assumptions.clinic_population_per_capacity
+            ),
+            "мощности клиник",
+        )
+    return (None, None)
+
+
+def _summary(service_type: str, new_projects: int, unit: str, per_project: int) -> dict:
+    return {
+        "service_type": service_type,
+        "new_projects": new_projects,
+        "capacity_added": {unit: new_projects * per_project},
+    }
+
+
+def compute_needs(
+    baseline: MasterPlanBaseline, assumptions: ReportAssumptions
+) -> dict[str, Any]:
+    """Report blocks assumptions, baseline, needs_15y and questions computed from the baseline."""
+    population, basis = estimate_population(baseline, assumptions)
+    capacities = baseline.capacities
+    questions: list[str] = []
+    if population is None:
+        questions.append(QUESTION_POPULATION_UNKNOWN)
+    elif basis is not None:
+        questions.append(QUESTION_POPULATION_BASIS_TEMPLATE.format(basis=basis))
+
+    required: dict[str, int | None] = dict.fromkeys(
+        ("school_seats", "kindergarten_seats", "parking_spaces", "green_objects")
+    )
+    gaps = {
+        "school_seats_gap": 0,
+        "kindergarten_seats_gap": 0,
+        "parking_spaces_gap": 0,
+        "green_objects_gap": 0,
+    }
+    new_clinics = 0
+    if population is not None:
+        housing_units = (
+            baseline.housing_units_total or population / assumptions.avg_household_size
+        )
+        exact_required = {
+            "school_seats": population * assumptions.school_age_share,
+            "kindergarten_seats": population
+            * assumptions.kindergarten_age_share
+            * assumptions.kindergarten_coverage,
+            "parking_spaces": housing_units * assumptions.parking_spaces_per_unit,
+            "green_objects": _ceil(
+                population / assumptions.park_rule_people_per_green_object
+            ),
+        }
+        required = {name: _ceil(value) for name, value in exact_required.items()}
+        exact_gaps = {
+            "school_seats_gap": exact_required["school_seats"]
+            - capacities.school_seats_total,
+            "kindergarten_seats_gap": exact_required["kindergarten_seats"]
+            - capacities.kindergarten_seats_total,
+            "parking_spaces_gap": exact_required["parking_spaces"]
+            - capacities.parking_spaces_total,
+            "green_objects_gap": exact_required["green_objects"]
+            - capacities.green_objects_total,
+        }
+        gaps = {name: max(0, _ceil(value)) for name, value in exact_gaps.items()}
+        if (
+            capacities.clinic_capacity_total == 0
+            and population > assumptions.clinic_population_threshold
+        ):
+            new_clinics = 1
+
+    # Gaps are whole numbers here, so ceil of gap / unit equals ceil of the exact gap / unit
+    new_schools = math.ceil(gaps["school_seats_gap"] / assumptions.school_unit_capacity)
+    new_kindergartens = math.ceil(
+        gaps["kindergarten_seats_gap"] / assumptions.kindergarten_unit_capacity
+    )
+    new_parking = math.ceil(
+        gaps["parking_spaces_gap"] / assumptions.parking_multilevel_capacity
+    )
+    return {
+        "assumptions": assumptions.model_dump(),
+        "baseline": {
+            "objects_total": baseline.objects_total,
+            "housing_units_total": baseline.housing_units_total,
+            "population_estimated": round(population)
+            if population is not None
+            else None,
+            "capacities": capacities.model_dump(),
+        },
+        "needs_15y": {
+            "required": required,
+            "gaps": gaps,
+            "projects_summary": [
+                _summary(
+                    "school", new_schools, "seats", assumptions.school_unit_capacity
+                ),
+                _summary(
+                    "kindergarten",
+                    new_kindergartens,
+                    "seats",
+                    assumptions.kindergarten_unit_capacity,
+                ),
+                # Clinic capacity is not normed; the model sizes it during site selection
+                _summary("clinic", new_clinics, "capacity_people_max", 0),
+                _summary(
+                    "parking_multilevel",
+                    new_parking,
+                    "spaces",
+                    assumptions.parking_multilevel_capacity,
+                ),
+                _summary("green_space", gaps["green_objects_gap"], "objects", 1),
+            ],
+        },
+        "questions": questions,
+    }
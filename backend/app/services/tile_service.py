@@ -0,0 +1,86 @@
+"""Mapbox Vector Tiles for objects and master plans, built in PostGIS (ST_AsMVT / ST_AsMVTGeom)."""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import (
+    ERROR_MESSAGE_TILE_OUT_OF_RANGE,
+    MAX_TILE_ZOOM,
+    MVT_BUFFER,
+    MVT_EXTENT,
+)
+
+# One tile = "object" layer || "master_plan" layer (MVT layers concatenate as protobuf).
+# Geometries are filtered in EPSG:4326 so the GIST indexes on geometry are used, then
+# projected to Web Mercator for ST_AsMVTGeom.
+_TILE_SQL = text(
+    """
+    WITH bounds AS (
+        SELECT
+            ST_TileEnvelope(:z, :x, :y) AS geom_3857,
+            ST_Transform(ST_TileEnvelope(:z, :x, :y), 4326) AS geom_4326
+    ),
+    object_features AS (
+        SELECT
+            ST_AsMVTGeom(
+                ST_Transform(o.geometry, 3857), bounds.geom_3857, :extent, :buffer, true
+            ) AS geom,
+            o.id,
+            o.name,
+            ot.code AS object_type_code,
+            ft.code AS function_type_code,
+            o.capacity_people_max,
+            o.student_capacity,
+            o.bed_count,
+            o.unit_count,
+            o.parking_spaces_total
+        FROM "object" o
+        CROSS JOIN bounds
+        JOIN object_type ot ON ot.id = o.object_type_id
+        LEFT JOIN function_type ft ON ft.id = o.function_type_id
+        WHERE o.geometry && bounds.geom_4326
+    ),
+    master_plan_features AS (
+        SELECT
+            ST_AsMVTGeom(
+                ST_Transform(mp.geometry, 3857), bounds.geom_3857, :extent, :buffer, true
+            ) AS geom,
+            mp.id,
+            mp.name
+        FROM master_plan mp
+        CROSS JOIN bounds
+        WHERE mp.geometry && bounds.geom_4326
+    )
+    SELECT
+        COALESCE(
+            (SELECT ST_AsMVT(f, 'object', :extent, 'geom') FROM object_features f
+             WHERE f.geom IS NOT NULL),
+            ''::bytea
+        )
+        || COALESCE(
+            (SELECT ST_AsMVT(f, 'master_plan', :extent, 'geom') FROM master_plan_features f
+             WHERE f.geom IS NOT NULL),
+            ''::bytea
+        )
+    """
+)
+
+
+def validate_tile_coordinates(z: int, x: int, y: int) -> None:
+    """Raise ValueError if z/x/y is not a valid XYZ tile address."""
+    if not 0 <= z <= MAX_TILE_ZOOM:
+        raise ValueError(ERROR_MESSAGE_TILE_OUT_OF_RANGE)
+    tiles_per_axis = 1 << z
+    if not (0 <= x < tiles_per_axis and 0 <= y < tiles_per_axis):
+        raise ValueError(ERROR_MESSAGE_TILE_OUT_OF_RANGE)
+
+
+async def get_tile(db: AsyncSession, z: int, x: int, y: int) -> bytes:
+    """Return the MVT tile (layers "object" and "master_plan") for z/x/y. Empty bytes if nothing intersects."""
+    validate_tile_coordinates(z, x, y)
+    result = await db.execute(
+        _TILE_SQL,
+        {"z": z, "x": x, "y": y, "extent": MVT_EXTENT, "buffer": MVT_BUFFER},
+    )
+    tile = result.scalar_one()
+    return bytes(tile) if tile is not None else b""
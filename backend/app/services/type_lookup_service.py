@@ -0,0 +1,110 @@
+"""In-process cache of the small object_type / function_type lookup tables.
+
+Loaded at startup (app lifespan). Services call ensure_fresh() before resolving
+type codes; it re-reads the data_version of both tables at most every
+LOOKUP_CACHE_TTL_SECONDS and reloads when either changed, so object queries
+need no relationship loads or joins for object_type_code / function_type_code.
+
+Contract: object_type_code() / function_type_code() are synchronous and only as current as
+the last ensure_fresh() (or load()). Every async service that returns objects calls
+ensure_fresh() before converting them; code that creates types calls load() once the
+transaction that bumped their data version has committed, so the creating process never
+serves stale (or uncommitted) codes.
+
+Responses cached by ETag must not be older than their ETag: conditional_get passes the
+versions it built the ETag from to sync_versions(), which reloads when they differ from the
+loaded ones regardless of the TTL.
+"""
+
+import asyncio
+import time
+from collections.abc import Mapping
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import LOOKUP_CACHE_TTL_SECONDS
+from app.models.function_type import FunctionType
+from app.models.object_type import ObjectType
+from app.services import data_version_service
+
+_TABLES = ("object_type", "function_type")
+
+
+class TypeLookupCache:
+    def __init__(self) -> None:
+        self.object_types: list[ObjectType] = []
+        self.function_types: list[FunctionType] = []
+        self._object_type_codes: dict[int, str] = {}
+        self._function_type_codes: dict[int, str] = {}
+        self._versions: dict[str, int] | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def load(self, db: AsyncSession) -> None:
+        """(Re)load both tables. Versions are read first so a concurrent change triggers another reload."""
+        versions, _ = await data_version_service.get_versions(db, _TABLES)
+        object_types = (
+            await db.execute(select(ObjectType).order_by(ObjectType.code))
+        ).scalars()
+        function_types = (
+            await db.execute(select(FunctionType).order_by(FunctionType.code))
+        ).scalars()
+        self.object_types = list(object_types.all())
+        self.function_types = list(function_types.all())
+        self._object_type_codes = {t.id: t.code for t in self.object_types}
+        self._function_type_codes = {t.id: t.code for t in self.function_types}
+        self._versions = versions
+        self._checked_at = time.monotonic()
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        if (
+            self._versions is not None
+            and time.monotonic() - self._checked_at < LOOKUP_CACHE_TTL_SECONDS
+        ):
+            return
+        async with self._lock:
+            if (
+                self._versions is not None
+                and time.monotonic() - self._checked_at < LOOKUP_CACHE_TTL_SECONDS
+            ):
+                return
+            versions, _ = await data_version_service.get_versions(db, _TABLES)
+            if versions != self._versions:
+                await self.load(db)
+            else:
+                self._checked_at = time.monotonic()
+
+    def _differs(self, versions: Mapping[str, int]) -> bool:
+        return self._versions is None or any(
+            self._versions.get(table) != versions[table]
+            for table in _TABLES
+            if table in versions
+        )
+
+    async def sync_versions(
+        self, db: AsyncSession, versions: Mapping[str, int]
+    ) -> None:
+        """Reload if versions just read from data_version (for any of the tables) differ from the loaded ones."""
+        if not any(table in versions for table in _TABLES) or not self._differs(
+            versions
+        ):
+            return
+        async with self._lock:
+            if self._differs(versions):
+                await self.load(db)
+
+    def object_type_code(self, object_type_id: int | None) -> str | None:
+        """Code for the id as of the last ensure_fresh(); the caller must have awaited it."""
+        if object_type_id is None:
+            return None
+        return self._object_type_codes.get(object_type_id)
+
+    def function_type_code(self, function_type_id: int | None) -> str | None:
+        """Code for the id as of the last ensure_fresh(); the caller must have awaited it."""
+        if function_type_id is None:
+            return None
+        return self._function_type_codes.get(function_type_id)
+
+
+type_lookups = TypeLookupCache()
@@ -1,6 +1,13 @@
-"""Utility modules: HTTP headers, prompt helpers."""
+"""Utility modules: HTTP headers and ETags, orjson responses, pagination cursors, prompt helpers."""
 
-from app.utils.http_headers import content_disposition_for_download
+from app.utils.http_headers import (
+    content_disposition_for_download,
+    etag_matches,
+    http_date,
+    make_etag,
+)
+from app.utils.json_response import FastJSONResponse, json_fragment
+from app.utils.pagination import decode_cursor, encode_cursor
 from app.utils.prompt_utils import (
     build_report_prompt,
     strip_json_from_completion,
@@ -8,8 +15,15 @@ from app.utils.prompt_utils import (
 )
 
 __all__ = [
+    "FastJSONResponse",
     "build_report_prompt",
     "content_disposition_for_download",
+    "decode_cursor",
+    "encode_cursor",
+    "etag_matches",
+    "http_date",
+    "json_fragment",
+    "make_etag",
     "strip_json_from_completion",
     "validate_report_top_level",
 ]
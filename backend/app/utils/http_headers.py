@@ -1,7 +1,33 @@
 """HTTP header utilities for responses."""
 
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
 
 def content_disposition_for_download(filename: str) -> str:
     """Build Content-Disposition header value for file download (safe filename, escape quotes)."""
     safe_filename = filename.replace("\\", "_").replace('"', "%22")
     return f'attachment; filename="{safe_filename}"'
+
+
+def make_etag(versions: dict[str, int], variant: str) -> str:
+    """Weak ETag from table data versions and the request variant (path, query, Accept)."""
+    key = ",".join(f"{name}={versions[name]}" for name in sorted(versions))
+    digest = hashlib.sha256(f"{key}|{variant}".encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match check with weak comparison (RFC 9110 13.1.2)."""
+    if if_none_match is None:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(
+        tag.removeprefix("W/") == etag.removeprefix("W/") for tag in tags
+    )
+
+
+def http_date(value: datetime) -> str:
+    """Format a datetime as an HTTP-date (Last-Modified)."""
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
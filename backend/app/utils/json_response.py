@@ -0,0 +1,27 @@
+"""orjson-backed JSON for large list responses.
+
+Endpoints that return thousands of rows build plain dicts in the ObjectResponse /
+MasterPlanResponse shape and return FastJSONResponse directly, so the rows are
+neither validated by Pydantic twice (service + response_model) nor re-encoded.
+GeoJSON already encoded by the database is embedded as an orjson.Fragment.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize like Pydantic's JSON mode: UTF-8, compact, UTC datetimes with a Z suffix."""
+    return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+def json_fragment(text: str | None) -> orjson.Fragment | None:
+    """Embed pre-encoded JSON (e.g. ST_AsGeoJSON output) without parsing it."""
+    return orjson.Fragment(text) if text is not None else None
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,24 @@
+"""Opaque keyset cursors for lists ordered by (updated_at DESC, id DESC)."""
+
+import base64
+import binascii
+from datetime import datetime
+
+from app.constants import ERROR_MESSAGE_INVALID_CURSOR
+
+
+def encode_cursor(updated_at: datetime, row_id: int) -> str:
+    """Encode the last row's (updated_at, id) as a URL-safe cursor string."""
+    raw = f"{updated_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor from encode_cursor. Raise ValueError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        updated_at_str, row_id_str = raw.rsplit("|", 1)
+        return (datetime.fromisoformat(updated_at_str), int(row_id_str))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError(ERROR_MESSAGE_INVALID_CURSOR)
@@ -18,11 +18,19 @@ def strip_json_from_completion(text: str) -> str:
     return text
 
 
-def build_report_prompt(master_plan_context_str: str, list_of_objects_str: str) -> str:
-    """Fill DEVELOPMENT_REPORT_PROMPT with master_plan_context and list_of_objects."""
-    return DEVELOPMENT_REPORT_PROMPT.replace(
-        "{master_plan_context}", master_plan_context_str
-    ).replace("{list_of_objects}", list_of_objects_str)
+def build_report_prompt(
+    master_plan_context_str: str,
+    list_of_objects_str: str,
+    precomputed_needs_str: str,
+) -> str:
+    """Fill DEVELOPMENT_REPORT_PROMPT with master_plan_context, list_of_objects and precomputed_needs."""
+    return (
+        DEVELOPMENT_REPORT_PROMPT.replace(
+            "{master_plan_context}", master_plan_context_str
+        )
+        .replace("{list_of_objects}", list_of_objects_str)
+        .replace("{precomputed_needs}", precomputed_needs_str)
+    )
 
 
 def validate_report_top_level(report: Any) -> None:
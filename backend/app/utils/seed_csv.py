@@ -0,0 +1,70 @@
+"""Value coercion and type naming for the seed object CSV layout.
+
+Shared by scripts/dump_seed_from_csv.py (CSV -> seed_data JSON) and the bulk import
+(POST /object/import), so a file reads the same way through either path.
+"""
+
+from typing import Any
+
+# Display names of the standard object types; other codes fall back to object_type_name()
+OBJECT_TYPE_NAMES: dict[str, str] = {
+    "building": "Building",
+    "facility": "Facility",
+    "poi": "POI",
+    "transport_node": "Transport node",
+    "utility_node": "Utility node",
+    "green_space": "Green space",
+}
+
+
+def normalize_header(name: str) -> str:
+    return name.strip().lower().replace(" ", "_")
+
+
+def parse_float(val: Any) -> float | None:
+    """Float from a cell; decimal commas allowed, blank or invalid -> None."""
+    if val is None or (isinstance(val, str) and not val.strip()):
+        return None
+    try:
+        return float(str(val).replace(",", ".").strip())
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_int(val: Any) -> int | None:
+    """Integer from a cell (fractions truncated); blank or invalid -> None."""
+    if val is None or (isinstance(val, str) and not val.strip()):
+        return None
+    try:
+        return int(float(str(val).replace(",", ".").strip()))
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def parse_str(val: Any) -> str | None:
+    """Stripped text; blank -> None."""
+    if val is None:
+        return None
+    s = str(val).strip()
+    return s or None
+
+
+def parse_bool_da_net(val: Any) -> bool | None:
+    """Да/Нет (or yes/no, true/false, 1/0) -> bool; anything else -> None."""
+    if val is None or (isinstance(val, str) and not val.strip()):
+        return None
+    s = str(val).strip().lower()
+    if s in ("да", "yes", "true", "1"):
+        return True
+    if s in ("нет", "no", "false", "0"):
+        return False
+    return None
+
+
+def object_type_name(code: str) -> str:
+    return OBJECT_TYPE_NAMES.get(code) or code.replace("_", " ").title()
+
+
+def function_type_name(code: str) -> str:
+    """Display name from a function_type code (e.g. residential_apartment -> Residential Apartment)."""
+    return code.replace("_", " ").title()
@@ -0,0 +1,110 @@
+"""Streaming responses: lists (NDJSON, GeoJSON FeatureCollection) read through a server-side cursor,
+and Server-Sent Events for incremental AI output."""
+
+from collections.abc import AsyncIterator, Callable
+from typing import Any, TypeVar
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import (
+    ERROR_MESSAGE_AI_CHAT_STREAM_FAILED,
+    GEOJSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    SSE_MEDIA_TYPE,
+)
+from app.core.database import async_session_maker
+from app.utils.json_response import dumps
+
+T = TypeVar("T")
+
+STREAMING_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {NDJSON_MEDIA_TYPE: {}, GEOJSON_MEDIA_TYPE: {}}}
+}
+"""OpenAPI extra responses for list endpoints that support streaming via Accept."""
+
+SSE_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {SSE_MEDIA_TYPE: {}}}
+}
+"""OpenAPI extra responses for Server-Sent Events endpoints."""
+
+
+def negotiate_stream_media_type(accept: str | None) -> str | None:
+    """Return NDJSON_MEDIA_TYPE or GEOJSON_MEDIA_TYPE if requested in Accept, else None (plain JSON list)."""
+    if not accept:
+        return None
+    requested = {part.split(";", 1)[0].strip().lower() for part in accept.split(",")}
+    if NDJSON_MEDIA_TYPE in requested:
+        return NDJSON_MEDIA_TYPE
+    if GEOJSON_MEDIA_TYPE in requested:
+        return GEOJSON_MEDIA_TYPE
+    return None
+
+
+async def _ndjson_chunks(items: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    async for item in items:
+        yield dumps(item) + b"\n"
+
+
+async def _feature_collection_chunks(
+    features: AsyncIterator[dict[str, Any]],
+) -> AsyncIterator[bytes]:
+    yield b'{"type":"FeatureCollection","features":['
+    separator = b""
+    async for feature in features:
+        yield separator + dumps(feature)
+        separator = b","
+    yield b"]}"
+
+
+def streaming_list_response(
+    media_type: str,
+    rows: Callable[[AsyncSession], AsyncIterator[T]],
+    to_item: Callable[[T], dict[str, Any]],
+    to_feature: Callable[[T], dict[str, Any]],
+) -> StreamingResponse:
+    """Stream rows as NDJSON (to_item per line) or a GeoJSON FeatureCollection (to_feature).
+
+    Rows are read in a dedicated session that lives as long as the response body,
+    independent of the request-scoped session.
+    """
+
+    async def items() -> AsyncIterator[dict[str, Any]]:
+        convert = to_feature if media_type == GEOJSON_MEDIA_TYPE else to_item
+        async with async_session_maker() as session:
+            async for row in rows(session):
+                yield convert(row)
+
+    if media_type == GEOJSON_MEDIA_TYPE:
+        body = _feature_collection_chunks(items())
+    else:
+        body = _ndjson_chunks(items())
+    return StreamingResponse(body, media_type=media_type)
+
+
+async def _sse_chunks(deltas: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    try:
+        async for delta in deltas:
+            yield b"data: " + dumps({"delta": delta}) + b"\n\n"
+    except Exception:
+        # Headers are already sent, so the failure is reported in-band
+        yield (
+            b"event: error\ndata: "
+            + dumps({"message": ERROR_MESSAGE_AI_CHAT_STREAM_FAILED})
+            + b"\n\n"
+        )
+        return
+    yield b"event: done\ndata: {}\n\n"
+
+
+def sse_response(deltas: AsyncIterator[str]) -> StreamingResponse:
+    """Relay text pieces as Server-Sent Events: one {"delta": ...} data event each, then "done".
+
+    A failure mid-stream ends with an "error" event instead of "done".
+    """
+    return StreamingResponse(
+        _sse_chunks(deltas),
+        media_type=SSE_MEDIA_TYPE,
+        # Disable proxy buffering (nginx) so every event is flushed immediately
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-row cost of object list serialization: Pydantic path vs orjson fast path.
+
+Before: object_to_response (model_validate) per row, then FastAPI's response_model
+handling (dump, validate list[ObjectResponse] again, encode to JSON).
+After: object_to_json_row per row and one orjson dump (FastJSONResponse.render).
+
+Runs on synthetic in-memory objects (no database). Also checks both paths produce byte-identical JSON.
+
+Usage (from backend directory):
+  python scripts/benchmark_serialization.py
+  python scripts/benchmark_serialization.py --rows 20000 --repeat 5
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import TypeAdapter
+
+from app.core.geography import geojson_to_wkb
+from app.models.object import Object
+from app.schemas.object import ObjectResponse
+from app.services import object_service
+from app.utils.json_response import dumps
+
+
+def _make_objects(count: int) -> list[Object]:
+    now = datetime.now(timezone.utc)
+    objects = []
+    for i in range(count):
+        longitude = 69.2 + (i % 1000) * 0.0001
+        latitude = 41.3 + (i // 1000) * 0.0001
+        obj = Object(
+            id=i + 1,
+            object_type_id=1 + i % 5,
+            function_type_id=1 + i % 12,
+            object_id=f"OBJ-{i:06d}",
+            parcel_id=f"P-{i:06d}",
+            name=f"Объект {i}",
+            administrative_region="Ташкент",
+            district="Юнусабадский район",
+            mahalla="Махалля",
+            address_full=f"ул. Амира Темура, {i}",
+            capacity_people_max=100 + i % 50,
+            unit_count=i % 80,
+            distance_public_transport_m=250,
+            distance_primary_road_m=120,
+            parking_spaces_total=20,
+            protected_zone=False,
+            heritage_zone=False,
+            flood_zone=False,
+            environmental_risk_score=0.25,
+            power_connected=True,
+            available_power_capacity_kw=150,
+            water_connected=True,
+            sewer_connected=True,
+            created_at=now,
+            updated_at=now,
+            geometry=geojson_to_wkb(
+                {"type": "Point", "coordinates": [longitude, latitude]}
+            ),
+        )
+        # As selected with object_service.WITH_GEOJSON (ST_AsGeoJSON output is compact)
+        obj.geometry_geojson = json.dumps(
+            {"type": "Point", "coordinates": [round(longitude, 7), round(latitude, 7)]},
+            separators=(",", ":"),
+        )
+        objects.append(obj)
+    return objects
+
+
+_ADAPTER = TypeAdapter(list[ObjectResponse])
+
+
+def _before(objects: list[Object]) -> bytes:
+    models = [object_service.object_to_response(obj) for obj in objects]
+    content = [m.model_dump() for m in models]  # FastAPI _prepare_response_content
+    validated = _ADAPTER.validate_python(content)  # response_model validation
+    return json.dumps(
+        _ADAPTER.dump_python(validated, mode="json"),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _after(objects: list[Object]) -> bytes:
+    return dumps([object_service.object_to_json_row(obj) for obj in objects])
+
+
+def _best_time(func, objects: list[Object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(objects)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    objects = _make_objects(args.rows)
+    same = _before(objects) == _after(objects)
+    before = _best_time(_before, objects, args.repeat)
+    after = _best_time(_after, objects, args.repeat)
+    print(f"rows: {args.rows}, best of {args.repeat}")
+    print(f"before (Pydantic x2 + json): {before * 1e6 / args.rows:8.2f} us/row")
+    print(f"after  (orjson fast path):   {after * 1e6 / args.rows:8.2f} us/row")
+    print(f"speedup: {before / after:.1f}x, identical bytes: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,9 +29,17 @@ import json
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def _normalize_header(name: str) -> str:
-    return name.strip().lower().replace(" ", "_")
+from app.utils.seed_csv import (
+    function_type_name,
+    normalize_header,
+    object_type_name,
+    parse_bool_da_net,
+    parse_float,
+    parse_int,
+    parse_str,
+)
 
 
 def _read_csv_rows(csv_path: Path):
@@ -40,7 +48,7 @@ def _read_csv_rows(csv_path: Path):
         reader = csv.reader(f)
         next(reader)  # Russian headers
         raw_headers = next(reader)
-        headers = [_normalize_header(h) for h in raw_headers]
+        headers = [normalize_header(h) for h in raw_headers]
         next(reader)  # description row
         for row in reader:
             if len(row) < len(headers):
@@ -50,47 +58,6 @@ def _read_csv_rows(csv_path: Path):
             yield dict(zip(headers, row))
 
 
-def _float(val: str, default: float | None = None) -> float | None:
-    if val is None or (isinstance(val, str) and not val.strip()):
-        return default
-    try:
-        return float(str(val).replace(",", ".").strip())
-    except (ValueError, TypeError):
-        return default
-
-
-def _int(val: str, default: int | None = None) -> int | None:
-    if val is None or (isinstance(val, str) and not val.strip()):
-        return default
-    try:
-        return int(float(str(val).replace(",", ".").strip()))
-    except (ValueError, TypeError):
-        return default
-
-
-def _str(val: str | None) -> str:
-    if val is None:
-        return ""
-    s = str(val).strip()
-    return s if s else ""
-
-
-def _bool_from_da_net(val: str | None) -> bool | None:
-    if val is None or (isinstance(val, str) and not val.strip()):
-        return None
-    s = str(val).strip().lower()
-    if s in ("да", "yes", "true", "1"):
-        return True
-    if s in ("нет", "no", "false", "0"):
-        return False
-    return None
-
-
-def _function_type_name_from_code(code: str) -> str:
-    """Derive display name from function_type code (e.g. residential_apartment -> Residential apartment)."""
-    return code.replace("_", " ").title()
-
-
 def build_seed_from_csv(csv_path: Path, out_dir: Path) -> bool:
     """Build 001_object_type.json, 002_function_type.json, and 003_object.json from CSV."""
     csv_path = csv_path.resolve()
@@ -104,42 +71,31 @@ def build_seed_from_csv(csv_path: Path, out_dir: Path) -> bool:
     function_types_list: list[dict] = []
     objects_list: list[dict] = []
 
-    type_name_map = {
-        "building": "Building",
-        "facility": "Facility",
-        "poi": "POI",
-        "transport_node": "Transport node",
-        "utility_node": "Utility node",
-        "green_space": "Green space",
-    }
-
     for row in _read_csv_rows(csv_path):
-        object_type_code = _str(row.get("object_type") or "").strip().lower()
+        object_type_code = (parse_str(row.get("object_type")) or "").lower()
         if not object_type_code:
             continue
         if object_type_code not in object_types_seen:
             object_types_seen.add(object_type_code)
-            name = (
-                type_name_map.get(object_type_code)
-                or object_type_code.replace("_", " ").title()
+            object_types_list.append(
+                {"code": object_type_code, "name": object_type_name(object_type_code)}
             )
-            object_types_list.append({"code": object_type_code, "name": name})
 
-        function_type_code = _str(row.get("function_type") or "").strip().lower()
+        function_type_code = (parse_str(row.get("function_type")) or "").lower()
         if function_type_code and function_type_code not in function_types_seen:
             function_types_seen.add(function_type_code)
             function_types_list.append(
                 {
                     "code": function_type_code,
-                    "name": _function_type_name_from_code(function_type_code),
+                    "name": function_type_name(function_type_code),
                 }
             )
 
-        lat = _float(row.get("latitude"))
-        lon = _float(row.get("longitude"))
+        lat = parse_float(row.get("latitude"))
+        lon = parse_float(row.get("longitude"))
         if lat is None or lon is None:
             continue
-        name = _str(row.get("name") or row.get("name_ru")) or "Object"
+        name = parse_str(row.get("name") or row.get("name_ru")) or "Object"
         geometry = {"type": "Point", "coordinates": [lon, lat]}
 
         rec: dict = {
@@ -147,28 +103,34 @@ def build_seed_from_csv(csv_path: Path, out_dir: Path) -> bool:
             "function_type_code": function_type_code if function_type_code else None,
             "geometry": geometry,
             "name": name,
-            "object_id": _str(row.get("object_id")) or None,
-            "parcel_id": _str(row.get("parcel_id")) or None,
-            "address_full": _str(row.get("address_full")) or None,
-            "administrative_region": _str(row.get("administrative_region")) or None,
-            "district": _str(row.get("district")) or None,
-            "mahalla": _str(row.get("mahalla")) or None,
-            "capacity_people_max": _int(row.get("capacity_people_max")),
-            "student_capacity": _int(row.get("student_capacity")),
-            "bed_count": _int(row.get("bed_count")),
-            "unit_count": _int(row.get("unit_count")),
-            "distance_public_transport_m": _int(row.get("distance_public_transport_m")),
-            "distance_primary_road_m": _int(row.get("distance_primary_road_m")),
-            "parking_spaces_total": _int(row.get("parking_spaces_total")),
-            "protected_zone": _bool_from_da_net(row.get("protected_zone")),
-            "heritage_zone": _bool_from_da_net(row.get("heritage_zone")),
-            "flood_zone": _bool_from_da_net(row.get("flood_zone")),
-            "environmental_risk_score": _float(row.get("environmental_risk_score")),
-            "power_connected": _bool_from_da_net(row.get("power_connected")),
-            "available_power_capacity_kw": _int(row.get("available_power_capacity_kw")),
-            "water_connected": _bool_from_da_net(row.get("water_connected")),
-            "sewer_connected": _bool_from_da_net(row.get("sewer_connected")),
-            "data_source_reference": _str(row.get("data_source_reference")) or None,
+            "object_id": parse_str(row.get("object_id")),
+            "parcel_id": parse_str(row.get("parcel_id")),
+            "address_full": parse_str(row.get("address_full")),
+            "administrative_region": parse_str(row.get("administrative_region")),
+            "district": parse_str(row.get("district")),
+            "mahalla": parse_str(row.get("mahalla")),
+            "capacity_people_max": parse_int(row.get("capacity_people_max")),
+            "student_capacity": parse_int(row.get("student_capacity")),
+            "bed_count": parse_int(row.get("bed_count")),
+            "unit_count": parse_int(row.get("unit_count")),
+            "distance_public_transport_m": parse_int(
+                row.get("distance_public_transport_m")
+            ),
+            "distance_primary_road_m": parse_int(row.get("distance_primary_road_m")),
+            "parking_spaces_total": parse_int(row.get("parking_spaces_total")),
+            "protected_zone": parse_bool_da_net(row.get("protected_zone")),
+            "heritage_zone": parse_bool_da_net(row.get("heritage_zone")),
+            "flood_zone": parse_bool_da_net(row.get("flood_zone")),
+            "environmental_risk_score": parse_float(
+                row.get("environmental_risk_score")
+            ),
+            "power_connected": parse_bool_da_net(row.get("power_connected")),
+            "available_power_capacity_kw": parse_int(
+                row.get("available_power_capacity_kw")
+            ),
+            "water_connected": parse_bool_da_net(row.get("water_connected")),
+            "sewer_connected": parse_bool_da_net(row.get("sewer_connected")),
+            "data_source_reference": parse_str(row.get("data_source_reference")),
         }
         objects_list.append({k: v for k, v in rec.items() if v is not None})
 
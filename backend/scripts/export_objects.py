@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Export the whole object table to GeoParquet or FlatGeobuf (same output as GET /object/export).
+
+Reads DATABASE_URL from .env like the app.
+
+Usage (from backend directory):
+  python scripts/export_objects.py objects.parquet
+  python scripts/export_objects.py objects.fgb
+  python scripts/export_objects.py out.bin --format fgb
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.database import async_session_maker
+from app.services import object_export_service
+
+
+async def _export(path: Path, format: object_export_service.ExportFormat) -> int:
+    async with async_session_maker() as session:
+        return await object_export_service.export_objects(session, format, path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Export objects to GeoParquet (.parquet) or FlatGeobuf (.fgb)."
+    )
+    parser.add_argument("output", type=Path, help="Output file path")
+    parser.add_argument(
+        "--format",
+        choices=list(object_export_service.EXPORT_SUFFIXES),
+        default=None,
+        help="Output format (default: from the output file extension)",
+    )
+    args = parser.parse_args()
+    format = args.format
+    if format is None:
+        format = next(
+            (
+                name
+                for name, suffix in object_export_service.EXPORT_SUFFIXES.items()
+                if args.output.suffix.lower() == suffix
+            ),
+            None,
+        )
+        if format is None:
+            parser.error("cannot infer format from extension; pass --format")
+
+    started = time.perf_counter()
+    rows = asyncio.run(_export(args.output, format))
+    print(
+        f"Exported {rows} objects to {args.output} in {time.perf_counter() - started:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Load test: CRUD latency while many AI requests are in flight.
+
+AI flows load their context in a short session, call the model with no database connection
+held and persist in a fresh transaction, so slow model calls must not starve the pool
+(DB_POOL_SIZE + DB_MAX_OVERFLOW). This measures GET /master_plan latency on an idle server,
+then again while --ai-requests concurrent POST /ai/chat calls are running, and prints both.
+Latency should stay flat even with more AI requests than pooled connections.
+
+Needs a running API with AI_API_KEY set (otherwise /ai/chat returns at once and nothing is
+measured) and at least one master plan.
+
+Usage (from backend directory, API on localhost:8000):
+  python scripts/load_test_ai_pool.py
+  python scripts/load_test_ai_pool.py --base-url http://localhost:8000 --ai-requests 60
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def _crud_latencies(client: httpx.AsyncClient, count: int) -> list[float]:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = await client.get("/master_plan")
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def _chat(client: httpx.AsyncClient, master_plan_id: int) -> None:
+    response = await client.post(
+        "/ai/chat",
+        json={
+            "messages": [{"role": "user", "content": "Summarize this master plan."}],
+            "master_plan_id": master_plan_id,
+        },
+    )
+    response.raise_for_status()
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(
+        f"{label:<28} p50 {statistics.median(ordered) * 1e3:8.1f} ms"
+        f"   p95 {p95 * 1e3:8.1f} ms   max {ordered[-1] * 1e3:8.1f} ms"
+    )
+
+
+async def _run(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.ai_requests + 10)
+    timeout = httpx.Timeout(args.timeout)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=timeout
+    ) as client:
+        plans = (await client.get("/master_plan")).raise_for_status().json()
+        if not plans:
+            raise SystemExit("No master plans; create one first.")
+        master_plan_id = plans[0]["id"]
+
+        idle = await _crud_latencies(client, args.crud_requests)
+
+        chats = [
+            asyncio.create_task(_chat(client, master_plan_id))
+            for _ in range(args.ai_requests)
+        ]
+        # Let the AI requests load their context and reach the model call
+        await asyncio.sleep(args.warmup)
+        busy = await _crud_latencies(client, args.crud_requests)
+        in_flight = sum(not task.done() for task in chats)
+        results = await asyncio.gather(*chats, return_exceptions=True)
+
+    failed = sum(isinstance(result, BaseException) for result in results)
+    print(f"AI requests: {args.ai_requests} ({failed} failed), in flight: {in_flight}")
+    _report("idle", idle)
+    _report("during AI requests", busy)
+    if in_flight == 0:
+        print("All AI requests finished before measuring; is AI_API_KEY set?")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--ai-requests", type=int, default=40)
+    parser.add_argument("--crud-requests", type=int, default=50)
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Claims jobs against the database at DATABASE_URL (migrated) inside a rolled-back transaction;
+skipped when it is unreachable."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models.ai_job import AiJob
+from app.models.master_plan import MasterPlan
+from app.services import ai_job_service
+from app.services.ai_job_service import (
+    JOB_KIND_REPORT,
+    PROGRESS_GENERATING,
+    PROGRESS_QUEUED,
+    STATUS_QUEUED,
+    STATUS_RUNNING,
+)
+
+
+async def _database_available() -> bool:
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1 FROM ai_job LIMIT 1"))
+    except (OSError, SQLAlchemyError):
+        return False
+    return True
+
+
+def _job(master_plan_id: int, **values) -> AiJob:
+    return AiJob(
+        kind=JOB_KIND_REPORT,
+        master_plan_id=master_plan_id,
+        params={"assumptions": {}, "force": False},
+        **{"status": STATUS_QUEUED, "progress": PROGRESS_QUEUED, **values},
+    )
+
+
+async def _claim_queued_and_stale_jobs(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_maker() as session:
+        plan = MasterPlan(name="ai_job_service test")
+        session.add(plan)
+        await session.flush()
+        queued = _job(plan.id)
+        # Left "running" by a worker that died longer ago than the job timeout
+        stale = _job(
+            plan.id,
+            status=STATUS_RUNNING,
+            progress=PROGRESS_GENERATING,
+            started_at=func.now()
+            - timedelta(seconds=settings.AI_JOB_TIMEOUT_SECONDS * 2),
+        )
+        fresh = _job(
+            plan.id,
+            status=STATUS_RUNNING,
+            progress=PROGRESS_GENERATING,
+            started_at=func.now(),
+        )
+        session.add_all([queued, stale, fresh])
+        await session.commit()
+
+    claimed = []
+    while (row := await ai_job_service._claim_job()) is not None:
+        claimed.append(row)
+    ours = [row for row in claimed if row[1] == plan.id]
+    assert [row[0] for row in ours] == [queued.id, stale.id]
+    assert ours[0][2] == {"assumptions": {}, "force": False}
+    async with session_maker() as session:
+        statuses = (
+            await session.execute(
+                select(AiJob.id, AiJob.status, AiJob.progress).where(
+                    AiJob.master_plan_id == plan.id
+                )
+            )
+        ).all()
+    assert {row.id: (row.status, row.progress) for row in statuses} == {
+        job.id: (STATUS_RUNNING, PROGRESS_GENERATING) for job in (queued, stale, fresh)
+    }
+
+
+def test_claim_job_takes_queued_then_stale_running_jobs(monkeypatch):
+    async def run() -> None:
+        try:
+            if not await _database_available():
+                pytest.skip("database at DATABASE_URL is not reachable")
+            # Everything, including jobs of other plans claimed by the loop, happens in one
+            # transaction that is rolled back; session commits only release savepoints
+            async with engine.connect() as connection:
+                transaction = await connection.begin()
+                session_maker = async_sessionmaker(
+                    connection,
+                    class_=AsyncSession,
+                    expire_on_commit=False,
+                    join_transaction_mode="create_savepoint",
+                )
+                monkeypatch.setattr(
+                    ai_job_service, "async_session_maker", session_maker
+                )
+                try:
+                    await _claim_queued_and_stale_jobs(session_maker)
+                finally:
+                    await transaction.rollback()
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
@@ -0,0 +1,37 @@
+import pytest
+
+from app.services.object_import_service import _record_batches, _row_to_record
+
+ROW = {"object_type": "School", "longitude": "69.2", "latitude": "41.3"}
+
+
+def test_row_to_record_accepts_values_within_column_limits():
+    record = _row_to_record(
+        {**ROW, "object_id": "x" * 64, "unit_count": str(2**31 - 1)}, 1
+    )
+    assert record is not None
+    assert record[0] == "school"
+
+
+def test_row_to_record_skips_rows_without_type_or_coordinates():
+    assert _row_to_record({**ROW, "latitude": ""}, 1) is None
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "column"),
+    [
+        ("object_id", "x" * 65, "object_id"),
+        ("object_type", "t" * 65, "object_type_code"),
+        ("unit_count", str(2**31), "unit_count"),
+        ("bed_count", str(-(2**31) - 1), "bed_count"),
+    ],
+)
+def test_row_to_record_rejects_values_exceeding_column_limits(field, value, column):
+    with pytest.raises(ValueError, match=f"row 7: {column} "):
+        _row_to_record({**ROW, field: value}, 7)
+
+
+def test_record_batches_number_rows_from_one():
+    rows = iter([ROW, {**ROW, "parcel_id": "p" * 65}])
+    with pytest.raises(ValueError, match="row 2: parcel_id"):
+        list(_record_batches(rows))
@@ -0,0 +1,95 @@
+import pytest
+
+from app.schemas.ai import ReportAssumptions
+from app.services.report_candidate_service import (
+    BUILD_NOW,
+    CONDITIONAL,
+    REJECT,
+    accessibility_distance,
+    assess_eligibility,
+    select_candidates,
+)
+
+DEFAULTS = ReportAssumptions()
+
+CONNECTED = {
+    "power_connected": True,
+    "water_connected": True,
+    "sewer_connected": True,
+    "available_power_capacity_kw": 100,
+}
+
+
+def _obj(id: int, transport: int | None = None, **fields) -> dict:
+    return {
+        "id": id,
+        "distance_public_transport_m": transport,
+        "distance_primary_road_m": transport,
+        **CONNECTED,
+        **fields,
+    }
+
+
+def _needs(**new_projects: int) -> dict:
+    return {
+        "needs_15y": {
+            "projects_summary": [
+                {"service_type": service_type, "new_projects": count}
+                for service_type, count in new_projects.items()
+            ]
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    ("fields", "capital", "eligibility", "interventions"),
+    [
+        ({}, True, BUILD_NOW, 0),
+        ({"flood_zone": True}, True, REJECT, 1),
+        # Zone restrictions only reject capital projects
+        ({"flood_zone": True}, False, BUILD_NOW, 0),
+        ({"sewer_connected": False}, True, CONDITIONAL, 1),
+        ({"available_power_capacity_kw": None}, True, CONDITIONAL, 1),
+        ({"environmental_risk_score": 0.6}, True, BUILD_NOW, 0),
+        ({"environmental_risk_score": 0.61}, True, CONDITIONAL, 1),
+    ],
+)
+def test_assess_eligibility(fields, capital, eligibility, interventions):
+    status, required = assess_eligibility(_obj(1, **fields), DEFAULTS, capital)
+    assert status == eligibility
+    assert len(required) == interventions
+
+
+def test_accessibility_distance_uses_known_distance_for_missing_one():
+    assert accessibility_distance({"distance_public_transport_m": 100}) == 200
+    assert accessibility_distance({}) == float("inf")
+
+
+def test_only_services_with_projects_get_candidates():
+    objects = [_obj(i, transport=i * 10) for i in range(1, 6)]
+    candidates = select_candidates(objects, _needs(school=1, clinic=0), DEFAULTS)
+    assert {c["id"] for c in candidates} == {1, 2, 3, 4, 5}
+    assert all(set(c["candidate_for"]) == {"school"} for c in candidates)
+
+
+def test_eligible_sites_rank_before_rejected_ones():
+    objects = [_obj(1, transport=10, flood_zone=True)] + [
+        _obj(i, transport=i * 10) for i in range(2, 5)
+    ]
+    candidates = select_candidates(objects, _needs(school=1), DEFAULTS, per_service=3)
+    assert [c["id"] for c in candidates] == [2, 3, 4]
+    assert [c["accessibility_rank"] for c in candidates] == [2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    ("new_projects", "expected"),
+    [
+        (1, 10),  # per_service floor
+        (5, 15),  # three per needed project
+        (400, 30),  # hard cap, e.g. a large green gap
+    ],
+)
+def test_candidates_per_service_are_capped(new_projects, expected):
+    objects = [_obj(i, transport=i) for i in range(1, 1001)]
+    candidates = select_candidates(objects, _needs(green_space=new_projects), DEFAULTS)
+    assert len(candidates) == expected
@@ -0,0 +1,146 @@
+import pytest
+
+from app.schemas.ai import ReportAssumptions
+from app.schemas.master_plan import MasterPlanBaseline, MasterPlanBaselineCapacities
+from app.services.report_needs_service import compute_needs, estimate_population
+
+DEFAULTS = ReportAssumptions()
+
+
+def _baseline(
+    housing_units: int = 0,
+    school_seats: int = 0,
+    kindergarten_seats: int = 0,
+    clinic_capacity: int = 0,
+    parking_spaces: int = 0,
+    green_objects: int = 0,
+) -> MasterPlanBaseline:
+    return MasterPlanBaseline(
+        objects_total=10,
+        housing_units_total=housing_units,
+        capacities=MasterPlanBaselineCapacities(
+            school_seats_total=school_seats,
+            kindergarten_seats_total=kindergarten_seats,
+            hospital_beds_total=0,
+            clinic_capacity_total=clinic_capacity,
+            parking_spaces_total=parking_spaces,
+            green_objects_total=green_objects,
+        ),
+    )
+
+
+def _projects(needs: dict) -> dict[str, int]:
+    return {
+        p["service_type"]: p["new_projects"]
+        for p in needs["needs_15y"]["projects_summary"]
+    }
+
+
+@pytest.mark.parametrize(
+    ("baseline", "population", "basis"),
+    [
+        # Housing wins over every capacity and is not rounded
+        (_baseline(housing_units=1001, school_seats=900), 1001 * 3.6, None),
+        # Schools: round(900 / 0.14)
+        (_baseline(school_seats=900, kindergarten_seats=240), 6429, "школам"),
+        # Kindergartens: round(240 / (0.07 * 0.6))
+        (_baseline(kindergarten_seats=240, clinic_capacity=100), 5714, "детсадам"),
+        # Clinics: clinic capacity * 2.5
+        (_baseline(clinic_capacity=1000), 2500, "мощности клиник"),
+        (_baseline(), None, None),
+    ],
+)
+def test_estimate_population_fallback_chain(baseline, population, basis):
+    assert estimate_population(baseline, DEFAULTS) == (population, basis)
+
+
+@pytest.mark.parametrize(
+    ("housing_units", "school_seats", "school_gap", "new_schools"),
+    [
+        # 2500 * 3.6 * 0.14 = 1260 required
+        (2500, 1260, 0, 0),
+        (2500, 1259, 1, 1),
+        (2500, 360, 900, 1),
+        (2500, 359, 901, 2),
+        (2500, 5000, 0, 0),
+        # 12405 * 3.6 * 0.14 = 6252.12 required: gap rounds up, 6252.12 / 900 -> 7 schools
+        (12405, 0, 6253, 7),
+    ],
+)
+def test_school_gap_and_ceil_boundaries(
+    housing_units, school_seats, school_gap, new_schools
+):
+    needs = compute_needs(
+        _baseline(housing_units=housing_units, school_seats=school_seats), DEFAULTS
+    )
+    assert needs["needs_15y"]["gaps"]["school_seats_gap"] == school_gap
+    assert _projects(needs)["school"] == new_schools
+
+
+def test_fractional_requirement_just_above_capacity_needs_a_project():
+    # 1800.8 people * 0.5 = 900.4 required seats against 900 existing (rounding first gave 0)
+    baseline = _baseline(housing_units=1, school_seats=900)
+    needs = compute_needs(
+        baseline, ReportAssumptions(avg_household_size=1800.8, school_age_share=0.5)
+    )
+    assert needs["needs_15y"]["required"]["school_seats"] == 901
+    assert needs["needs_15y"]["gaps"]["school_seats_gap"] == 1
+    assert _projects(needs)["school"] == 1
+
+
+@pytest.mark.parametrize(
+    ("housing_units", "clinic_capacity", "new_clinics"),
+    [
+        # 4166 * 3.6 = 14997.6 <= 15000
+        (4166, 0, 0),
+        # 4167 * 3.6 = 15001.2 > 15000
+        (4167, 0, 1),
+        (10000, 50, 0),
+    ],
+)
+def test_clinic_threshold(housing_units, clinic_capacity, new_clinics):
+    needs = compute_needs(
+        _baseline(housing_units=housing_units, clinic_capacity=clinic_capacity),
+        DEFAULTS,
+    )
+    assert _projects(needs)["clinic"] == new_clinics
+
+
+@pytest.mark.parametrize(
+    ("housing_units", "green_objects", "green_gap"),
+    [
+        # ceil(3333 * 3.6 / 12000) = ceil(0.99990) = 1
+        (3333, 0, 1),
+        # 3334 * 3.6 = 12002.4 -> 2 required
+        (3334, 1, 1),
+        (3334, 2, 0),
+    ],
+)
+def test_green_gap(housing_units, green_objects, green_gap):
+    needs = compute_needs(
+        _baseline(housing_units=housing_units, green_objects=green_objects), DEFAULTS
+    )
+    assert needs["needs_15y"]["gaps"]["green_objects_gap"] == green_gap
+    assert _projects(needs)["green_space"] == green_gap
+
+
+def test_parking_uses_population_when_there_is_no_housing():
+    # Population 6429 from schools -> 6429 / 3.6 = 1785.8 units * 0.35 = 625.04 spaces
+    needs = compute_needs(_baseline(school_seats=900), DEFAULTS)
+    assert needs["needs_15y"]["required"]["parking_spaces"] == 626
+    assert _projects(needs)["parking_multilevel"] == 3
+
+
+def test_unknown_population_asks_and_plans_nothing():
+    needs = compute_needs(_baseline(), DEFAULTS)
+    assert needs["baseline"]["population_estimated"] is None
+    assert needs["needs_15y"]["required"]["school_seats"] is None
+    assert all(n == 0 for n in _projects(needs).values())
+    assert len(needs["questions"]) == 1
+
+
+def test_float_noise_does_not_add_a_project():
+    # 2500 * 3.6 * 0.14 is 1260.0000000000002 in floating point
+    needs = compute_needs(_baseline(housing_units=2500, school_seats=1260), DEFAULTS)
+    assert needs["needs_15y"]["required"]["school_seats"] == 1260
+    assert _projects(needs)["school"] == 0
@@ -0,0 +1,48 @@
+import asyncio
+
+from app.services.type_lookup_service import TypeLookupCache
+
+
+class _CountingCache(TypeLookupCache):
+    """load() records the call and takes the versions as given, without a database."""
+
+    def __init__(self, versions: dict[str, int]) -> None:
+        super().__init__()
+        self._versions = dict(versions)
+        self.loads = 0
+
+    async def load(self, db) -> None:
+        self.loads += 1
+
+
+LOADED = {"object_type": 3, "function_type": 5}
+
+
+def _sync(cache: TypeLookupCache, versions: dict[str, int]) -> None:
+    asyncio.run(cache.sync_versions(None, versions))
+
+
+def test_sync_versions_skips_reload_when_versions_match():
+    cache = _CountingCache(LOADED)
+    _sync(cache, {"object": 9, **LOADED})
+    _sync(cache, {"object_type": 3})
+    assert cache.loads == 0
+
+
+def test_sync_versions_ignores_unrelated_tables():
+    cache = _CountingCache(LOADED)
+    _sync(cache, {"master_plan": 1})
+    assert cache.loads == 0
+
+
+def test_sync_versions_reloads_when_a_type_table_changed():
+    cache = _CountingCache(LOADED)
+    _sync(cache, {"object": 9, "object_type": 3, "function_type": 6})
+    assert cache.loads == 1
+
+
+def test_sync_versions_reloads_when_never_loaded():
+    cache = _CountingCache(LOADED)
+    cache._versions = None
+    _sync(cache, {"function_type": 0})
+    assert cache.loads == 1
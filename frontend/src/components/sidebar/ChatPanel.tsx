@@ -35,7 +35,7 @@ export function ChatPanel({
     name: getPlanObjectName(o),
     area: getPlanObjectArea(o),
   }));
-  const { messages, sendMessage, isTyping } = useAiChat(
+  const { messages, sendMessage, isTyping, isStreaming } = useAiChat(
     activeMasterPlan,
     contextList,
     activeProject?.id ?? null
@@ -51,7 +51,7 @@ export function ChatPanel({
 
   const handleSend = () => {
     const trimmed = inputValue.trim();
-    if (!trimmed || isTyping) return;
+    if (!trimmed || isStreaming) return;
     setInputValue("");
     sendMessage(trimmed);
   };
@@ -200,7 +200,7 @@ export function ChatPanel({
             type="button"
             size="icon"
             onClick={handleSend}
-            disabled={!inputValue.trim() || isTyping}
+            disabled={!inputValue.trim() || isStreaming}
             className="shrink-0 rounded-full bg-primary text-primary-foreground hover:opacity-90"
             aria-label={t("aiChat.send")}
           >
@@ -1,18 +1,63 @@
-import { useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { useTranslation } from "react-i18next";
 import {
   DocumentChartBarIcon,
   SparklesIcon,
 } from "@heroicons/react/24/outline";
 import { Button } from "@/components/ui/Button";
-import { API_PATHS, SIDEBAR_WIDTH_PX } from "@/constants";
-import { apiPost } from "@/lib/api";
+import {
+  AI_JOB_POLL_INTERVAL_MS,
+  AI_JOB_TIMEOUT_MS,
+  API_PATHS,
+  SIDEBAR_WIDTH_PX,
+} from "@/constants";
+import { apiFetch, apiPost } from "@/lib/api";
+import type { AiJob } from "@/types/api";
 import { MasterPlanSelect } from "@/components/sidebar/MasterPlanSelect";
 import { SidebarPlansSkeleton } from "@/components/sidebar/SidebarSkeletons";
 import { MasterPlanInfo } from "@/components/sidebar/MasterPlanInfo";
 import { ChatPanel } from "@/components/sidebar/ChatPanel";
 import { useMapData } from "@/contexts/MapDataContext";
 
+class AiJobTimeoutError extends Error {}
+
+/** Resolve after ms, or reject with the abort reason as soon as signal aborts. */
+function delay(ms: number, signal: AbortSignal): Promise<void> {
+  return new Promise((resolve, reject) => {
+    signal.throwIfAborted();
+    const timer = setTimeout(resolve, ms);
+    signal.addEventListener(
+      "abort",
+      () => {
+        clearTimeout(timer);
+        reject(signal.reason);
+      },
+      { once: true }
+    );
+  });
+}
+
+/**
+ * Poll a background AI job until it finishes; throws with the job error if it failed,
+ * AiJobTimeoutError after AI_JOB_TIMEOUT_MS, or the abort reason once signal aborts.
+ */
+async function waitForAiJob(job: AiJob, signal: AbortSignal): Promise<AiJob> {
+  const deadline = Date.now() + AI_JOB_TIMEOUT_MS;
+  let current = job;
+  while (current.status === "queued" || current.status === "running") {
+    if (Date.now() >= deadline) throw new AiJobTimeoutError();
+    await delay(AI_JOB_POLL_INTERVAL_MS, signal);
+    current = await apiFetch<AiJob>(API_PATHS.AI_JOB(current.id), {
+      method: "GET",
+      signal,
+    });
+  }
+  if (current.status === "failed") {
+    throw new Error(current.error ?? undefined);
+  }
+  return current;
+}
+
 export function Sidebar() {
   const { t } = useTranslation();
   const [sidebarView, setSidebarView] = useState<"default" | "ai">("default");
@@ -34,6 +79,9 @@ export function Sidebar() {
   } = useMapData();
   const [reportLoading, setReportLoading] = useState(false);
   const [reportError, setReportError] = useState<string | null>(null);
+  // Aborts report job polling when the sidebar unmounts
+  const reportAbortRef = useRef<AbortController | null>(null);
+  useEffect(() => () => reportAbortRef.current?.abort(), []);
 
   const activeMasterPlan =
     activeId !== null
@@ -103,19 +151,27 @@ export function Sidebar() {
           disabled={!activeMasterPlan || reportLoading}
           onClick={async () => {
             if (!activeMasterPlan) return;
+            const controller = new AbortController();
+            reportAbortRef.current = controller;
             setReportError(null);
             setReportLoading(true);
             try {
-              await apiPost<{ report: Record<string, unknown> }>(
+              const job = await apiPost<AiJob>(
                 API_PATHS.AI_REPORT(activeMasterPlan.id)
               );
+              await waitForAiJob(job, controller.signal);
               await refetchMasterPlans();
             } catch (e) {
+              if (controller.signal.aborted) return;
               setReportError(
-                e instanceof Error ? e.message : t("sidebar.reportError")
+                e instanceof AiJobTimeoutError
+                  ? t("sidebar.reportTimeout")
+                  : e instanceof Error && e.message
+                    ? e.message
+                    : t("sidebar.reportError")
               );
             } finally {
-              setReportLoading(false);
+              if (!controller.signal.aborted) setReportLoading(false);
             }
           }}
         >
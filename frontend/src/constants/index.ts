@@ -29,6 +29,12 @@ export const DATETIME_LOCAL_LENGTH = 16;
 /** Typing indicator dot animation delays (ms). */
 export const CHAT_TYPING_DELAYS_MS = [0, 150, 300] as const;
 
+/** Interval between report job status polls (ms). */
+export const AI_JOB_POLL_INTERVAL_MS = 2000;
+
+/** Stop polling a report job after this long (ms): backend AI_JOB_TIMEOUT_SECONDS (600) plus queue time. */
+export const AI_JOB_TIMEOUT_MS = 11 * 60 * 1000;
+
 /** Sidebar width in pixels. */
 export const SIDEBAR_WIDTH_PX = 380;
 
@@ -60,7 +66,9 @@ export const API_PATHS = {
   PROJECT: "/project",
   PROJECT_BY_ID: (id: number) => `/project/${id}`,
   AI_CHAT: "/ai/chat",
+  AI_CHAT_STREAM: "/ai/chat/stream",
   AI_REPORT: (masterPlanId: number) => `/ai/report/${masterPlanId}`,
+  AI_JOB: (jobId: number) => `/ai/jobs/${jobId}`,
 } as const;
 
 export { API_BASE_URL };
@@ -1,6 +1,6 @@
 import { useCallback, useState } from "react";
 import { API_PATHS } from "@/constants";
-import { apiPost } from "@/lib/api";
+import { apiPostEventStream } from "@/lib/api";
 import i18n from "@/lib/i18n";
 import type { MasterPlan } from "@/types/api";
 import type { ChatMessage, SelectedObjectContext } from "@/types/chat";
@@ -13,7 +13,10 @@ export function useAiChat(
   projectId: number | null = null
 ) {
   const [messages, setMessages] = useState<ChatMessage[]>([]);
+  /** Waiting for the first token (typing indicator). */
   const [isTyping, setIsTyping] = useState(false);
+  /** A reply is in progress, including while tokens are streaming in. */
+  const [isStreaming, setIsStreaming] = useState(false);
 
   const sendMessage = useCallback(
     async (content: string) => {
@@ -27,29 +30,47 @@ export function useAiChat(
       };
       setMessages((prev) => [...prev, userMsg]);
       setIsTyping(true);
+      setIsStreaming(true);
 
       try {
         const history = [...messages, userMsg].map((message) => ({
           role: message.role,
           content: message.content,
         }));
-        const response = await apiPost<{ message: string }>(API_PATHS.AI_CHAT, {
-          messages: history,
-          master_plan_id: activeMasterPlan?.id ?? null,
-          object_ids:
-            selectedObjects.length > 0
-              ? selectedObjects.map((o) => o.id)
-              : null,
-          project_id: projectId ?? null,
-          locale: i18n.language || undefined,
-        });
-
-        const aiMsg: ChatMessage = {
-          id: `ai-${Date.now()}`,
-          role: "ai",
-          content: response.message,
-        };
-        setMessages((prev) => [...prev, aiMsg]);
+        const aiId = `ai-${Date.now()}`;
+        let received = "";
+        await apiPostEventStream(
+          API_PATHS.AI_CHAT_STREAM,
+          {
+            messages: history,
+            master_plan_id: activeMasterPlan?.id ?? null,
+            object_ids:
+              selectedObjects.length > 0
+                ? selectedObjects.map((o) => o.id)
+                : null,
+            project_id: projectId ?? null,
+            locale: i18n.language || undefined,
+          },
+          (event, data) => {
+            if (event === "error") throw new Error(data);
+            if (event !== "message") return;
+            const isFirst = received === "";
+            received += (JSON.parse(data) as { delta: string }).delta;
+            const content = received;
+            if (isFirst) {
+              // First token: replace the typing indicator with the growing answer
+              setIsTyping(false);
+              setMessages((prev) => [
+                ...prev,
+                { id: aiId, role: "ai", content },
+              ]);
+            } else {
+              setMessages((prev) =>
+                prev.map((m) => (m.id === aiId ? { ...m, content } : m))
+              );
+            }
+          }
+        );
       } catch {
         const errorMsg: ChatMessage = {
           id: `ai-${Date.now()}`,
@@ -59,10 +80,11 @@ export function useAiChat(
         setMessages((prev) => [...prev, errorMsg]);
       } finally {
         setIsTyping(false);
+        setIsStreaming(false);
       }
     },
     [activeMasterPlan?.id, messages, selectedObjects, projectId]
   );
 
-  return { messages, sendMessage, isTyping };
+  return { messages, sendMessage, isTyping, isStreaming };
 }
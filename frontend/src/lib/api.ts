@@ -42,6 +42,52 @@ export async function apiPost<T>(path: string, body?: unknown): Promise<T> {
   });
 }
 
+/**
+ * POST a JSON body and read the text/event-stream response, calling onEvent(event, data)
+ * for each Server-Sent Event as it arrives (event defaults to "message").
+ */
+export async function apiPostEventStream(
+  path: string,
+  body: unknown,
+  onEvent: (event: string, data: string) => void
+): Promise<void> {
+  const url = path.startsWith("http") ? path : `${API_BASE_URL}${path}`;
+  const res = await fetch(url, {
+    method: "POST",
+    headers: {
+      ...getAuthHeader(),
+      "Content-Type": "application/json",
+      Accept: "text/event-stream",
+    },
+    body: JSON.stringify(body),
+  });
+  if (!res.ok || !res.body) {
+    const text = await res.text();
+    throw new Error(text || `HTTP ${res.status}`);
+  }
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let boundary = buffer.indexOf("\n\n");
+    while (boundary !== -1) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      let event = "message";
+      const data: string[] = [];
+      for (const line of block.split("\n")) {
+        if (line.startsWith("event:")) event = line.slice(6).trim();
+        else if (line.startsWith("data:")) data.push(line.slice(5).trimStart());
+      }
+      onEvent(event, data.join("\n"));
+      boundary = buffer.indexOf("\n\n");
+    }
+  }
+}
+
 export async function apiPatch<T>(path: string, body: unknown): Promise<T> {
   return apiFetch<T>(path, {
     method: "PATCH",
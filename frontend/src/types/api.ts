@@ -100,6 +100,20 @@ export interface Project {
   updated_at: string;
 }
 
+/** Background AI job (GET /ai/jobs/{id}); result holds the report once succeeded. */
+export interface AiJob {
+  id: number;
+  kind: string;
+  status: "queued" | "running" | "succeeded" | "failed";
+  progress: string;
+  master_plan_id: number;
+  result: Record<string, unknown> | null;
+  error: string | null;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+}
+
 export interface TokenResponse {
   access_token: string;
   token_type: string;